@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: BS -> AD date conversion.
+
+Compares per-call `nepali_datetime` conversion with the table-based,
+memoized batch conversion in scraper.bs_calendar.
+
+Usage:
+    python benchmarks/bench_bs_dates.py
+    python benchmarks/bench_bs_dates.py --count 500000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import nepali_datetime
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from scraper import bs_calendar  # noqa: E402
+
+
+def random_bs_dates(count: int, distinct: int, seed: int = 42) -> list:
+    """`count` BS date strings drawn from `distinct` random valid dates."""
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(distinct):
+        year = rng.randint(2060, 2090)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, bs_calendar.BS_MONTH_DAYS[year][month - 1])
+        pool.append(f"{year}-{month:02d}-{day:02d}")
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def convert_nepali_datetime(values: list) -> list:
+    out = []
+    for value in values:
+        year, month, day = (int(part) for part in value.split("-"))
+        out.append(nepali_datetime.date(year, month, day).to_datetime_date().isoformat())
+    return out
+
+
+def timed(fn, values):
+    started = time.perf_counter()
+    result = fn(values)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="BS -> AD conversion benchmark")
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'dataset':<28} {'method':<22} {'seconds':>9} {'dates/s':>12}")
+    for distinct in (args.count, 5_000, 500):
+        values = random_bs_dates(args.count, distinct)
+        label = f"{args.count} dates, {distinct} distinct"
+
+        expected, baseline = timed(convert_nepali_datetime, values)
+
+        bs_calendar.bs_to_ad.cache_clear()
+        cold, cold_seconds = timed(bs_calendar.bs_to_ad_many, values)
+        warm, warm_seconds = timed(bs_calendar.bs_to_ad_many, values)
+        assert cold == expected and warm == expected
+
+        for method, seconds in (
+            ("nepali_datetime", baseline),
+            ("table batch (cold)", cold_seconds),
+            ("table batch (warm)", warm_seconds),
+        ):
+            print(f"{label:<28} {method:<22} {seconds:>9.3f} {len(values) / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: artifact serialization formats.
+
+Encodes and decodes the real artifacts under data/output and
+scraper/bills/data with the baseline (stdlib pretty JSON) and the formats
+offered by scraper.codec, and reports time and file size.
+
+Usage:
+    python benchmarks/bench_codec.py
+    python benchmarks/bench_codec.py path/to/artifact.json ...
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+from scraper import codec  # noqa: E402
+
+
+def stdlib_pretty(obj):
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+
+
+def stdlib_compact(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def formats():
+    """(name, encode, decode) for every available format."""
+    yield "stdlib pretty", stdlib_pretty, json.loads
+    yield "stdlib compact", stdlib_compact, json.loads
+    if codec.orjson is not None:
+        yield "orjson compact", lambda obj: codec.dumps(obj, default=str), codec.loads
+    yield (
+        "compact + gzip",
+        lambda obj: codec.compress(codec.dumps(obj, default=str), "gzip"),
+        lambda data: codec.loads(gzip.decompress(data)),
+    )
+    if codec.zstandard is not None:
+        yield (
+            "compact + zstd",
+            lambda obj: codec.compress(codec.dumps(obj, default=str), "zstd"),
+            lambda data: codec.loads(codec.decompress(data, "zstd")),
+        )
+
+
+def best_of(fn, arg, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(arg)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def default_artifacts():
+    """Newest artifact of each kind."""
+    latest = {}
+    for directory in (BASE_DIR / "data" / "output", BASE_DIR / "scraper" / "bills" / "data"):
+        for path in sorted(codec.glob_artifacts(directory, "*")):
+            kind = path.name.split("_2")[0].split(".")[0]
+            latest[kind] = path
+    return list(latest.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Artifact codec benchmark")
+    parser.add_argument("paths", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    paths = args.paths or default_artifacts()
+    print(f"{'artifact':<36} {'format':<16} {'bytes':>9} {'encode ms':>10} {'decode ms':>10}")
+    for path in paths:
+        obj = codec.read(path)
+        for name, encode, decode in formats():
+            encode_seconds, data = best_of(encode, obj, args.repeat)
+            decode_seconds, decoded = best_of(decode, data, args.repeat)
+            assert decoded == json.loads(stdlib_compact(obj))
+            print(
+                f"{path.name:<36} {name:<16} {len(data):>9,} "
+                f"{encode_seconds * 1e3:>10.2f} {decode_seconds * 1e3:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: import time of the scraper package.
+
+Imports each target in fresh interpreters (`python -X importtime`) and
+reports the best wall time, the cumulative import time of the target and
+which heavy dependencies it pulled in. The "eager deps" row imports what
+main.py used to load at startup, for comparison.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10 scraper.pipeline
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+DEFAULT_TARGETS = [
+    "scraper",
+    "scraper.pipeline",
+    "scraper.bills.scrape_bills",
+    "scraper.committees.scrape_committees",
+]
+EAGER_DEPS = ["psycopg2", "apscheduler.schedulers.blocking", "dotenv", "httpx"]
+HEAVY_MODULES = ("httpx", "bs4", "lxml", "psycopg2", "apscheduler", "dotenv")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def import_once(statement: str) -> Tuple[float, Dict[str, int], List[str]]:
+    """(wall seconds, cumulative µs per top-level import, heavy modules loaded)."""
+    probe = f"{statement}; import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=str(BASE_DIR),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - started
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match and len(match.group(3)) == 1:  # top-level imports only
+            cumulative[match.group(4)] = int(match.group(2))
+    return wall, cumulative, [m for m in completed.stdout.strip().split(",") if m]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Package import-time benchmark")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [("python -c pass", "pass", [])]
+    rows += [(target, f"import {target}", [target]) for target in args.targets]
+    rows.append(("eager deps (old main.py)", f"import {', '.join(EAGER_DEPS)}", EAGER_DEPS))
+
+    print(f"{'target':<38} {'wall ms':>8} {'import ms':>10}  heavy modules")
+    for label, statement, modules in rows:
+        best_wall = float("inf")
+        best_import = float("inf")
+        heavy: List[str] = []
+        for _ in range(args.repeat):
+            wall, cumulative, heavy = import_once(statement)
+            best_wall = min(best_wall, wall)
+            best_import = min(best_import, sum(cumulative.get(module, 0) for module in modules) / 1000)
+        print(f"{label:<38} {best_wall * 1e3:>8.1f} {best_import:>10.1f}  {', '.join(heavy) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
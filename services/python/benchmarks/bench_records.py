@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: slotted records vs dicts.
+
+Builds synthetic bills with realistic repetition of categorical values
+(ministries, presenters, categories, status labels), decodes them from JSON
+once as dicts and once as records, and compares retained memory, copy cost
+and codec throughput.
+
+Usage:
+    python benchmarks/bench_records.py
+    python benchmarks/bench_records.py --count 50000
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from scraper.records import RawBill, from_dicts, to_dicts  # noqa: E402
+
+
+MINISTRIES = [f"मन्त्रालय {i}" for i in range(25)]
+PRESENTERS = [f"माननीय सदस्य {i}" for i in range(300)]
+CATEGORIES = ["मूल", "संशोधन", "विनियोजन", "अध्यादेश प्रतिस्थापन"]
+STATUS_LABELS = [
+    "Distribution to member",
+    "General discussion",
+    "Sent to committee",
+    "Report submitted",
+    "Passed by house",
+    "Authenticated",
+]
+
+
+def synthetic_bills(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    bills = []
+    for i in range(count):
+        house = rng.choice(["HoR", "NA"])
+        steps = rng.randint(1, len(STATUS_LABELS))
+        timeline = [
+            {"label": STATUS_LABELS[s], "date": f"20{rng.randint(75, 82)}-{rng.randint(1, 12):02d}-{rng.randint(1, 29):02d}"}
+            for s in range(steps)
+        ]
+        bills.append({
+            "bill_id": f"b{i}",
+            "type": house,
+            "titleNp": f"विधेयक {i}",
+            "titleEn": f"Bill {i}",
+            "registration_number": str(i % 400),
+            "year": timeline[0]["date"],
+            "sambat": f"20{rng.randint(75, 82)}",
+            "presenter": rng.choice(PRESENTERS),
+            "ministry": rng.choice(MINISTRIES),
+            "session": str(rng.randint(1, 15)),
+            "government_type": rng.choice(["सरकारी", "गैर-सरकारी"]),
+            "bill_type": rng.choice(["मूल", "संशोधन"]),
+            "category": rng.choice(CATEGORIES),
+            "resource_link": f"https://hr.parliament.gov.np/uploads/bill_{i}.pdf",
+            "presenterEn": f"Hon. Member {rng.randint(0, 299)}",
+            "ministryEn": f"Ministry {rng.randint(0, 24)}",
+            "government_type_en": rng.choice(["Governmental", "Non Governmental"]),
+            "bill_type_en": rng.choice(["Original", "Amendment"]),
+            "category_en": rng.choice(["Original", "Amendment", "Appropriation"]),
+            "current_status": timeline[-1]["label"],
+            "current_status_date": timeline[-1]["date"],
+            "status_timeline": timeline,
+            "scraped_at": "2025-01-01T00:00:00",
+        })
+    return bills
+
+
+def retained_bytes(build) -> tuple:
+    """Bytes still allocated after `build()` returns, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def copy_dict(bill: dict) -> dict:
+    """The dict-based copy the cleaner used to make of each bill."""
+    copied = dict(bill)
+    copied["status_timeline"] = [dict(entry) for entry in bill["status_timeline"]]
+    return copied
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Slotted record vs dict benchmark")
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    encoded = json.dumps(synthetic_bills(args.count), ensure_ascii=False)
+
+    dict_bytes, as_dicts = retained_bytes(lambda: json.loads(encoded))
+    record_bytes, as_records = retained_bytes(lambda: from_dicts(RawBill, json.loads(encoded)))
+    assert to_dicts(as_records) == as_dicts
+
+    n = len(as_dicts)
+    print(f"{n} bills")
+    print(f"{'':<24} {'dict':>12} {'record':>12} {'ratio':>7}")
+    print(f"{'retained bytes/bill':<24} {dict_bytes / n:>12,.0f} {record_bytes / n:>12,.0f} {record_bytes / dict_bytes:>7.2f}")
+
+    rows = [
+        ("copy us/bill", lambda: [copy_dict(b) for b in as_dicts], lambda: [b.copy() for b in as_records]),
+        ("decode us/bill", lambda: json.loads(encoded), lambda: from_dicts(RawBill, json.loads(encoded))),
+        (
+            "encode us/bill",
+            lambda: json.dumps(as_dicts, ensure_ascii=False),
+            lambda: json.dumps(to_dicts(as_records), ensure_ascii=False),
+        ),
+    ]
+    for label, dict_fn, record_fn in rows:
+        dict_us = timed(dict_fn) / n * 1e6
+        record_us = timed(record_fn) / n * 1e6
+        print(f"{label:<24} {dict_us:>12.2f} {record_us:>12.2f} {record_us / dict_us:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bills search index (scraper.search).
+
+Builds an index over synthetic bills with Nepali and English titles,
+presenters and ministries, applies an incremental update (a share of the
+bills changed, some removed, some added) and times a mix of queries: common
+and rare words, multi-word, prefixes, substrings, field-restricted and
+queries with zero-width characters or Devanagari digits.
+
+Usage:
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --bills 20000 --queries 2000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from scraper import codec
+from scraper.search import SearchIndex
+
+NP_WORDS = [
+    "भन्सार", "महसुल", "आयकर", "मूल्य", "अभिवृद्धि", "कर", "शिक्षा", "स्वास्थ्य", "सेवा", "बीमा",
+    "सहकारी", "बैंक", "वित्तीय", "संस्था", "निजामती", "प्रहरी", "सेना", "नागरिकता", "अध्यागमन",
+    "वन", "वातावरण", "संरक्षण", "ऊर्जा", "विद्युत", "जलस्रोत", "सडक", "यातायात", "व्यवस्थापन",
+    "सञ्चार", "प्रसारण", "दूरसञ्चार", "कृषि", "पशु", "खाद्य", "सुरक्षा", "श्रम", "रोजगार",
+    "सामाजिक", "न्याय", "अदालत", "मुलुकी", "फौजदारी", "देवानी", "संहिता", "प्रदेश", "स्थानीय",
+    "तह", "सञ्चालन", "पर्यटन", "उद्योग", "वाणिज्य", "आपूर्ति", "विनियोजन", "आर्थिक",
+]
+EN_WORDS = [
+    "customs", "duty", "income", "tax", "value", "added", "education", "health", "service",
+    "insurance", "cooperative", "bank", "financial", "institution", "civil", "police", "army",
+    "citizenship", "immigration", "forest", "environment", "protection", "energy", "electricity",
+    "water", "resources", "road", "transport", "management", "communication", "broadcasting",
+    "telecommunication", "agriculture", "livestock", "food", "security", "labour", "employment",
+    "social", "justice", "court", "muluki", "criminal", "civil", "code", "province", "local",
+    "level", "operation", "tourism", "industry", "commerce", "supply", "appropriation", "economic",
+]
+AMENDMENTS_NP = ["", "", "", "(पहिलो संशोधन)", "(दोस्रो संशोधन)", "केही नेपाल ऐनलाई संशोधन गर्न बनेको"]
+AMENDMENTS_EN = ["", "", "", "(First Amendment)", "(Second Amendment)", "to Amend Some Nepal Acts:"]
+SURNAMES = ["अधिकारी", "शर्मा", "पौडेल", "श्रेष्ठ", "थापा", "गुरुङ", "यादव", "खड्का", "भट्टराई", "राई"]
+SURNAMES_EN = ["Adhikari", "Sharma", "Paudel", "Shrestha", "Thapa", "Gurung", "Yadav", "Khadka", "Bhattarai", "Rai"]
+GIVEN = ["राम", "हरि", "सीता", "गीता", "कृष्ण", "विष्णु", "लक्ष्मी", "प्रकाश", "दीपक", "सुनिता"]
+GIVEN_EN = ["Ram", "Hari", "Sita", "Gita", "Krishna", "Bishnu", "Laxmi", "Prakash", "Deepak", "Sunita"]
+MINISTRIES = [
+    ("अर्थ मन्त्रालय", "Ministry of Finance"),
+    ("गृह मन्त्रालय", "Ministry of Home Affairs"),
+    ("शिक्षा, विज्ञान तथा प्रविधि मन्त्रालय", "Ministry of Education, Science and Technology"),
+    ("स्वास्थ्य तथा जनसङ्ख्या मन्त्रालय", "Ministry of Health and Population"),
+    ("कानून, न्याय तथा संसदीय मामिला मन्त्रालय", "Ministry of Law, Justice and Parliamentary Affairs"),
+    ("ऊर्जा, जलस्रोत तथा सिंचाइ मन्त्रालय", "Ministry of Energy, Water Resources and Irrigation"),
+]
+NP_DIGITS = str.maketrans("0123456789", "०१२३४५६७८९")
+
+
+def make_bill(rng: random.Random, bill_id: int) -> Dict[str, Any]:
+    count = rng.randint(2, 5)
+    picks = rng.sample(range(len(NP_WORDS)), count)
+    year = rng.randint(2063, 2082)
+    amendment = rng.randrange(len(AMENDMENTS_NP))
+    person = rng.randrange(len(GIVEN)), rng.randrange(len(SURNAMES))
+    ministry = rng.choice(MINISTRIES)
+    return {
+        "bill_id": bill_id,
+        "type": rng.choice(["HoR", "NA"]),
+        "titleNp": " ".join([NP_WORDS[i] for i in picks] + [AMENDMENTS_NP[amendment], f"विधेयक, {year}".translate(NP_DIGITS)]),
+        "titleEn": " ".join([EN_WORDS[i].title() for i in picks] + [AMENDMENTS_EN[amendment], f"Bill, {year - 57}"]),
+        "presenter": f"मा. {GIVEN[person[0]]} {SURNAMES[person[1]]}",
+        "presenter_en": f"Hon. {GIVEN_EN[person[0]]} {SURNAMES_EN[person[1]]}",
+        "ministry": ministry[0],
+        "ministry_en": ministry[1],
+    }
+
+
+def make_queries(rng: random.Random, count: int) -> List[tuple]:
+    kinds = [
+        ("common word", lambda: ("विधेयक", None)),
+        ("rare word", lambda: (rng.choice(NP_WORDS), None)),
+        ("two words", lambda: (" ".join(rng.sample(NP_WORDS, 2)), None)),
+        ("english words", lambda: (" ".join(rng.sample(EN_WORDS, 2)), None)),
+        ("prefix", lambda: (rng.choice(EN_WORDS)[:4], None)),
+        ("substring", lambda: (rng.choice(NP_WORDS)[1:5], None)),
+        ("zero-width", lambda: (rng.choice(NP_WORDS) + "\u200b", None)),
+        ("devanagari year", lambda: (f"विधेयक {rng.randint(2063, 2082)}".translate(NP_DIGITS), None)),
+        ("presenter", lambda: (rng.choice(SURNAMES_EN), ["presenter"])),
+        ("ministry", lambda: ("finance", ["ministry"])),
+        ("no match", lambda: ("zzzqqq", None)),
+    ]
+    return [(name, *make()) for _ in range(count // len(kinds) + 1) for name, make in kinds][:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Search index benchmark")
+    parser.add_argument("--bills", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--changed", type=float, default=0.01, help="Share of bills changed by the update")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bills = [make_bill(rng, bill_id) for bill_id in range(args.bills)]
+
+    index = SearchIndex()
+    started = time.perf_counter()
+    index.update(bills)
+    build = time.perf_counter() - started
+    print(
+        f"build: {args.bills} bills in {build:.2f}s ({args.bills / build:,.0f} bills/s); "
+        f"{len(index.postings)} terms, {len(index.prefixes)} prefixes, {len(index.trigrams)} trigrams"
+    )
+
+    started = time.perf_counter()
+    encoded = codec.dumps(index.to_dict())
+    dumped = time.perf_counter() - started
+    started = time.perf_counter()
+    SearchIndex.from_dict(codec.loads(encoded))
+    print(f"serialize: {len(encoded) / 1e6:.1f} MB in {dumped:.2f}s, load {time.perf_counter() - started:.2f}s")
+
+    changed = int(args.bills * args.changed)
+    updated = bills[changed:] + [make_bill(rng, args.bills + i) for i in range(changed // 2)]
+    for bill in rng.sample(updated, changed):
+        bill["titleEn"] += " (Revised)"
+    started = time.perf_counter()
+    stats = index.update(updated)
+    print(f"incremental update: {stats} in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    latencies: Dict[str, List[float]] = {}
+    hits: Dict[str, int] = {}
+    for name, query, fields in make_queries(rng, args.queries):
+        started = time.perf_counter()
+        results = index.search(query, fields, args.limit)
+        latencies.setdefault(name, []).append((time.perf_counter() - started) * 1e6)
+        hits[name] = hits.get(name, 0) + len(results)
+
+    print(f"\n{'query':<16} {'n':>5} {'hits/q':>7} {'p50 µs':>8} {'p99 µs':>8} {'max µs':>8}")
+    everything: List[float] = []
+    for name, values in latencies.items():
+        values.sort()
+        everything += values
+        print(
+            f"{name:<16} {len(values):>5} {hits[name] / len(values):>7.1f} {statistics.median(values):>8.1f} "
+            f"{values[int(len(values) * 0.99) - 1]:>8.1f} {values[-1]:>8.1f}"
+        )
+    everything.sort()
+    print(
+        f"{'all':<16} {len(everything):>5} {'':>7} {statistics.median(everything):>8.1f} "
+        f"{everything[int(len(everything) * 0.99) - 1]:>8.1f} {everything[-1]:>8.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
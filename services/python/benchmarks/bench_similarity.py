@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: duplicate and amendment detection over bill titles
+(scraper.similarity).
+
+Generates synthetic bills with Nepali and English titles of 2-5 words from
+a large vocabulary, then plants related bills: duplicates (the same year,
+sometimes a misspelled word), re-registrations (another year, of a bill
+whose title has a status remark like "(मिति ... मा फिर्ता)") and numbered
+amendments. Reports the time of each phase, candidate
+pairs per title, and the share of planted relations that were found.
+
+Usage:
+    python benchmarks/bench_similarity.py
+    python benchmarks/bench_similarity.py --bills 200000 --related 0.1
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Set, Tuple
+
+from scraper import similarity
+
+NP_SYLLABLES = [
+    "क", "ख", "ग", "न", "प", "ब", "म", "र", "ल", "स", "ह", "त", "द", "ज", "य", "व",
+    "का", "की", "कु", "ना", "नि", "पा", "पु", "बा", "मा", "मि", "रा", "री", "ला", "सा", "सु", "हा",
+    "ता", "ति", "दा", "दे", "जा", "जि", "या", "वा", "वि", "क्ष", "त्र", "ज्ञ", "न्त", "स्व", "प्र", "ष्ट",
+]
+EN_SYLLABLES = [
+    "ka", "kha", "ga", "na", "pa", "ba", "ma", "ra", "la", "sa", "ha", "ta", "da", "ja", "ya", "va",
+    "ki", "ku", "ni", "pu", "mi", "ri", "su", "ti", "de", "ji", "vi", "ksha", "tra", "gya", "nta", "pra",
+]
+ORDINALS_NP = ["पहिलो", "दोस्रो", "तेस्रो"]
+ORDINALS_EN = ["First", "Second", "Third"]
+NP_DIGITS = str.maketrans("0123456789", "०१२३४५६७८९")
+
+
+def make_vocabulary(rng: random.Random, size: int) -> List[Tuple[str, str]]:
+    words: Set[Tuple[str, str]] = set()
+    while len(words) < size:
+        length = rng.randint(2, 4)
+        picks = [rng.randrange(len(EN_SYLLABLES)) for _ in range(length)]
+        words.add(("".join(NP_SYLLABLES[i] for i in picks), "".join(EN_SYLLABLES[i] for i in picks)))
+    return sorted(words)
+
+
+def make_title(words: List[Tuple[str, str]], year: int, ordinal: int = 0, remark: bool = False) -> Dict[str, str]:
+    np_words = [np for np, _ in words]
+    en_words = [en.title() for _, en in words]
+    if ordinal:
+        np_words.append(f"({ORDINALS_NP[ordinal - 1]} संशोधन)")
+        en_words.append(f"({ORDINALS_EN[ordinal - 1]} Amendment)")
+    title_np = " ".join(np_words) + f" विधेयक, {year}".translate(NP_DIGITS)
+    if remark:
+        title_np += f" (मिति {year + 2}/05/31 मा फिर्ता)".translate(NP_DIGITS)
+    return {"titleNp": title_np, "titleEn": " ".join(en_words) + f" Bill, {year - 57}"}
+
+
+def make_bills(args: argparse.Namespace) -> Tuple[List[Dict[str, Any]], List[Tuple[str, int, int]]]:
+    rng = random.Random(args.seed)
+    vocabulary = make_vocabulary(rng, args.vocabulary)
+    bills: List[Dict[str, Any]] = []
+    planted: List[Tuple[str, int, int]] = []
+
+    def add(title: Dict[str, str]) -> int:
+        bills.append({"type": rng.choice(["HoR", "NA"]), "bill_id": len(bills), **title})
+        return len(bills) - 1
+
+    related = int(args.bills * args.related)
+    while len(bills) < args.bills - related:
+        words = rng.sample(vocabulary, rng.randint(2, 5))
+        year = rng.randint(2063, 2082)
+        kind = None
+        if len(planted) * 2 < related and rng.random() <= args.related * 2:
+            kind = rng.choice(["duplicate", "re_registered", "amends", "amends"])
+        original = add(make_title(words, year, remark=kind == "re_registered"))
+        if kind is None:
+            continue
+        if kind != "amends":
+            copy = list(words)
+            if len(copy) > 3 and rng.random() < 0.5:  # one misspelled word
+                np, en = copy[-1]
+                copy[-1] = (np[:-1] + "ि", en[:-1] + "i")
+            other_year = year if kind == "duplicate" else year + rng.randint(1, 6)
+            planted.append((kind, add(make_title(copy, other_year)), original))
+        else:
+            planted.append(("amends", add(make_title(words, year + rng.randint(1, 8), ordinal=rng.randint(1, 3))), original))
+    return bills, planted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Title similarity benchmark")
+    parser.add_argument("--bills", type=int, default=100_000)
+    parser.add_argument("--vocabulary", type=int, default=20_000, help="Distinct words in titles")
+    parser.add_argument("--related", type=float, default=0.05, help="Share of bills planted as duplicates or amendments")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    bills, planted = make_bills(args)
+    started = time.perf_counter()
+    result = similarity.find_relations(bills)
+    duration = time.perf_counter() - started
+    print(
+        f"{result['titles']} titles in {duration:.2f}s ({result['titles'] / duration:,.0f} titles/s); "
+        f"{result['candidates']} candidate pairs ({result['candidates'] / result['titles']:.2f} per title), "
+        f"{result['skipped_buckets']} buckets skipped"
+    )
+    print(f"found: {result['duplicate']} duplicates, {result['re_registered']} re-registered, {result['amends']} amends")
+
+    found = {(r["relation"], r["from"], r["to"]) for r in result["relations"]}
+    found |= {("duplicate", r["to"], r["from"]) for r in result["relations"] if r["relation"] == "duplicate"}
+    keys = [similarity.bill_key(bill) for bill in bills]
+    for relation in similarity.RELATIONS:
+        expected = [(kind, keys[a], keys[b]) for kind, a, b in planted if kind == relation]
+        hits = sum(1 for item in expected if item in found)
+        print(f"recall {relation:<13} {hits}/{len(expected)} ({hits / max(1, len(expected)):.1%})")
+
+    # Scaling: a linear method takes about twice as long for twice the titles
+    for count in (args.bills // 4, args.bills // 2):
+        started = time.perf_counter()
+        similarity.shingles.cache_clear()
+        similarity.find_relations(bills[:count])
+        print(f"{count:>8} titles: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Scrapers and pipeline for the Nepal Federal Parliament sites.
+
+The package API is resolved lazily, so `import scraper` is cheap and only
+the parts a caller uses pull in httpx, BeautifulSoup, psycopg2 or
+APScheduler:
+
+    import asyncio
+    import scraper
+
+    scraper.load_env()
+    bills = asyncio.run(scraper.scrape_bills())
+    scraper.clean_bills()
+    results = asyncio.run(scraper.run_pipeline(sources=["committees"]))
+"""
+
+import importlib
+from typing import Any, List
+
+
+# Public name -> (module, attribute)
+_API = {
+    "scrape_bills": ("scraper.bills.scrape_bills", "scrape_all"),
+    "scrape_committees": ("scraper.committees.scrape_committees", "scrape_all_committees"),
+    "clean_bills": ("scraper.bills.clean_and_insert_bills", "main"),
+    "clean_committees": ("scraper.committees.clean_and_insert", "main"),
+    "run_pipeline": ("scraper.pipeline", "run_pipeline"),
+    "run_all": ("scraper.pipeline", "run_all"),
+    "configure_logging": ("scraper.logs", "configure_logging"),
+}
+
+__all__ = sorted([*_API, "load_env"])
+
+
+def load_env() -> bool:
+    """Load the nearest .env into os.environ; call before importing configured modules."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False
+    return load_dotenv()
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _API[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_API))
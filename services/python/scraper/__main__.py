@@ -0,0 +1,17 @@
+"""`python -m scraper`: the pipeline CLI (same as `python main.py`)."""
+
+import scraper
+
+
+def main() -> None:
+    # Before the logging and pipeline imports: their configuration is read from the environment
+    scraper.load_env()
+    from scraper.logs import configure_logging
+    from scraper.pipeline import main as pipeline_main
+
+    configure_logging()
+    pipeline_main()
+
+
+if __name__ == "__main__":
+    main()
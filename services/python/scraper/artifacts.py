@@ -0,0 +1,447 @@
+"""
+Artifact store for scraper outputs.
+
+Every file the pipeline produces in data/output (raw scrapes, cleaned
+files, run reports, traces) is recorded in an append-only manifest
+(`manifest.jsonl`) with its kind, run ID, size and SHA-256. The manifest is
+replayed into an in-memory index, so "latest artifact of a kind" is a dict
+lookup instead of a directory scan, and retention is applied per kind by
+count, age and total bytes. Older artifacts that are kept are compressed.
+
+bills_cleaned.json and committees_cleaned.json keep fixed names because
+the Bun importers read them; registering a new one supersedes the old entry.
+
+Retention per kind can be overridden with SCRAPER_RETENTION_<KIND>, e.g.
+SCRAPER_RETENTION_RUN_REPORT="keep=500,days=90,mb=50,compress_after=1".
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+from scraper import codec
+
+
+log = logging.getLogger(__name__)
+
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "data" / "output"
+MANIFEST_NAME = "manifest.jsonl"
+
+# Artifact kinds and the file name prefix of each
+KIND_PREFIXES = {
+    "bills_raw": "bills",
+    "committees_raw": "committees",
+    "run_report": "run_report",
+    "trace": "trace",
+    "bills_search": "bills_search",
+    "bills_relations": "bills_relations",
+}
+
+# Kinds with a fixed file name (read by the Bun importers)
+PINNED_NAMES = {
+    "bills_cleaned": "bills_cleaned.json",
+    "committees_cleaned": "committees_cleaned.json",
+}
+
+KINDS = tuple(KIND_PREFIXES) + tuple(PINNED_NAMES)
+
+DEFAULT_KEEP = int(os.getenv("SCRAPER_OUTPUT_MAX_FILES", "3"))
+
+DEFAULT_RETENTION = {
+    "keep": DEFAULT_KEEP,
+    "max_age_days": 30.0,
+    "max_bytes": 200 * 1024 * 1024,
+    "compress_after": 1,  # compress all but the newest N kept artifacts
+}
+
+RETENTION_OVERRIDES = {
+    # Reports are summaries of a few KB; keep enough for trend analysis
+    "run_report": {"keep": max(DEFAULT_KEEP, 5000), "max_age_days": 365.0},
+    # Traces are only written with --trace; keep a few to compare slow runs
+    "trace": {"keep": max(DEFAULT_KEEP, 20)},
+}
+
+# Rewrite the manifest once it has this many times more lines than live entries
+COMPACT_RATIO = 4
+
+
+def parse_retention(spec: str) -> Dict[str, Any]:
+    """Parse "keep=3,days=30,mb=200,compress_after=1" into a policy dict."""
+    names = {"keep": "keep", "days": "max_age_days", "mb": "max_bytes", "compress_after": "compress_after"}
+    policy: Dict[str, Any] = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        key, _, value = part.partition("=")
+        key = names.get(key.strip())
+        if key is None:
+            continue
+        if key == "max_bytes":
+            policy[key] = int(float(value) * 1024 * 1024)
+        elif key == "max_age_days":
+            policy[key] = float(value)
+        else:
+            policy[key] = int(value)
+    return policy
+
+
+def retention_policy(kind: str) -> Dict[str, Any]:
+    policy = dict(DEFAULT_RETENTION)
+    policy.update(RETENTION_OVERRIDES.get(kind, {}))
+    spec = os.getenv(f"SCRAPER_RETENTION_{kind.upper()}")
+    if spec:
+        policy.update(parse_retention(spec))
+    return policy
+
+
+def kind_of(name: str) -> Optional[str]:
+    """Artifact kind implied by a file name (used to adopt unindexed files)."""
+    if not codec.is_artifact(name):
+        return None
+    for kind, pinned in PINNED_NAMES.items():
+        if name == pinned:
+            return kind
+    for kind, prefix in sorted(KIND_PREFIXES.items(), key=lambda item: -len(item[1])):
+        if name.startswith(f"{prefix}_"):
+            return kind
+    return None
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactStore:
+    """Manifest-indexed artifacts of one output directory."""
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root or OUTPUT_DIR)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self._lock_path = self.root / f".{MANIFEST_NAME}.lock"
+        self._thread_lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._by_kind: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._by_name: Dict[str, str] = {}
+        self._offset = 0
+        self._inode = None
+        self._lines = 0
+
+    # -----------------------------------------------------------------
+    # Manifest
+    # -----------------------------------------------------------------
+
+    def _locked(self, fn: Callable[[], Any]) -> Any:
+        """Run `fn` holding the manifest lock (threads and processes)."""
+        with self._thread_lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            lock_file = open(self._lock_path, "a") if fcntl is not None else None
+            try:
+                if lock_file is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                self._refresh()
+                return fn()
+            finally:
+                if lock_file is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    lock_file.close()
+
+    def _reset(self) -> None:
+        self._entries.clear()
+        self._by_kind.clear()
+        self._by_name.clear()
+        self._offset = 0
+        self._lines = 0
+
+    def _refresh(self) -> None:
+        """Replay manifest lines appended since the last read."""
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
+            self._reset()
+            self._adopt_existing()
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset()  # compacted by another process
+            self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.manifest_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # ignore a partially written last line
+        for line in data[:end].splitlines():
+            if line.strip():
+                try:
+                    self._apply(codec.loads(line))
+                except Exception as exc:
+                    log.warning("Skipping bad manifest line: %s", exc)
+                self._lines += 1
+        self._offset += end
+
+    def _apply(self, op: Dict[str, Any]) -> None:
+        action = op.get("op")
+        if action == "add":
+            entry = {k: v for k, v in op.items() if k != "op"}
+            self._drop(self._by_name.get(entry["name"]))
+            self._entries[entry["id"]] = entry
+            self._by_kind.setdefault(entry["kind"], {})[entry["id"]] = entry
+            self._by_name[entry["name"]] = entry["id"]
+        elif action == "remove":
+            self._drop(op.get("id"))
+        elif action == "update":
+            entry = self._entries.get(op.get("id"))
+            if entry is not None:
+                self._by_name.pop(entry["name"], None)
+                entry.update({k: v for k, v in op.items() if k not in ("op", "id")})
+                self._by_name[entry["name"]] = entry["id"]
+
+    def _drop(self, artifact_id: Optional[str]) -> None:
+        entry = self._entries.pop(artifact_id, None) if artifact_id else None
+        if entry is not None:
+            self._by_kind.get(entry["kind"], {}).pop(artifact_id, None)
+            if self._by_name.get(entry["name"]) == artifact_id:
+                del self._by_name[entry["name"]]
+
+    def _append(self, ops: List[Dict[str, Any]]) -> None:
+        data = b"".join(codec.dumps(op) + b"\n" for op in ops)
+        with open(self.manifest_path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        for op in ops:
+            self._apply(op)
+        self._inode = self.manifest_path.stat().st_ino
+        self._offset += len(data)
+        self._lines += len(ops)
+
+    def _compact(self) -> None:
+        """Rewrite the manifest with one add line per live entry."""
+        ops = [{"op": "add", **entry} for entry in self._entries.values()]
+        partial = self.manifest_path.with_suffix(".jsonl.partial")
+        with open(partial, "wb") as f:
+            f.write(b"".join(codec.dumps(op) + b"\n" for op in ops))
+        os.replace(partial, self.manifest_path)
+        self._reset()
+        self._refresh()
+
+    def _adopt_existing(self) -> None:
+        """Index artifacts that predate the manifest, oldest first."""
+        files = [p for p in self.root.iterdir() if p.is_file() and kind_of(p.name)] if self.root.exists() else []
+        files.sort(key=lambda p: (p.stat().st_mtime, p.name))
+        self._inode = None
+        self._append([self._entry_op(kind_of(p.name), p, None, created=p.stat().st_mtime) for p in files])
+
+    def _entry_op(self, kind: str, path: Path, run_id: Optional[str], created: Optional[float] = None) -> Dict[str, Any]:
+        created = created if created is not None else time.time()
+        return {
+            "op": "add",
+            "id": uuid.uuid4().hex[:16],
+            "kind": kind,
+            "run_id": run_id,
+            "name": path.name,
+            "bytes": path.stat().st_size,
+            "sha256": sha256_file(path),
+            "compression": codec.compression_of(path.name),
+            "created_at": datetime.utcfromtimestamp(created).isoformat(timespec="seconds") + "Z",
+            "created_ts": created,
+        }
+
+    # -----------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------
+
+    def new_path(self, kind: str, compression: Optional[str] = None) -> Path:
+        """Path for a new artifact of `kind` (fixed for pinned kinds)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        if kind in PINNED_NAMES:
+            return self.root / PINNED_NAMES[kind]
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        stem = f"{KIND_PREFIXES[kind]}_{timestamp}"
+        suffix = 1
+        # Retention compresses in place, so a stem is taken under any suffix
+        while any((self.root / f"{stem}{taken}").exists() for taken in codec.SUFFIXES.values()):
+            suffix += 1
+            stem = f"{KIND_PREFIXES[kind]}_{timestamp}_{suffix}"
+        return self.root / f"{stem}{codec.artifact_suffix(compression)}"
+
+    def register(self, kind: str, path: Path, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """Index a file already written under the store root."""
+        path = Path(path)
+        if path.resolve().parent != self.root.resolve():
+            raise ValueError(f"{path} is not in the artifact store {self.root}")
+
+        def add() -> Dict[str, Any]:
+            op = self._entry_op(kind, path, run_id)
+            self._append([op])
+            return self._entries[op["id"]]
+
+        return dict(self._locked(add))
+
+    def put(
+        self,
+        kind: str,
+        obj: Any,
+        run_id: Optional[str] = None,
+        pretty: bool = False,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> Dict[str, Any]:
+        """Encode `obj` as a new artifact of `kind` and index it."""
+        path = self.new_path(kind)
+        codec.write(path, obj, pretty=pretty, default=default)
+        return self.register(kind, path, run_id)
+
+    def latest(self, kind: str) -> Optional[Dict[str, Any]]:
+        """Newest artifact of `kind`, or None."""
+        def find() -> Optional[Dict[str, Any]]:
+            entries = self._by_kind.get(kind)
+            return dict(entries[next(reversed(entries))]) if entries else None
+
+        return self._locked(find)
+
+    def latest_path(self, kind: str) -> Optional[Path]:
+        entry = self.latest(kind)
+        return self.root / entry["name"] if entry else None
+
+    def entries(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Indexed artifacts (of one kind), oldest first."""
+        def collect() -> List[Dict[str, Any]]:
+            source = self._by_kind.get(kind, {}) if kind else self._entries
+            return [dict(entry) for entry in source.values()]
+
+        return self._locked(collect)
+
+    def apply_retention(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Apply each kind's retention policy. The newest artifact of a kind is
+        always kept; older ones are removed when beyond `keep`, older than
+        `max_age_days` or past `max_bytes` in total, and the kept ones past
+        `compress_after` are compressed.
+        """
+        now = now if now is not None else time.time()
+
+        def run() -> Dict[str, Any]:
+            removed: List[str] = []
+            compressed: List[str] = []
+            failed: List[str] = []
+            ops: List[Dict[str, Any]] = []
+            kinds: Dict[str, Any] = {}
+
+            for kind, entries in self._by_kind.items():
+                policy = retention_policy(kind)
+                total_bytes = 0
+                kept = 0
+                for entry in reversed(list(entries.values())):
+                    path = self.root / entry["name"]
+                    if not path.exists():
+                        ops.append({"op": "remove", "id": entry["id"]})
+                        continue
+
+                    age_days = (now - entry.get("created_ts", now)) / 86400
+                    expired = (
+                        kept >= policy["keep"]
+                        or age_days > policy["max_age_days"]
+                        or total_bytes + entry["bytes"] > policy["max_bytes"]
+                    )
+                    if kept > 0 and expired:
+                        try:
+                            path.unlink()
+                            removed.append(entry["name"])
+                            ops.append({"op": "remove", "id": entry["id"]})
+                        except OSError:
+                            failed.append(entry["name"])
+                        continue
+
+                    if kept >= policy["compress_after"] and kind not in PINNED_NAMES and entry["compression"] == "none":
+                        update = self._compress(entry)
+                        if update:
+                            ops.append(update)
+                            compressed.append(entry["name"])
+                            entry = {**entry, **update}
+                    kept += 1
+                    total_bytes += entry["bytes"]
+                kinds[kind] = {"kept": kept, "bytes": total_bytes}
+
+            if ops:
+                self._append(ops)
+            if self._lines > COMPACT_RATIO * max(len(self._entries), 1):
+                self._compact()
+            return {
+                "success": not failed,
+                "removed_files": removed,
+                "compressed_files": compressed,
+                "failed_files": failed,
+                "kinds": kinds,
+                "error": "Some files could not be deleted" if failed else None,
+            }
+
+        try:
+            result = self._locked(run)
+        except Exception as exc:
+            log.error("Artifact retention failed: %s", exc, exc_info=True)
+            return {"success": False, "error": str(exc)}
+
+        if result["removed_files"] or result["compressed_files"]:
+            log.info(
+                "Artifact retention: removed %d, compressed %d file(s)",
+                len(result["removed_files"]),
+                len(result["compressed_files"]),
+            )
+        return result
+
+    def _compress(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Rewrite an uncompressed artifact compressed; returns the update op."""
+        compression = codec.resolve_compression("zstd" if codec.zstandard is not None else "gzip")
+        source = self.root / entry["name"]
+        stem = entry["name"][: -len(codec.SUFFIXES["none"])]
+        target = self.root / f"{stem}{codec.SUFFIXES[compression]}"
+        try:
+            with open(source, "rb") as f:
+                data = codec.compress(f.read(), compression)
+            partial = f"{target}.partial"
+            with open(partial, "wb") as f:
+                f.write(data)
+            os.replace(partial, target)
+            source.unlink()
+        except OSError as exc:
+            log.warning("Could not compress %s: %s", source, exc)
+            return None
+        return {
+            "op": "update",
+            "id": entry["id"],
+            "name": target.name,
+            "bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "compression": compression,
+        }
+
+
+def register_artifact(kind: str, path: Any, run_id: Optional[str] = None, store: Optional[ArtifactStore] = None) -> Optional[Dict[str, Any]]:
+    """
+    Index `path` in the store when it was written under the store root;
+    files written elsewhere (e.g. a custom --output) are left alone.
+    """
+    store = store or ArtifactStore()
+    path = Path(path)
+    if path.resolve().parent != store.root.resolve():
+        return None
+    try:
+        return store.register(kind, path, run_id)
+    except Exception as exc:
+        log.warning("Could not index %s as %s: %s", path, kind, exc)
+        return None
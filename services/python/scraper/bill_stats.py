@@ -0,0 +1,245 @@
+"""
+Precomputed bill statistics for the dashboard (table bill_stats).
+
+/api/bills/stats used to aggregate `bills` and `bill_status_history` on
+every request. The pipeline keeps one row of counts instead, which the
+stats service reads as is:
+
+- total, and counts by house, current status, phase, ministry, category,
+  session and year: jsonb objects of value -> count (NULL counts as
+  "unknown")
+- throughput: status changes per month from bill_status_history,
+  {"2025-07": {"registered": 3, "gazette_published": 1}}
+
+The row is updated incrementally around the Bun import: the bills this run
+changed (from the snapshot history) are aggregated in the database before
+the import and again after it, and only the difference is applied. Counts
+thus follow what the importer wrote, its status and category mapping
+included, and a run that changed ten bills reads ten bills. The row is
+rebuilt from all bills instead when there is none, when the run's changes
+are unknown, or when it was not written by the previous recorded run (a
+refresh failed in between).
+
+    python -m scraper.bill_stats             # print the stored row
+    python -m scraper.bill_stats --rebuild   # recompute from all bills
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from scraper.history import SnapshotHistory
+from scraper.logs import configure_logging
+
+
+log = logging.getLogger(__name__)
+
+
+STATS_ID = "bills"
+UNKNOWN = "unknown"
+
+# jsonb column of bill_stats -> column of bills it counts
+DIMENSIONS = {
+    "by_house": "house",
+    "by_status": "current_status",
+    "by_phase": "current_phase",
+    "by_ministry": "ministry",
+    "by_category": "category",
+    "by_session": "session",
+    "by_year": "year",
+}
+COLUMNS = ("total", *DIMENSIONS, "throughput")
+
+# Counter keys: ("total",), (dimension, value) and ("throughput", month, status)
+Counts = Counter
+
+
+# =====================================================================
+# AGGREGATION
+# =====================================================================
+
+def aggregate(cur: Any, bill_ids: Optional[List[str]] = None) -> Counts:
+    """Counts over all bills, or over the bills with these parliament ids."""
+    columns = ", ".join(DIMENSIONS.values())
+    where, params = ("WHERE b.parliament_id = ANY(%s)", (bill_ids,)) if bill_ids is not None else ("", ())
+    counts: Counts = Counter()
+
+    cur.execute(f"SELECT {columns}, count(*) FROM bills b {where} GROUP BY {columns}", params)
+    for *values, count in cur.fetchall():
+        counts[("total",)] += count
+        for dimension, value in zip(DIMENSIONS, values):
+            counts[(dimension, UNKNOWN if value is None else str(value))] += count
+
+    cur.execute(
+        f"""
+        SELECT to_char(h.status_date_ad, 'YYYY-MM'), h.status, count(*)
+        FROM bill_status_history h JOIN bills b ON b.id = h.bill_id
+        {where or "WHERE TRUE"} AND h.status_date_ad IS NOT NULL
+        GROUP BY 1, 2
+        """,
+        params,
+    )
+    for month, status, count in cur.fetchall():
+        counts[("throughput", month, status)] += count
+    return counts
+
+
+def to_row(counts: Counts) -> Dict[str, Any]:
+    """bill_stats column values of `counts` (zero counts dropped)."""
+    row: Dict[str, Any] = {"total": counts.get(("total",), 0), "throughput": {}}
+    row.update({dimension: {} for dimension in DIMENSIONS})
+    for key, count in sorted(counts.items()):
+        if count <= 0 or key[0] == "total":
+            continue
+        if key[0] == "throughput":
+            row["throughput"].setdefault(key[1], {})[key[2]] = count
+        else:
+            row[key[0]][key[1]] = count
+    return row
+
+
+def from_row(row: Dict[str, Any]) -> Counts:
+    counts: Counts = Counter({("total",): row.get("total") or 0})
+    for dimension in DIMENSIONS:
+        for value, count in (row.get(dimension) or {}).items():
+            counts[(dimension, value)] = count
+    for month, statuses in (row.get("throughput") or {}).items():
+        for status, count in statuses.items():
+            counts[("throughput", month, status)] = count
+    return counts
+
+
+def run_changes(run_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Parliament ids of the bills changed or removed in a run and the
+    previous recorded run, or None if the run was not recorded.
+    """
+    changes = SnapshotHistory().changes("bills_cleaned", run_id)
+    if changes is None:
+        return None
+    # History keys are "<house>:<bill_id>"; the importer stores bill_id as parliament_id
+    bill_ids = sorted({key.split(":", 1)[1] for key in changes["changed"] + changes["removed"]})
+    return {"bill_ids": bill_ids, "previous_run_id": changes["previous_run_id"]}
+
+
+# =====================================================================
+# REFRESH
+# =====================================================================
+
+def _connect(database_url: str) -> Any:
+    import psycopg2
+
+    return psycopg2.connect(database_url)
+
+
+def _read_row(cur: Any) -> Optional[Dict[str, Any]]:
+    """The stored row (locked until the transaction ends), None if there is none."""
+    cur.execute(f"SELECT {', '.join(COLUMNS)}, run_id FROM bill_stats WHERE id = %s FOR UPDATE", (STATS_ID,))
+    values = cur.fetchone()
+    return dict(zip((*COLUMNS, "run_id"), values)) if values else None
+
+
+def _write_row(cur: Any, row: Dict[str, Any], run_id: Optional[str]) -> None:
+    from psycopg2.extras import Json
+
+    cur.execute(
+        f"""
+        INSERT INTO bill_stats (id, {', '.join(COLUMNS)}, run_id, refreshed_at)
+        VALUES (%s, {', '.join(['%s'] * len(COLUMNS))}, %s, NOW())
+        ON CONFLICT (id) DO UPDATE SET
+            {', '.join(f'{column} = EXCLUDED.{column}' for column in COLUMNS)},
+            run_id = EXCLUDED.run_id,
+            refreshed_at = EXCLUDED.refreshed_at
+        """,
+        (STATS_ID, row["total"], *(Json(row[column]) for column in COLUMNS[1:]), run_id),
+    )
+
+
+class StatsRefresh:
+    """
+    Incremental refresh of bill_stats around one import: `start()` before
+    the importer runs, `finish()` after it.
+    """
+
+    def __init__(self, database_url: str, bill_ids: Optional[List[str]]) -> None:
+        self.database_url = database_url
+        self.bill_ids = bill_ids
+        self.before: Optional[Counts] = None
+        self.error: Optional[str] = None
+
+    @classmethod
+    def start(cls, database_url: str, run_id: Optional[str]) -> "StatsRefresh":
+        changes = run_changes(run_id) if run_id else None
+        if changes is None:
+            return cls(database_url, None)
+        refresh = cls(database_url, changes["bill_ids"])
+        try:
+            with _connect(database_url) as conn, conn.cursor() as cur:
+                stored = _read_row(cur)
+                if stored is not None and stored["run_id"] == changes["previous_run_id"]:
+                    refresh.before = aggregate(cur, refresh.bill_ids)
+        except Exception as exc:
+            log.error("Reading bill stats before the import failed: %s", exc, exc_info=True)
+            refresh.error = str(exc)
+        return refresh
+
+    def finish(self, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """Apply the changes of the import (or rebuild) in one transaction."""
+        if self.error:
+            return {"success": False, "error": self.error}
+        started = time.monotonic()
+        try:
+            with _connect(self.database_url) as conn, conn.cursor() as cur:
+                stored = _read_row(cur)
+                if stored is None or self.before is None:
+                    counts = aggregate(cur)
+                    mode, bills = "full", counts[("total",)]
+                else:
+                    after = aggregate(cur, self.bill_ids)
+                    counts = from_row(stored)
+                    for key in after.keys() | self.before.keys():
+                        counts[key] += after[key] - self.before[key]
+                    mode, bills = "incremental", len(self.bill_ids)
+                row = to_row(counts)
+                _write_row(cur, row, run_id)
+        except Exception as exc:
+            log.error("Refreshing bill stats failed: %s", exc, exc_info=True)
+            return {"success": False, "error": str(exc)}
+
+        log.info("Bill stats: %s refresh over %d bills, %d bills in total", mode, bills, row["total"])
+        return {
+            "success": True,
+            "mode": mode,
+            "bills": bills,
+            "total": row["total"],
+            "duration_seconds": round(time.monotonic() - started, 3),
+        }
+
+
+# =====================================================================
+# CLI
+# =====================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show or rebuild the precomputed bill statistics")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute the row from all bills")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL") or os.getenv("DATABASEURL")
+    if not database_url:
+        log.error("DATABASE_URL is not set")
+        return
+    if args.rebuild:
+        StatsRefresh(database_url, None).finish()
+    with _connect(database_url) as conn, conn.cursor() as cur:
+        row = _read_row(cur)
+    print(json.dumps(row, ensure_ascii=False, indent=2) if row else "No bill stats stored yet")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    main()
@@ -0,0 +1 @@
+"""Bills scraper module for Nepal Parliament."""
@@ -1,25 +1,37 @@
 #!/usr/bin/env python3
 """
-Bills Data Cleaner and Database Inserter
+Bills Data Cleaner
 
-This module is responsible for:
-1. Loading scraped bills data from JSON
-2. Cleaning and normalizing the data
-3. Inserting into the database
+Turns the latest raw bills artifact (or a given JSON file) into
+bills_cleaned.json for the Bun importer:
 
-Create your implementation here.
+1. Load the raw bills as RawBill records
+2. Clean each bill (CleanedBill) and drop bills without bill_id or
+   registration_number, and duplicates by (registration_number, year)
+3. Convert the BS dates of the whole batch to AD in one call
+   (normalize_dates)
+4. Replace presenter and ministry variants with canonical names and ids
+   (canonicalize_names, see scraper.canonical)
+5. Write bills_cleaned.json through the artifact store
+
+Nothing is written to the database here: `bun db:import-bills` loads
+bills_cleaned.json (insert_to_database is kept as a no-op).
+
+    python -m scraper.bills.clean_and_insert_bills
 """
 
-import json
 import logging
-import sys
 from pathlib import Path
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s - %(message)s"
-)
+from scraper.bs_calendar import bs_to_ad_many
+from scraper import codec
+from scraper.artifacts import ArtifactStore, register_artifact
+from scraper.canonical import NameIndex
+from scraper.logs import configure_logging
+from scraper.records import CleanedBill, RawBill, to_dicts
+from scraper.tracing import span
+
+
 log = logging.getLogger(__name__)
 
 # Paths
@@ -28,83 +40,143 @@ DATA_DIR = BASE_DIR / "data"
 
 
 def load_bills_data(file_path: str = None):
-    """Load bills data from JSON file."""
+    """Load bills data from JSON file (default: the latest raw bills artifact)."""
     if file_path is None:
-        # Find the latest bills file
-        output_dir = Path(__file__).parent.parent.parent / "data" / "output"
-        bills_files = list(output_dir.glob("bills_*.json"))
-        if bills_files:
-            file_path = str(max(bills_files, key=lambda p: p.stat().st_mtime))
+        latest = ArtifactStore().latest_path("bills_raw")
+        if latest is not None:
+            file_path = str(latest)
         else:
             # Fallback to scraper-local timestamped files
-            local_files = list(DATA_DIR.glob("bills_*.json"))
+            local_files = codec.glob_artifacts(DATA_DIR, "bills_*")
             if local_files:
                 file_path = str(max(local_files, key=lambda p: p.stat().st_mtime))
             else:
                 file_path = str(DATA_DIR / "bills.json")
 
-    log.info(f"Loading bills data from: {file_path}")
+    log.info("Loading bills data from: %s", file_path)
+
+    return codec.read(file_path)
+
+
+def raw_bill_from_dict(data: dict) -> RawBill:
+    """RawBill from scraped JSON; also accepts the snake_case English keys of cleaned files."""
+    bill = RawBill.from_dict(data)
+    bill.presenterEn = bill.presenterEn or data.get("presenter_en") or ""
+    bill.ministryEn = bill.ministryEn or data.get("ministry_en") or ""
+    return bill
+
+
+def clean_bill(bill: RawBill):
+    """
+    Clean and normalize a single raw bill.
+    Returns None when the bill lacks bill_id or registration_number.
+    """
+    # Skip bills without essential identifiers
+    if not bill.bill_id or not bill.registration_number:
+        return None
+
+    return CleanedBill(
+        bill_id=bill.bill_id,
+        type=bill.type,  # HoR or NA
+        titleNp=bill.titleNp,
+        titleEn=bill.titleEn,
+        registration_number=bill.registration_number,
+        year=bill.year,
+        sambat=bill.sambat,
+        presenter=bill.presenter,
+        ministry=bill.ministry,
+        presenter_en=bill.presenterEn or None,
+        ministry_en=bill.ministryEn or None,
+        session=bill.session,
+        government_type=bill.government_type,
+        bill_type=bill.bill_type,
+        category=bill.category,
+        government_type_en=bill.government_type_en,
+        bill_type_en=bill.bill_type_en,
+        category_en=bill.category_en,
+        current_status=bill.current_status,
+        current_status_date=bill.current_status_date,
+        status_timeline=[entry.copy() for entry in bill.status_timeline],
+        resource_link=bill.resource_link,
+    )
+
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def normalize_dates(cleaned_bills: list) -> list:
+    """
+    Add AD dates next to the scraped BS dates of a batch of cleaned bills:
+    `year_ad`, `current_status_date_ad` and `status_timeline[].date_ad`.
+    All dates of the batch are converted in one call.
+    """
+    bs_dates = []
+    for bill in cleaned_bills:
+        bs_dates.append(bill.year)
+        bs_dates.append(bill.current_status_date)
+        bs_dates.extend(entry.date for entry in bill.status_timeline)
+
+    ad_dates = iter(bs_to_ad_many(bs_dates))
+    for bill in cleaned_bills:
+        bill.year_ad = next(ad_dates)
+        bill.current_status_date_ad = next(ad_dates)
+        for entry in bill.status_timeline:
+            entry.date_ad = next(ad_dates)
+
+    return cleaned_bills
 
 
-def clean_and_normalize(bills: list) -> list:
+def canonicalize_names(cleaned_bills: list, names: NameIndex) -> list:
+    """
+    Replace presenter and ministry variants of a batch of cleaned bills with
+    their canonical names and set `presenter_id` / `ministry_id` (see
+    scraper.canonical). Variants seen before are dictionary lookups.
+    """
+    for bill in cleaned_bills:
+        names.canonicalize_bill(bill)
+    return cleaned_bills
+
+
+def dedup_key(cleaned: CleanedBill) -> str:
+    """Deduplication key: (registration_number, sambat/year)."""
+    return f"{cleaned.registration_number}_{cleaned.sambat or cleaned.year or ''}"
+
+
+def clean_and_normalize(bills: list, names: NameIndex = None) -> list:
     """
     Clean and normalize bills data.
 
-    TODO: Implement your cleaning logic here.
-    Examples of what you might want to do:
-    - Remove duplicates
-    - Standardize date formats
-    - Handle missing values
-    - Validate data types
+    - Drop bills missing bill_id or registration_number
+    - Remove duplicates by (registration_number, sambat/year)
+    - Rename English parallel fields to snake_case
+    - Convert BS dates to AD (see normalize_dates)
+    - Canonicalize presenters and ministries (see canonicalize_names); the
+      name table is saved unless the caller passes its own `names`
     """
     cleaned_bills = []
     seen = set()  # Track (registration_number, year) for dedup
 
     for bill in bills:
-        # Create a cleaned copy
-        cleaned = {
-            "bill_id": bill.get("bill_id"),
-            "type": bill.get("type"),  # HoR or NA
-            "titleNp": bill.get("titleNp", ""),
-            "titleEn": bill.get("titleEn", ""),
-            "registration_number": bill.get("registration_number"),
-            "year": bill.get("year"),
-            "sambat": bill.get("sambat"),
-            "presenter": bill.get("presenter"),
-            "ministry": bill.get("ministry"),
-            "presenter_en": bill.get("presenterEn") or bill.get("presenter_en"),
-            "ministry_en": bill.get("ministryEn") or bill.get("ministry_en"),
-            "session": bill.get("session"),
-            "government_type": bill.get("government_type"),
-            "bill_type": bill.get("bill_type"),
-            "category": bill.get("category"),
-            "government_type_en": bill.get("government_type_en"),
-            "bill_type_en": bill.get("bill_type_en"),
-            "category_en": bill.get("category_en"),
-            "current_status": bill.get("current_status"),
-            "current_status_date": bill.get("current_status_date"),
-            "status_timeline": bill.get("status_timeline"),
-            "resource_link": bill.get("resource_link"),
-        }
-
-        # Skip bills without essential identifiers
-        if not cleaned.get("bill_id") or not cleaned.get("registration_number"):
-            log.warning(f"Skipping bill with missing bill_id or registration_number")
+        if isinstance(bill, dict):
+            bill = raw_bill_from_dict(bill)
+        cleaned = clean_bill(bill)
+        if cleaned is None:
+            log.warning("Skipping bill with missing bill_id or registration_number")
             continue
 
-        # Deduplicate by (registration_number, sambat/year)
-        dedup_key = f"{cleaned.get('registration_number')}_{cleaned.get('sambat') or cleaned.get('year', '')}"
-        if dedup_key in seen:
-            log.debug(f"Skipping duplicate bill: {dedup_key}")
+        key = dedup_key(cleaned)
+        if key in seen:
+            log.debug("Skipping duplicate bill: %s", key)
             continue
-        seen.add(dedup_key)
+        seen.add(key)
 
         cleaned_bills.append(cleaned)
 
-    log.info(f"Cleaned {len(cleaned_bills)} bills (from {len(bills)} raw, {len(bills) - len(cleaned_bills)} removed)")
+    normalize_dates(cleaned_bills)
+    own_names = names is None
+    names = NameIndex() if own_names else names
+    canonicalize_names(cleaned_bills, names)
+    if own_names:
+        names.save()
+
+    log.info("Cleaned %d bills (from %d raw, %d removed)", len(cleaned_bills), len(bills), len(bills) - len(cleaned_bills))
     return cleaned_bills
 
 
@@ -120,7 +192,7 @@ def insert_to_database(bills: list):
     return {"success": True, "inserted_count": 0}
 
 
-def main():
+def main(file_path: str = None, run_id: str = None):
     """Main entry point."""
     try:
         log.info("="*60)
@@ -128,21 +200,28 @@ def main():
         log.info("="*60)
 
         # Load data
-        bills = load_bills_data()
-        log.info(f"Loaded {len(bills)} bills")
+        bills = load_bills_data(file_path)
+        log.info("Loaded %d bills", len(bills))
 
         # Clean and normalize
-        cleaned_bills = clean_and_normalize(bills)
-
-        # Save cleaned data (optional)
-        output_dir = Path(__file__).parent.parent.parent / "data" / "output"
-        output_file = output_dir / "bills_cleaned.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(cleaned_bills, f, ensure_ascii=False, indent=2)
-        log.info(f"Saved cleaned data to: {output_file}")
+        with span("bills.clean", bills=len(bills)):
+            names = NameIndex()
+            cleaned_bills = clean_and_normalize(bills, names)
+            names.save()
+
+        # Save cleaned data (read by the Bun importer: keep pretty JSON)
+        records = to_dicts(cleaned_bills)
+        with span("bills.save", bills=len(cleaned_bills)):
+            store = ArtifactStore()
+            output_file = store.new_path("bills_cleaned")
+            codec.write(output_file, records, pretty=True)
+            register_artifact("bills_cleaned", output_file, run_id, store)
+        log.info("Saved cleaned data to: %s", output_file)
 
         # Insert into database
         result = insert_to_database(cleaned_bills)
+        result["output"] = str(output_file)
+        result["names"] = names.summary()
 
         log.info("="*60)
         log.info("Completed!")
@@ -151,9 +230,10 @@ def main():
         return result
 
     except Exception as e:
-        log.error(f"Error: {e}", exc_info=True)
+        log.error("Error: %s", e, exc_info=True)
         return {"success": False, "error": str(e)}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
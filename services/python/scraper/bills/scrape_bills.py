@@ -5,36 +5,49 @@ Nepal Parliament Bills Scraper
 Scrapes bills data from both HoR (House of Representatives) and NA (National Assembly)
 from Nepal Parliament website in both Nepali and English.
 
+Bills flow through a staged pipeline (list pages -> detail fetch -> parse ->
+clean -> sink) connected by bounded queues, so records reach disk as soon as
+they are scraped.
+
 Usage:
-    python scrape_bills.py              # Scrape all (HoR + NA)
-    python scrape_bills.py --type HoR  # Scrape only HoR
-    python scrape_bills.py --type NA   # Scrape only NA
+    python -m scraper.bills.scrape_bills              # Scrape all (HoR + NA)
+    python -m scraper.bills.scrape_bills --type HoR  # Scrape only HoR
+    python -m scraper.bills.scrape_bills --type NA   # Scrape only NA
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import re
-import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 from bs4 import BeautifulSoup
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
+from scraper import codec
+from scraper.artifacts import ArtifactStore, register_artifact
+from scraper.bills import clean_and_insert_bills
+from scraper.canonical import NameIndex
+from scraper.concurrency import HostLimiter
+from scraper.logs import bind_log_context, configure_logging
+from scraper.profiling import cli_profiler, log_summary
+from scraper.telemetry import RequestTelemetry
+from scraper.tracing import end_trace, export_trace, span, start_trace
+from scraper.records import CleanedBill, RawBill, Record, StatusEntry, from_dicts, to_dicts
+
+
 log = logging.getLogger(__name__)
 
 # Configuration
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
+PREVIOUS_BILLS_FILE = BASE_DIR.parent.parent / "data" / "output" / "bills_cleaned.json"
+DEFERRED_BILLS_FILE = DATA_DIR / "deferred_bills.json"
 
 # Parliament URLs
 PARLIAMENT_URLS = {
@@ -51,15 +64,39 @@ LANGUAGES = {
 # Bill types to scrape
 BILL_TYPES = ["reg"]  # Registration bills
 
+# Change probe: number of active bills whose detail page is sampled
+PROBE_SAMPLE_SIZE = int(os.getenv("SCRAPER_PROBE_SAMPLE_SIZE", "5"))
+
+# Bills whose status changed within this many days are refreshed early
+RECENT_CHANGE_DAYS = int(os.getenv("SCRAPER_RECENT_CHANGE_DAYS", "30"))
+
+# Pipeline sizing: detail fetch workers and bounded queue capacities
+DETAIL_WORKERS = int(os.getenv("SCRAPER_BILL_WORKERS", "4"))
+ID_QUEUE_SIZE = int(os.getenv("SCRAPER_ID_QUEUE_SIZE", "256"))
+QUEUE_SIZE = int(os.getenv("SCRAPER_QUEUE_SIZE", "32"))
+QUEUE_SAMPLE_SECONDS = 0.25
+CLEAN_BATCH_SIZE = 64
+
+# Raw status labels (lowercased) after which a bill no longer moves in parliament
+TERMINAL_STATUS_LABELS = {
+    "repassed",
+    "homepage.assembly_passed",
+    "passed/return by national assembly",
+    "authenticated",
+    "assented",
+}
+
 
 # =====================================================================
 # HTTP CLIENT
 # =====================================================================
 
 class BillsHTTPClient:
-    """HTTP client for fetching parliament pages."""
+    """HTTP client for fetching parliament pages, limited per host."""
 
-    def __init__(self):
+    def __init__(self, limiter: Optional[HostLimiter] = None, telemetry: Optional[RequestTelemetry] = None):
+        self.limiter = limiter or HostLimiter()
+        self.telemetry = telemetry or RequestTelemetry("bills")
         self.client = httpx.AsyncClient(
             timeout=30.0,
             verify=False,
@@ -74,18 +111,21 @@ class BillsHTTPClient:
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
+        self.telemetry.close()
 
     async def get(self, url: str) -> Optional[str]:
         """Fetch a URL and return HTML content."""
         try:
-            response = await self.client.get(url)
+            queued_at = time.perf_counter()
+            async with self.limiter.slot(url):
+                response = await self.telemetry.fetch(self.client, url, queued_at)
             response.raise_for_status()
             return response.text
         except httpx.HTTPStatusError as e:
-            log.error(f"HTTP error fetching {url}: {e}")
+            log.error("HTTP error fetching %s: %s", url, e)
             return None
         except Exception as e:
-            log.error(f"Error fetching {url}: {e}")
+            log.error("Error fetching %s: %s", url, e)
             return None
 
 
@@ -128,36 +168,62 @@ class BillListScraper:
                     bill_id = match.group(1)
                     bill_ids.append(bill_id)
 
-        log.info(f"Extracted {len(bill_ids)} bill IDs from page")
+        log.info("Extracted %d bill IDs from page", len(bill_ids))
         return bill_ids
 
-    async def get_bill_ids_for_type(self, parliament_type: str, bill_type: str = "reg") -> List[str]:
+    def extract_list_rows(self, html: str) -> List[str]:
+        """Extract the visible text of each row in a list page table."""
+        if not html:
+            return []
+
+        soup = BeautifulSoup(html, 'lxml')
+        table = soup.find('table', class_='table-bordered')
+        if not table or not table.find('tbody'):
+            return []
+
+        return [
+            row.get_text(" ", strip=True)
+            for row in table.find('tbody').find_all('tr')
+        ]
+
+    def list_page_url(self, parliament_type: str, bill_type: str = "reg", page: int = 1) -> str:
+        """Build the list page URL for a parliament type and bill type."""
+        base_url = PARLIAMENT_URLS[parliament_type]
+        return f"{base_url}/np/bills?type={bill_type}&ref=BILL&page={page}"
+
+    async def get_bill_ids_for_type(
+        self,
+        parliament_type: str,
+        bill_type: str = "reg",
+        deadline: Optional[float] = None,
+    ) -> List[str]:
         """Get all bill IDs for a given parliament type and bill type."""
         all_bill_ids = []
         page = 1
 
-        base_url = PARLIAMENT_URLS[parliament_type]
-        url_template = f"{base_url}/np/bills?type={bill_type}&ref=BILL&page={{page}}"
-
-        log.info(f"Fetching bill IDs for {parliament_type} - {bill_type}")
+        log.info("Fetching bill IDs for %s - %s", parliament_type, bill_type)
 
         while True:
-            url = url_template.format(page=page)
-            log.info(f"Fetching page {page}: {url}")
+            if deadline is not None and time.monotonic() >= deadline:
+                log.warning("Time budget exhausted while listing page %d, stopping", page)
+                break
+
+            url = self.list_page_url(parliament_type, bill_type, page)
+            log.info("Fetching page %d: %s", page, url)
 
             html = await self.client.get(url)
             if not html:
-                log.warning(f"Failed to fetch page {page}, stopping")
+                log.warning("Failed to fetch page %d, stopping", page)
                 break
 
             bill_ids = await self.extract_bill_ids_from_page(html)
 
             if not bill_ids:
-                log.info(f"No more bills found on page {page}, stopping")
+                log.info("No more bills found on page %d, stopping", page)
                 break
 
             all_bill_ids.extend(bill_ids)
-            log.info(f"Total bill IDs so far: {len(all_bill_ids)}")
+            log.info("Total bill IDs so far: %d", len(all_bill_ids))
             page += 1
 
             # Small delay to be respectful
@@ -176,19 +242,32 @@ class BillDetailScraper:
     def __init__(self, client: BillsHTTPClient):
         self.client = client
 
+    def detail_url(self, parliament_type: str, bill_id: str, lang: str) -> str:
+        """Build the detail page URL of a bill in the given language."""
+        return f"{PARLIAMENT_URLS[parliament_type]}/{lang}/bills/{bill_id}"
+
+    async def fetch_bill_detail(self, parliament_type: str, bill_id: str, lang: str) -> Optional[str]:
+        """Fetch the detail page HTML of a bill in the given language."""
+        url = self.detail_url(parliament_type, bill_id, lang)
+        html = await self.client.get(url)
+        if not html:
+            log.error("Failed to fetch bill detail: %s", url)
+        return html
+
     async def scrape_bill_detail(self, parliament_type: str, bill_id: str, lang: str) -> Dict:
         """
         Scrape bill detail page in specified language.
         Returns dict with bill details.
         """
-        base_url = PARLIAMENT_URLS[parliament_type]
-        url = f"{base_url}/{lang}/bills/{bill_id}"
+        html = await self.fetch_bill_detail(parliament_type, bill_id, lang)
+        return self.parse_bill_detail(html, parliament_type, bill_id, lang)
 
-        html = await self.client.get(url)
+    def parse_bill_detail(self, html: Optional[str], parliament_type: str, bill_id: str, lang: str) -> Dict:
+        """Parse a bill detail page; returns {} when there is no HTML."""
         if not html:
-            log.error(f"Failed to fetch bill detail: {url}")
             return {}
 
+        base_url = PARLIAMENT_URLS[parliament_type]
         soup = BeautifulSoup(html, 'lxml')
 
         bill_detail = {
@@ -284,12 +363,12 @@ class BillDetailScraper:
 
         return bill_detail
 
-    async def scrape_bill_both_languages(self, parliament_type: str, bill_id: str) -> Dict:
+    async def scrape_bill_both_languages(self, parliament_type: str, bill_id: str) -> Optional[RawBill]:
         """
         Scrape bill in both Nepali and English and merge results.
-        Returns dict with combined data.
+        Returns the combined record, or None when both pages failed.
         """
-        log.info(f"Scraping bill {bill_id} from {parliament_type} in both languages")
+        log.info("Scraping bill %s from %s in both languages", bill_id, parliament_type)
 
         # Scrape both languages
         np_result = await self.scrape_bill_detail(parliament_type, bill_id, "np")
@@ -299,39 +378,464 @@ class BillDetailScraper:
         await asyncio.sleep(0.3)
 
         if not np_result and not en_result:
-            log.warning(f"Failed to scrape bill {bill_id} in both languages")
-            return {}
+            log.warning("Failed to scrape bill %s in both languages", bill_id)
+            return None
 
-        # Merge results
-        combined = {
-            "bill_id": bill_id,
-            "type": parliament_type,  # HoR or NA
-            "titleNp": np_result.get("title", ""),
-            "titleEn": en_result.get("title", ""),
-            "registration_number": np_result.get("registration_number") or en_result.get("registration_number"),
-            "year": np_result.get("year") or en_result.get("year"),
-            "sambat": np_result.get("sambat") or en_result.get("sambat"),
-            "presenter": np_result.get("presenter") or en_result.get("presenter"),
-            "ministry": np_result.get("ministry") or en_result.get("ministry"),
-            "session": np_result.get("session") or en_result.get("session"),
-            "government_type": np_result.get("government_type") or en_result.get("government_type"),
-            "bill_type": np_result.get("bill_type") or en_result.get("bill_type"),
-            "category": np_result.get("category") or en_result.get("category"),
-            "resource_link": np_result.get("resource_link") or en_result.get("resource_link"),
+        return self.merge_languages(parliament_type, bill_id, np_result, en_result)
+
+    @staticmethod
+    def merge_languages(parliament_type: str, bill_id: str, np_result: Dict, en_result: Dict) -> RawBill:
+        """Merge the Nepali and English detail of a bill into one record."""
+        return RawBill(
+            bill_id=bill_id,
+            type=parliament_type,  # HoR or NA
+            titleNp=np_result.get("title", ""),
+            titleEn=en_result.get("title", ""),
+            registration_number=np_result.get("registration_number") or en_result.get("registration_number"),
+            year=np_result.get("year") or en_result.get("year"),
+            sambat=np_result.get("sambat") or en_result.get("sambat"),
+            presenter=np_result.get("presenter") or en_result.get("presenter"),
+            ministry=np_result.get("ministry") or en_result.get("ministry"),
+            session=np_result.get("session") or en_result.get("session"),
+            government_type=np_result.get("government_type") or en_result.get("government_type"),
+            bill_type=np_result.get("bill_type") or en_result.get("bill_type"),
+            category=np_result.get("category") or en_result.get("category"),
+            resource_link=np_result.get("resource_link") or en_result.get("resource_link"),
             # English parallel fields (if available)
-            "presenterEn": en_result.get("presenter_en", ""),
-            "ministryEn": en_result.get("ministry_en", ""),
-            "government_type_en": en_result.get("government_type_en"),
-            "bill_type_en": en_result.get("bill_type_en"),
-            "category_en": en_result.get("category_en"),
+            presenterEn=en_result.get("presenter_en", ""),
+            ministryEn=en_result.get("ministry_en", ""),
+            government_type_en=en_result.get("government_type_en"),
+            bill_type_en=en_result.get("bill_type_en"),
+            category_en=en_result.get("category_en"),
             # Status information from English detail
-            "current_status": en_result.get("current_status"),
-            "current_status_date": en_result.get("current_status_date"),
-            "status_timeline": en_result.get("status_timeline", []),
-            "scraped_at": datetime.now().isoformat(),
+            current_status=en_result.get("current_status"),
+            current_status_date=en_result.get("current_status_date"),
+            status_timeline=[StatusEntry.from_dict(entry) for entry in en_result.get("status_timeline", [])],
+            scraped_at=datetime.now().isoformat(),
+        )
+
+
+# =====================================================================
+# STAGED PIPELINE
+# =====================================================================
+
+class StageStats:
+    """Item counts and busy time of one pipeline stage."""
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self.workers = workers
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+    def to_dict(self, wall_seconds: float) -> Dict[str, Any]:
+        capacity = wall_seconds * self.workers
+        return {
+            "workers": self.workers,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(self.items_out / self.busy_seconds, 2) if self.busy_seconds else None,
+            "utilization": round(self.busy_seconds / capacity, 3) if capacity else None,
+        }
+
+
+class QueueStats:
+    """Sampled depth of one bounded queue."""
+
+    def __init__(self, name: str, queue: asyncio.Queue):
+        self.name = name
+        self.queue = queue
+        self.samples = 0
+        self.total_depth = 0
+        self.max_depth = 0
+
+    def sample(self):
+        depth = self.queue.qsize()
+        self.samples += 1
+        self.total_depth += depth
+        self.max_depth = max(self.max_depth, depth)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "maxsize": self.queue.maxsize,
+            "max_depth": self.max_depth,
+            "mean_depth": round(self.total_depth / self.samples, 2) if self.samples else 0,
+        }
+
+
+class JsonArrayWriter:
+    """
+    Stream records into a JSON array as they arrive.
+    Records go to `<path>.partial`, which is renamed into place on close.
+    Pretty output is for files read by the Bun importers; otherwise records
+    are compact and compressed as the file suffix says (see scraper.codec).
+    """
+
+    def __init__(self, path: str, pretty: bool = False):
+        self.path = path
+        self.partial_path = f"{path}.partial"
+        self.pretty = pretty
+        self.count = 0
+        self._compressed = codec.compression_of(path) not in (None, "none")
+        self._file = codec.open_stream(self.partial_path)
+        self._file.write(b"[")
+
+    def write(self, record: Record):
+        encoded = codec.dumps(record.to_dict(), pretty=self.pretty)
+        if self.pretty:
+            encoded = b"\n  " + encoded.replace(b"\n", b"\n  ")
+        else:
+            encoded = b"\n" + encoded
+        self._file.write((b"," if self.count else b"") + encoded)
+        if not self._compressed:
+            self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.write(b"\n]" if self.count else b"]")
+        self._file.close()
+        os.replace(self.partial_path, self.path)
+
+
+_STOP = object()
+
+
+class BillsPipeline:
+    """
+    Staged producer/consumer pipeline:
+
+        list pages -> [ids] -> detail fetch -> [html] -> parse -> [raw]
+            -> clean -> [records] -> sink
+
+    Stages are connected by bounded queues, so detail fetches start as soon
+    as the first list page yields IDs and a slow stage applies backpressure
+    upstream. The ID queue is a priority queue (see `bill_priority`). Bills
+    known from earlier runs are queued in priority order while listing
+    starts, and listed bills not seen before join them at the front, so
+    time-sensitive bills are fetched first wherever their list page is.
+    """
+
+    def __init__(
+        self,
+        scraper: "BillsScraper",
+        parliament_types: List[str],
+        output_file: str,
+        cleaned_output_file: Optional[str] = None,
+        deadline: Optional[float] = None,
+        workers: int = DETAIL_WORKERS,
+        queue_size: int = QUEUE_SIZE,
+    ):
+        self.scraper = scraper
+        self.parliament_types = parliament_types
+        self.output_file = output_file
+        self.cleaned_output_file = cleaned_output_file
+        self.deadline = deadline
+        self.workers = workers
+
+        self.previous = load_previous_bills()
+        self.names = NameIndex()
+        previously_deferred = load_deferred_bills()
+        self.priority = bill_priority(self.previous, previously_deferred)
+        self.known = previously_deferred + [(bill.type, bill.bill_id) for bill in self.previous.values()]
+
+        self.id_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=ID_QUEUE_SIZE)
+        self.html_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.raw_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.record_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        self.stages = {
+            "list": StageStats("list"),
+            "fetch": StageStats("fetch", workers),
+            "parse": StageStats("parse"),
+            "clean": StageStats("clean"),
+            "sink": StageStats("sink"),
         }
+        self.queues = [
+            QueueStats("ids", self.id_queue),
+            QueueStats("html", self.html_queue),
+            QueueStats("raw", self.raw_queue),
+            QueueStats("records", self.record_queue),
+        ]
+
+        self.bills: List[RawBill] = []
+        self.deferred: List[Tuple[str, str]] = []
+        self.seen_keys = set()
+        self.queued = set()
+        self.listed = set()
+        self.fully_listed = set()
+        self.written = set()
+        self._seq = 0
+
+    def _budget_spent(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    async def _enqueue(self, pair: Tuple[str, str]) -> bool:
+        """Queue a pair for detail fetch; False if it was queued before."""
+        if pair in self.queued:
+            return False
+        self.queued.add(pair)
+        self._seq += 1
+        await self.id_queue.put((self.priority(pair), self._seq, pair))
+        return True
+
+    async def _seed_known(self):
+        """Queue the deferred and previously cleaned bills of the scraped houses, most urgent first."""
+        bind_log_context(stage="bills.seed")
+        known = {pair for pair in self.known if pair[0] in self.parliament_types}
+        for pair in sorted(known, key=lambda pair: (self.priority(pair), pair)):
+            await self._enqueue(pair)
+        log.info("Queued %d known bills", len(known))
+
+    async def _list_stage(self):
+        stats = self.stages["list"]
+        list_scraper = self.scraper.list_scraper
+        seeding = asyncio.create_task(self._seed_known())
+        try:
+            await self._list_pages(stats, list_scraper)
+            await seeding
+        finally:
+            seeding.cancel()
+
+        for _ in range(self.workers):
+            self._seq += 1
+            await self.id_queue.put((float("inf"), self._seq, _STOP))
+
+    async def _list_pages(self, stats: StageStats, list_scraper: BillListScraper):
+        for parliament_type in self.parliament_types:
+            bind_log_context(stage="bills.list", house=parliament_type)
+            complete = True
+            for bill_type in BILL_TYPES:
+                page = 1
+                while not self._budget_spent():
+                    url = list_scraper.list_page_url(parliament_type, bill_type, page)
+                    log.info("Fetching page %d: %s", page, url)
+
+                    started = time.monotonic()
+                    with span("bills.list_page", house=parliament_type, bill_type=bill_type, page=page) as current:
+                        html = await self.scraper.client.get(url)
+                        bill_ids = await list_scraper.extract_bill_ids_from_page(html) if html else []
+                        current.set(ids=len(bill_ids))
+                    stats.busy_seconds += time.monotonic() - started
+                    stats.items_in += 1
+
+                    if not html:
+                        stats.errors += 1
+                        complete = False
+                        log.warning("Failed to fetch page %d, stopping", page)
+                        break
+                    if not bill_ids:
+                        log.info("No more bills found on page %d, stopping", page)
+                        break
+
+                    for bill_id in bill_ids:
+                        pair = (parliament_type, bill_id)
+                        self.listed.add(pair)
+                        if await self._enqueue(pair):
+                            stats.items_out += 1
+
+                    page += 1
+                    # Small delay to be respectful
+                    await asyncio.sleep(0.5)
+                else:  # the budget ran out before the last page
+                    complete = False
+                    log.warning("Time budget exhausted while listing %s - %s", parliament_type, bill_type)
+            if complete:
+                self.fully_listed.add(parliament_type)
+
+    async def _fetch_worker(self):
+        stats = self.stages["fetch"]
+        detail_scraper = self.scraper.detail_scraper
 
-        return combined
+        while True:
+            _, _, pair = await self.id_queue.get()
+            if pair is _STOP:
+                return
+            if self._budget_spent():
+                self.deferred.append(pair)
+                continue
+
+            parliament_type, bill_id = pair
+            bind_log_context(stage="bills.fetch", house=parliament_type, bill_id=bill_id)
+            stats.items_in += 1
+            started = time.monotonic()
+            with span("bills.fetch", house=parliament_type, bill_id=bill_id):
+                np_html, en_html = await asyncio.gather(
+                    detail_scraper.fetch_bill_detail(parliament_type, bill_id, "np"),
+                    detail_scraper.fetch_bill_detail(parliament_type, bill_id, "en"),
+                )
+            stats.busy_seconds += time.monotonic() - started
+
+            if not np_html and not en_html:
+                stats.errors += 1
+                log.warning("Failed to scrape bill %s in both languages", bill_id)
+            else:
+                await self.html_queue.put((parliament_type, bill_id, np_html, en_html))
+                stats.items_out += 1
+
+            # Small delay between bill requests
+            await asyncio.sleep(0.2)
+
+    async def _fetch_stage(self):
+        await asyncio.gather(*(self._fetch_worker() for _ in range(self.workers)))
+        await self.html_queue.put(_STOP)
+
+    async def _parse_stage(self):
+        stats = self.stages["parse"]
+        detail_scraper = self.scraper.detail_scraper
+
+        while (item := await self.html_queue.get()) is not _STOP:
+            parliament_type, bill_id, np_html, en_html = item
+            bind_log_context(stage="bills.parse", house=parliament_type, bill_id=bill_id)
+            stats.items_in += 1
+            started = time.monotonic()
+            try:
+                with span("bills.parse", house=parliament_type, bill_id=bill_id,
+                          bytes=len(np_html or "") + len(en_html or "")):
+                    np_result = detail_scraper.parse_bill_detail(np_html, parliament_type, bill_id, "np")
+                    en_result = detail_scraper.parse_bill_detail(en_html, parliament_type, bill_id, "en")
+                    bill = detail_scraper.merge_languages(parliament_type, bill_id, np_result, en_result)
+            except Exception as e:
+                stats.errors += 1
+                log.error("Error parsing bill %s: %s", bill_id, e)
+                continue
+            finally:
+                stats.busy_seconds += time.monotonic() - started
+
+            await self.raw_queue.put(bill)
+            stats.items_out += 1
+
+        await self.raw_queue.put(_STOP)
+
+    async def _clean_stage(self):
+        bind_log_context(stage="bills.clean")
+        stats = self.stages["clean"]
+        stopped = False
+
+        while not stopped:
+            # Clean whatever is already waiting as one batch (at least one item)
+            batch = [await self.raw_queue.get()]
+            while len(batch) < CLEAN_BATCH_SIZE and not self.raw_queue.empty():
+                batch.append(self.raw_queue.get_nowait())
+            if batch[-1] is _STOP:
+                batch.pop()
+                stopped = True
+
+            stats.items_in += len(batch)
+            started = time.monotonic()
+            results = []
+            with span("bills.clean_batch", bills=len(batch)):
+                for bill in batch:
+                    cleaned = clean_and_insert_bills.clean_bill(bill)
+                    if cleaned is not None:
+                        key = clean_and_insert_bills.dedup_key(cleaned)
+                        if key in self.seen_keys:
+                            cleaned = None
+                        else:
+                            self.seen_keys.add(key)
+                    results.append((bill, cleaned))
+                cleaned_batch = [cleaned for _, cleaned in results if cleaned]
+                clean_and_insert_bills.normalize_dates(cleaned_batch)
+                clean_and_insert_bills.canonicalize_names(cleaned_batch, self.names)
+            stats.busy_seconds += time.monotonic() - started
+
+            for item in results:
+                await self.record_queue.put(item)
+                stats.items_out += 1
+
+        await self.record_queue.put(_STOP)
+
+    async def _sink_stage(self):
+        bind_log_context(stage="bills.sink")
+        stats = self.stages["sink"]
+        raw_writer = JsonArrayWriter(self.output_file)
+        cleaned_writer = JsonArrayWriter(self.cleaned_output_file, pretty=True) if self.cleaned_output_file else None
+
+        try:
+            while (item := await self.record_queue.get()) is not _STOP:
+                bill, cleaned = item
+                stats.items_in += 1
+                started = time.monotonic()
+                raw_writer.write(bill)
+                self.bills.append(bill)
+                self.written.add((bill.type, bill.bill_id))
+                if cleaned_writer and cleaned is not None:
+                    cleaned_writer.write(cleaned)
+                stats.busy_seconds += time.monotonic() - started
+                stats.items_out += 1
+
+            if cleaned_writer:
+                self._carry_forward(cleaned_writer)
+        finally:
+            raw_writer.close()
+            if cleaned_writer:
+                cleaned_writer.close()
+
+        log.info("Saved %d bills to %s", raw_writer.count, self.output_file)
+        if cleaned_writer:
+            log.info("Saved %d cleaned bills to %s", cleaned_writer.count, self.cleaned_output_file)
+
+    def _carry_forward(self, cleaned_writer: JsonArrayWriter):
+        """
+        Keep the previous cleaned record of every bill not scraped this run
+        (deferred, failed, or on a list page not reached) and defer it, so
+        the next run fetches it first. Bills missing from a house that was
+        listed to the end were removed upstream and are dropped.
+        """
+        deferred = set(self.deferred)
+        carried = 0
+        for previous in self.previous.values():
+            pair = (previous.type, previous.bill_id)
+            if pair in self.written or (pair[0] in self.fully_listed and pair not in self.listed):
+                continue
+            key = clean_and_insert_bills.dedup_key(previous)
+            if key not in self.seen_keys:
+                self.seen_keys.add(key)
+                cleaned_writer.write(previous)
+                carried += 1
+            if pair not in deferred:
+                deferred.add(pair)
+                self.deferred.append(pair)
+        if carried:
+            log.info("Carried %d bills forward from the previous run", carried)
+
+    async def _sample_queues(self):
+        while True:
+            for queue_stats in self.queues:
+                queue_stats.sample()
+            await asyncio.sleep(QUEUE_SAMPLE_SECONDS)
+
+    async def run(self) -> Dict[str, Any]:
+        """Run all stages to completion and return pipeline statistics."""
+        started = time.monotonic()
+        sampler = asyncio.create_task(self._sample_queues())
+        with span("bills.pipeline", houses=",".join(self.parliament_types), workers=self.workers):
+            # Stage tasks are created inside the span so their spans are its children
+            tasks = [
+                asyncio.create_task(self._list_stage()),
+                asyncio.create_task(self._fetch_stage()),
+                asyncio.create_task(self._parse_stage()),
+                asyncio.create_task(self._clean_stage()),
+                asyncio.create_task(self._sink_stage()),
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+            finally:
+                sampler.cancel()
+
+        wall_seconds = time.monotonic() - started
+        return {
+            "wall_seconds": round(wall_seconds, 3),
+            "stages": {name: st.to_dict(wall_seconds) for name, st in self.stages.items()},
+            "queues": {qs.name: qs.to_dict() for qs in self.queues},
+        }
 
 
 # =====================================================================
@@ -346,83 +850,208 @@ class BillsScraper:
         self.list_scraper = BillListScraper(self.client)
         self.detail_scraper = BillDetailScraper(self.client)
 
-    async def scrape_parliament_type(self, parliament_type: str) -> List[Dict]:
-        """Scrape all bills for a given parliament type."""
+    async def scrape_all(
+        self,
+        parliament_types: Optional[List[str]] = None,
+        time_budget: Optional[float] = None,
+        output_file: Optional[str] = None,
+        cleaned_output_file: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Scrape bills from the given houses (default: HoR and NA) through
+        the staged pipeline, streaming raw records to `output_file` and,
+        when given, cleaned records to `cleaned_output_file`.
+
+        With a time budget (seconds), no new bill is dispatched once it runs
+        out; the remaining pairs are returned as deferred and promoted to the
+        front of the next run.
+        """
         log.info("="*60)
-        log.info(f"Scraping bills for {parliament_type}")
+        log.info("Starting Bills Scraper")
         log.info("="*60)
 
-        all_bills = []
-
-        # Get all bill IDs for each bill type
-        for bill_type in BILL_TYPES:
-            log.info(f"Fetching {bill_type} bills for {parliament_type}")
-
-            bill_ids = await self.list_scraper.get_bill_ids_for_type(parliament_type, bill_type)
-            log.info(f"Found {len(bill_ids)} total bills for {parliament_type} - {bill_type}")
-
-            # Scrape each bill's details
-            for i, bill_id in enumerate(bill_ids, 1):
-                log.info(f"[{i}/{len(bill_ids)}] Scraping bill {bill_id}")
-
-                try:
-                    bill_data = await self.detail_scraper.scrape_bill_both_languages(parliament_type, bill_id)
-                    if bill_data:
-                        all_bills.append(bill_data)
-                except Exception as e:
-                    log.error(f"Error scraping bill {bill_id}: {e}")
-
-                # Small delay between bill requests
-                await asyncio.sleep(0.2)
+        pipeline = BillsPipeline(
+            self,
+            parliament_types or list(PARLIAMENT_URLS),
+            output_file or get_output_filename(),
+            cleaned_output_file=cleaned_output_file,
+            deadline=time.monotonic() + time_budget if time_budget is not None else None,
+        )
+        try:
+            stats = await pipeline.run()
+        finally:
+            await self.client.close()
 
-        return all_bills
+        save_deferred_bills(pipeline.deferred)
+        pipeline.names.save()
 
-    async def scrape_all(self) -> List[Dict]:
-        """Scrape all bills from both HoR and NA."""
         log.info("="*60)
-        log.info("Starting Bills Scraper")
+        log.info("Scraping complete! Total bills: %d, deferred: %d", len(pipeline.bills), len(pipeline.deferred))
         log.info("="*60)
 
-        all_bills = []
+        return {
+            "bills": pipeline.bills,
+            "deferred": pipeline.deferred,
+            "output": pipeline.output_file,
+            "cleaned_output": cleaned_output_file,
+            "names": pipeline.names.summary(),
+            "pipeline": stats,
+            "http": self.client.telemetry.summary(),
+        }
 
-        # Scrape HoR
-        try:
-            hor_bills = await self.scrape_parliament_type("HoR")
-            all_bills.extend(hor_bills)
-        except Exception as e:
-            log.error(f"Error scraping HoR: {e}")
 
-        # Scrape NA
-        try:
-            na_bills = await self.scrape_parliament_type("NA")
-            all_bills.extend(na_bills)
-        except Exception as e:
-            log.error(f"Error scraping NA: {e}")
+# =====================================================================
+# CHANGE PROBE
+# =====================================================================
 
-        await self.client.close()
+def fingerprint(value: Any) -> str:
+    """Stable SHA-256 fingerprint of a JSON-serializable value."""
+    encoded = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_terminal_status(label: Optional[str]) -> bool:
+    """Return True when a raw status label means the bill has left parliament."""
+    return bool(label) and label.strip().lower() in TERMINAL_STATUS_LABELS
+
+
+def select_probe_sample(bills: List[Dict], sample_size: int = PROBE_SAMPLE_SIZE) -> List[Tuple[str, str]]:
+    """
+    Pick the most recently active non-terminal bills from a previous run.
+    Returns (parliament_type, bill_id) pairs in a deterministic order.
+    """
+    active = [
+        b for b in bills
+        if b.get("bill_id") and b.get("type") in PARLIAMENT_URLS
+        and not is_terminal_status(b.get("current_status"))
+    ]
+    active.sort(key=lambda b: (b.get("current_status_date") or "", b["bill_id"]), reverse=True)
+    return [(b["type"], b["bill_id"]) for b in active[:sample_size]]
+
+
+async def probe_signature(sample: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Cheap upstream change probe.
+
+    Fetches the first list page of each house plus the English detail page of
+    each sampled bill and fingerprints what the full scrape would see there.
+    Returns {"success", "signature", "requests", "error"}.
+    """
+    client = BillsHTTPClient()
+    list_scraper = BillListScraper(client)
+    detail_scraper = BillDetailScraper(client)
+    signature: Dict[str, str] = {}
+    requests_made = 0
+
+    try:
+        for parliament_type in PARLIAMENT_URLS:
+            for bill_type in BILL_TYPES:
+                url = list_scraper.list_page_url(parliament_type, bill_type, 1)
+                html = await client.get(url)
+                requests_made += 1
+                if not html:
+                    return {
+                        "success": False,
+                        "error": f"Failed to fetch {url}",
+                        "requests": requests_made,
+                    }
+                rows = list_scraper.extract_list_rows(html)
+                signature[f"list:{parliament_type}:{bill_type}"] = fingerprint(rows)
+
+        for parliament_type, bill_id in sample:
+            detail = await detail_scraper.scrape_bill_detail(parliament_type, bill_id, "en")
+            requests_made += 1
+            if not detail:
+                return {
+                    "success": False,
+                    "error": f"Failed to fetch bill {bill_id}",
+                    "requests": requests_made,
+                }
+            signature[f"bill:{parliament_type}:{bill_id}"] = fingerprint(detail)
+    finally:
+        await client.close()
+
+    return {"success": True, "signature": signature, "requests": requests_made}
 
-        log.info("="*60)
-        log.info(f"Scraping complete! Total bills: {len(all_bills)}")
-        log.info("="*60)
 
-        return all_bills
+# =====================================================================
+# PRIORITY SCHEDULING
+# =====================================================================
+
+def load_previous_bills() -> Dict[str, CleanedBill]:
+    """Load the previous run's cleaned bills keyed by bill_id."""
+    try:
+        bills = from_dicts(CleanedBill, codec.read(PREVIOUS_BILLS_FILE))
+    except Exception:
+        return {}
+    return {b.bill_id: b for b in bills if b.bill_id}
+
+
+def load_deferred_bills() -> List[Tuple[str, str]]:
+    """Load (parliament_type, bill_id) pairs deferred by the previous run."""
+    try:
+        return [tuple(pair) for pair in codec.read(DEFERRED_BILLS_FILE)]
+    except Exception:
+        return []
+
+
+def save_deferred_bills(deferred: List[Tuple[str, str]]):
+    """Persist deferred pairs so the next run refreshes them first."""
+    codec.write(DEFERRED_BILLS_FILE, [list(pair) for pair in deferred])
+
+
+def bs_day_number(bs_date: Optional[str]) -> Optional[int]:
+    """Approximate day number of a BS "YYYY-MM-DD" date, for recency comparisons only."""
+    match = re.match(r'^(\d{4})-(\d{1,2})-(\d{1,2})', bs_date or "")
+    if not match:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    return year * 365 + (month - 1) * 30 + day
+
+
+def bill_priority(
+    previous: Dict[str, CleanedBill],
+    deferred: List[Tuple[str, str]],
+) -> Callable[[Tuple[str, str]], int]:
+    """
+    Build a priority function (lower is sooner) for detail fetches:
+    0. deferred by the last run, or not seen before
+    1. non-terminal with a status change in the last RECENT_CHANGE_DAYS
+    2. other non-terminal bills
+    3. terminal bills
+    """
+    deferred_set = set(deferred)
+    day_numbers = [bs_day_number(b.current_status_date) for b in previous.values()]
+    latest_day = max((d for d in day_numbers if d is not None), default=None)
+
+    def priority(pair: Tuple[str, str]) -> int:
+        bill = previous.get(pair[1])
+        if pair in deferred_set or bill is None:
+            return 0
+        if is_terminal_status(bill.current_status):
+            return 3
+        status_day = bs_day_number(bill.current_status_date)
+        if latest_day is not None and status_day is not None and latest_day - status_day <= RECENT_CHANGE_DAYS:
+            return 1
+        return 2
+
+    return priority
 
 
 # =====================================================================
 # OUTPUT HANDLING
 # =====================================================================
 
-def save_to_json(bills: List[Dict], output_file: str):
+def save_to_json(bills: List[RawBill], output_file: str):
     """Save bills data to JSON file."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(bills, f, ensure_ascii=False, indent=2)
-    log.info(f"Saved {len(bills)} bills to {output_file}")
+    codec.write(output_file, to_dicts(bills))
+    log.info("Saved %d bills to %s", len(bills), output_file)
 
 
 def get_output_filename():
     """Generate output filename with timestamp."""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    return str(DATA_DIR / f"bills_{timestamp}.json")
+    return str(DATA_DIR / f"bills_{timestamp}{codec.artifact_suffix()}")
 
 
 # =====================================================================
@@ -438,10 +1067,13 @@ async def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python scrape_bills.py              # Scrape all (HoR + NA)
-  python scrape_bills.py --type HoR  # Scrape only HoR
-  python scrape_bills.py --type NA   # Scrape only NA
-  python scrape_bills.py --output custom.json
+  python -m scraper.bills.scrape_bills              # Scrape all (HoR + NA)
+  python -m scraper.bills.scrape_bills --type HoR  # Scrape only HoR
+  python -m scraper.bills.scrape_bills --type NA   # Scrape only NA
+  python -m scraper.bills.scrape_bills --output custom.json
+  python -m scraper.bills.scrape_bills --time-budget 600
+  python -m scraper.bills.scrape_bills --profile   # CPU/memory profile in data/output/profiles
+  python -m scraper.bills.scrape_bills --trace     # span trace of the run as a trace artifact
         """
     )
 
@@ -456,57 +1088,100 @@ Examples:
         type=str,
         help="Output JSON file path (default: auto-generated with timestamp)"
     )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Stop dispatching bill detail fetches after this many seconds"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write cProfile, folded-stack and tracemalloc output for the run"
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record spans of the run and store them as a trace artifact"
+    )
 
     args = parser.parse_args()
 
+    parliament_types = ["HoR", "NA"] if args.type == "all" else [args.type]
+    profiler = cli_profiler("scrape_bills", enabled=args.profile)
+    trace = start_trace("scrape_bills", enabled=args.trace)
     scraper = BillsScraper()
-    all_bills = []
-
-    if args.type in ["all", "HoR"]:
-        try:
-            hor_bills = await scraper.scrape_parliament_type("HoR")
-            all_bills.extend(hor_bills)
-        except Exception as e:
-            log.error(f"Error scraping HoR: {e}")
-
-    if args.type in ["all", "NA"]:
-        try:
-            na_bills = await scraper.scrape_parliament_type("NA")
-            all_bills.extend(na_bills)
-        except Exception as e:
-            log.error(f"Error scraping NA: {e}")
-
-    await scraper.client.close()
-
-    # Save results
-    output_file = args.output or get_output_filename()
-    save_to_json(all_bills, output_file)
+    with profiler.stage("bills_scrape"):
+        result = await scraper.scrape_all(
+            parliament_types,
+            time_budget=args.time_budget,
+            output_file=args.output or None,
+        )
+    all_bills, deferred, output_file = result["bills"], result["deferred"], result["output"]
 
     # Print summary
-    hor_count = sum(1 for b in all_bills if b["type"] == "HoR")
-    na_count = sum(1 for b in all_bills if b["type"] == "NA")
+    hor_count = sum(1 for b in all_bills if b.type == "HoR")
+    na_count = sum(1 for b in all_bills if b.type == "NA")
 
     log.info("\n" + "="*60)
     log.info("SUMMARY")
     log.info("="*60)
-    log.info(f"Total bills: {len(all_bills)}")
-    log.info(f"  HoR: {hor_count}")
-    log.info(f"  NA:  {na_count}")
-    log.info(f"Output: {output_file}")
+    log.info("Total bills: %d", len(all_bills))
+    log.info("  HoR: %d", hor_count)
+    log.info("  NA:  %d", na_count)
+    log.info("Deferred: %d", len(deferred))
+    log.info("Output: %s", output_file)
+    for name, stage in result["pipeline"]["stages"].items():
+        log.info(
+            "  %-6s %5d items, %s items/s, utilization %s",
+            name, stage["items_out"], stage["items_per_second"], stage["utilization"],
+        )
+    log_summary(profiler)
+    if trace is not None:
+        end_trace(trace)
+        entry = ArtifactStore().put("trace", export_trace(trace))
+        log.info("Trace: %s (%d spans)", entry["name"], len(trace.spans))
     log.info("="*60 + "\n")
 
 
-async def scrape_all():
-    """Function for importing and running from main.py."""
-    scraper = BillsScraper()
-    all_bills = await scraper.scrape_all()
-
-    # Save results
-    output_file = get_output_filename()
-    save_to_json(all_bills, output_file)
+async def scrape_all(time_budget: Optional[float] = None, run_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Function for importing and running from main.py.
 
-    return all_bills
+    Streams raw bills to a new artifact and cleaned bills to
+    bills_cleaned.json, indexing both in the artifact store under `run_id`.
+    Returns a summary dict; bills deferred by the time budget are listed by
+    id, and queue/stage statistics are under "pipeline".
+    """
+    started_at = time.monotonic()
+    store = ArtifactStore()
+    scraper = BillsScraper()
+    result = await scraper.scrape_all(
+        time_budget=time_budget,
+        output_file=str(store.new_path("bills_raw")),
+        cleaned_output_file=str(PREVIOUS_BILLS_FILE),
+    )
+    register_artifact("bills_raw", result["output"], run_id, store)
+    register_artifact("bills_cleaned", result["cleaned_output"], run_id, store)
+    all_bills = result["bills"]
+
+    return {
+        "success": True,
+        "total_bills": len(all_bills),
+        "hor_count": sum(1 for b in all_bills if b.type == "HoR"),
+        "na_count": sum(1 for b in all_bills if b.type == "NA"),
+        "output": result["output"],
+        "cleaned_output": result["cleaned_output"],
+        "names": result["names"],
+        "duration_seconds": time.monotonic() - started_at,
+        "time_budget_seconds": time_budget,
+        "deferred_count": len(result["deferred"]),
+        "deferred": [bill_id for _, bill_id in result["deferred"]],
+        "pipeline": result["pipeline"],
+        "http": result["http"],
+    }
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(main())
@@ -0,0 +1,182 @@
+"""
+Bikram Sambat (BS) to Gregorian (AD) date conversion.
+
+Conversion uses a precomputed table of BS month lengths (2000-2100 BS,
+generated from the `nepali-datetime` calendar data) turned into cumulative
+day offsets at import time, so a conversion is a couple of lookups and an
+addition. Results are memoized per input string, and `bs_to_ad_many`
+converts each distinct value of a batch only once.
+"""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Days in each BS month, Baisakh..Chaitra
+BS_MONTH_DAYS: Dict[int, Tuple[int, ...]] = {
+    2000: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2001: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2002: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2003: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2004: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2005: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2006: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2007: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2008: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31),
+    2009: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2010: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2011: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2012: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2013: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2014: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2015: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2016: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2017: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2018: (31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2019: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2020: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2021: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2022: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2023: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2024: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2025: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2026: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2027: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2028: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2029: (31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30),
+    2030: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2031: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2032: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2033: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2034: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2035: (30, 32, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31),
+    2036: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2037: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2038: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2039: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2040: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2041: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2042: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2043: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2044: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2045: (31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2046: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2047: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2048: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2049: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2050: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2051: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2052: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2053: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2054: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2055: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2056: (31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30),
+    2057: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2058: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2059: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2060: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2061: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2062: (31, 31, 31, 32, 31, 31, 29, 30, 29, 30, 29, 31),
+    2063: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2064: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2065: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2066: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31),
+    2067: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2068: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2069: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2070: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2071: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2072: (31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2073: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2074: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2075: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2076: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2077: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2078: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2079: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2080: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2081: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2082: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2083: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2084: (31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30),
+    2085: (31, 32, 31, 32, 30, 31, 30, 30, 29, 30, 30, 30),
+    2086: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2087: (31, 31, 32, 31, 31, 31, 30, 29, 30, 30, 30, 30),
+    2088: (30, 31, 32, 32, 30, 31, 30, 30, 29, 30, 30, 30),
+    2089: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2090: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2091: (31, 31, 32, 31, 31, 31, 30, 30, 29, 30, 30, 30),
+    2092: (30, 31, 32, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2093: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2094: (31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30),
+    2095: (31, 31, 32, 31, 31, 31, 30, 29, 30, 30, 30, 30),
+    2096: (30, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2097: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2098: (31, 31, 32, 31, 31, 31, 29, 30, 29, 30, 29, 31),
+    2099: (31, 31, 32, 31, 31, 31, 30, 29, 29, 30, 30, 30),
+    2100: (31, 32, 31, 32, 30, 31, 30, 29, 30, 29, 30, 30),
+}
+
+# 1 Baisakh 2000 BS
+BS_EPOCH_YEAR = 2000
+AD_EPOCH = date(1943, 4, 14)
+
+_DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+_BS_DATE_RE = re.compile(r"^\s*(\d{4})\s*[-/.]\s*(\d{1,2})\s*[-/.]\s*(\d{1,2})\s*$")
+
+
+def _build_offsets() -> Dict[int, Tuple[int, ...]]:
+    """Days from the epoch to the first day of each month, per BS year."""
+    offsets: Dict[int, Tuple[int, ...]] = {}
+    days = 0
+    for year in sorted(BS_MONTH_DAYS):
+        month_starts = []
+        for length in BS_MONTH_DAYS[year]:
+            month_starts.append(days)
+            days += length
+        offsets[year] = tuple(month_starts)
+    return offsets
+
+
+_MONTH_START_OFFSETS = _build_offsets()
+_AD_EPOCH_ORDINAL = AD_EPOCH.toordinal()
+
+
+def parse_bs_date(value: str) -> Optional[Tuple[int, int, int]]:
+    """Parse "YYYY-MM-DD" (ASCII or Devanagari digits, - / . separators)."""
+    match = _BS_DATE_RE.match(value.translate(_DEVANAGARI_DIGITS))
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def bs_ymd_to_ad(year: int, month: int, day: int) -> Optional[date]:
+    """Convert a BS year/month/day to an AD date; None when out of range."""
+    month_starts = _MONTH_START_OFFSETS.get(year)
+    if month_starts is None or not 1 <= month <= 12:
+        return None
+    if not 1 <= day <= BS_MONTH_DAYS[year][month - 1]:
+        return None
+    return date.fromordinal(_AD_EPOCH_ORDINAL + month_starts[month - 1] + day - 1)
+
+
+@lru_cache(maxsize=65536)
+def bs_to_ad(value: Optional[str]) -> Optional[str]:
+    """Convert a BS date string to an ISO AD date string, or None."""
+    if not value:
+        return None
+    parts = parse_bs_date(value)
+    if parts is None:
+        return None
+    converted = bs_ymd_to_ad(*parts)
+    return converted.isoformat() if converted else None
+
+
+def bs_to_ad_many(values: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """Convert a batch of BS date strings, converting each distinct value once."""
+    values = list(values)
+    converted = {value: bs_to_ad(value) for value in set(values)}
+    return [converted[value] for value in values]
+
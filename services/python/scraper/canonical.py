@@ -0,0 +1,282 @@
+"""
+Canonical presenters and ministries for the bills cleaner.
+
+Presenter and ministry strings are typed by hand on the parliament site:
+"मा. रामनाथ  अधिकारी" (double space), "Hon. Ramnath AdhikarI", "वर्षमान पुन
+'अनन्त'" next to "मा. बर्षमान पुन", "गैर सरकारी" next to "गैरसरकारी विधेयक".
+Stored verbatim they split per-presenter and per-ministry counts. This maps
+each variant to a stable entity id ("P00012", "M00003") and a canonical
+display name, so cleaned bills carry the same text for the same entity.
+
+Matching, cheapest first:
+
+1. alias     the exact variant (after whitespace and Unicode cleanup) was
+             seen before; every resolved variant is added, so the alias
+             table doubles as the memo of fuzzy lookups
+2. phonetic  the same phonetic key: honorifics, roles ("मा.", "Hon.",
+             "गृहमन्त्री"), nicknames in quotes and remarks in parentheses
+             dropped; vowel length, sibilants, aspiration, virama and word
+             breaks folded ("विष्णुप्रसाद" = "विष्णु प्रसाद", "Bisnu" = "Bishnu")
+3. fuzzy     entities sharing trigrams with the phonetic key, accepted when
+             the SequenceMatcher ratio is >= FUZZY_THRESHOLD ("Bhnadari")
+
+A bill's Nepali and English values name one entity: when only one of them
+resolves, the other becomes its alias, which pairs "मा. रामनाथ अधिकारी"
+with "Hon. Ramnath Adhikari" (Nepali wins when they disagree). Unresolved
+pairs become new entities. Each alias remembers which value ("np" or "en")
+it was given as; the display names of an entity are its most frequent
+Devanagari alias given as a Nepali value and its most frequent
+non-Devanagari alias given as an English value. A value the entity has no
+such name for is kept as given, so Nepali text in an English field stays
+where it is.
+
+The table persists in data/canonical_names.json, so ids are stable across
+runs; entities can be merged by hand by moving aliases between them.
+
+    python -m scraper.canonical                 # entities of the stored table
+    python -m scraper.canonical --kind ministry
+"""
+
+import argparse
+import logging
+import os
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from scraper import codec
+from scraper.logs import configure_logging
+from scraper.search import normalize, tokenize, trigrams
+
+
+log = logging.getLogger(__name__)
+
+
+NAMES_FILE = Path(__file__).resolve().parent.parent / "data" / "canonical_names.json"
+FUZZY_THRESHOLD = float(os.getenv("SCRAPER_NAME_FUZZY_THRESHOLD", "0.85"))
+
+# Kinds: id prefix and words dropped from the phonetic key
+KINDS = {
+    "presenter": ("P", {
+        "मा", "माननीय", "सम्माननीय", "डा", "डाक्टर",
+        "hon", "hons", "honble", "honorable", "honourable", "rt", "mp", "mps", "m", "ps", "dr", "minister", "ministers",
+    }),
+    "ministry": ("M", {"विधेयक", "bill", "the", "of", "and"}),
+}
+# Presenter roles end a prefix: "गृहमन्त्री मा. नारायणकाजी श्रेष्ठ", "Prime ministers K.P Sharma Oli"
+ROLE_SUFFIXES = ("मन्त्री",)
+ASIDE = re.compile(r"\([^()]*\)?|'[^']*'|\"[^\"]*\"|‘[^’]*’")
+SPACES = re.compile(r"\s+")
+DEVANAGARI = re.compile("[\u0900-\u097f]")
+ZERO_WIDTH = re.compile("[​‌‍﻿­]")
+
+_DEVANAGARI_FOLD = str.maketrans({
+    "ी": "ि", "ू": "ु", "ई": "इ", "ऊ": "उ", "श": "स", "ष": "स", "व": "ब",
+    "ण": "न", "ङ": "न", "ञ": "न", "ं": "न", "्": None, "ः": None,
+})
+_LATIN_FOLD = [
+    (re.compile(r"[^a-z]"), ""),
+    (re.compile(r"([kgcjtdpb])h"), r"\1"),
+    (re.compile(r"sh"), "s"),
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"[wv]"), "b"),
+    (re.compile(r"ee|y"), "i"),
+    (re.compile(r"oo"), "u"),
+    (re.compile(r"ou"), "au"),
+]
+_REPEATS = re.compile(r"(.)\1+")
+
+
+# =====================================================================
+# KEYS
+# =====================================================================
+
+def display(text: Optional[str]) -> str:
+    """Variant as shown: zero-width characters removed, whitespace collapsed."""
+    return SPACES.sub(" ", ZERO_WIDTH.sub("", text or "")).strip()
+
+
+def is_devanagari(text: str) -> bool:
+    """Whether the text has any Devanagari letter (a curly apostrophe does not make it Nepali)."""
+    return DEVANAGARI.search(text) is not None
+
+
+def phonetic_key(text: str, kind: str) -> str:
+    """Spelling-insensitive key of a name (see the module docstring)."""
+    tokens = tokenize(ASIDE.sub(" ", normalize(text).replace("&", " and ")))
+    dropped = KINDS[kind][1]
+    if kind == "presenter":
+        # Everything up to the last honorific or role is a title
+        last = max(
+            (index for index, token in enumerate(tokens) if token in dropped or token.endswith(ROLE_SUFFIXES)),
+            default=-1,
+        )
+        tokens = tokens[last + 1:]
+    key = "".join(token for token in tokens if token not in dropped)
+    if not is_devanagari(key):
+        for pattern, replacement in _LATIN_FOLD:
+            key = pattern.sub(replacement, key)
+    else:
+        key = key.translate(_DEVANAGARI_FOLD)
+    return _REPEATS.sub(r"\1", key)
+
+
+# =====================================================================
+# NAME TABLE
+# =====================================================================
+
+class NameTable:
+    """Entities of one kind with their aliases and lookup indexes."""
+
+    def __init__(self, kind: str, data: Optional[Dict[str, Any]] = None) -> None:
+        self.kind = kind
+        self.prefix = KINDS[kind][0]
+        data = data or {}
+        self.next_id = data.get("next", 1)
+        self.entities: Dict[str, Dict[str, int]] = {}
+        # Entity id -> alias -> values it was given as ("np", "en")
+        self.sources: Dict[str, Dict[str, Set[str]]] = {}
+        self.by_alias: Dict[str, str] = {}
+        self.by_key: Dict[str, str] = {}
+        self.by_trigram: Dict[str, Set[str]] = {}
+        self.stats = Counter()
+        sources = data.get("sources", {})
+        for entity_id, aliases in data.get("entities", {}).items():
+            self.entities[entity_id] = {}
+            self.sources[entity_id] = {}
+            for alias, count in aliases.items():
+                # Tables written before sources were kept: go by script
+                given = sources.get(entity_id, {}).get(alias) or ["np" if is_devanagari(alias) else "en"]
+                self._add(entity_id, alias, given[0], count)
+                self.sources[entity_id][alias].update(given)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "next": self.next_id,
+            "entities": self.entities,
+            "sources": {
+                entity_id: {alias: sorted(given) for alias, given in aliases.items()}
+                for entity_id, aliases in self.sources.items()
+            },
+        }
+
+    def _add(self, entity_id: str, alias: str, source: str, count: int = 1) -> None:
+        aliases = self.entities[entity_id]
+        aliases[alias] = aliases.get(alias, 0) + count
+        self.sources[entity_id].setdefault(alias, set()).add(source)
+        self.by_alias.setdefault(normalize(alias), entity_id)
+        key = phonetic_key(alias, self.kind)
+        if key and key not in self.by_key:
+            self.by_key[key] = entity_id
+            for gram in trigrams(key):
+                self.by_trigram.setdefault(gram, set()).add(key)
+
+    def _fuzzy(self, key: str) -> Optional[str]:
+        grams = trigrams(key)
+        shared = Counter(candidate for gram in grams for candidate in self.by_trigram.get(gram, ()))
+        best, best_ratio = None, FUZZY_THRESHOLD
+        for candidate, count in shared.items():
+            # A ratio of r needs about r of the trigrams in common; skip the rest unscored
+            if count < len(grams) * (FUZZY_THRESHOLD - 0.25):
+                continue
+            ratio = SequenceMatcher(None, key, candidate, autojunk=False).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = candidate, ratio
+        return self.by_key[best] if best else None
+
+    def resolve(self, text: str) -> Optional[str]:
+        """Entity id of a variant, or None when nothing matches."""
+        entity_id = self.by_alias.get(normalize(text))
+        if entity_id:
+            self.stats["alias"] += 1
+            return entity_id
+        key = phonetic_key(text, self.kind)
+        if not key:
+            return None
+        entity_id = self.by_key.get(key)
+        if entity_id:
+            self.stats["phonetic"] += 1
+            return entity_id
+        entity_id = self._fuzzy(key)
+        if entity_id:
+            self.stats["fuzzy"] += 1
+        return entity_id
+
+    def canonicalize(self, name: Optional[str], name_en: Optional[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """(entity id, canonical name, canonical English name) of a bill's pair of values."""
+        variants = [(variant, source) for variant, source in ((display(name), "np"), (display(name_en), "en")) if variant]
+        if not variants:
+            return None, name, name_en
+        resolved = [self.resolve(variant) for variant, _ in variants]
+        entity_id = next((found for found in resolved if found), None)
+        if entity_id is None:
+            entity_id = f"{self.prefix}{self.next_id:05d}"
+            self.next_id += 1
+            self.entities[entity_id] = {}
+            self.sources[entity_id] = {}
+            self.stats["created"] += 1
+        elif len(set(filter(None, resolved))) > 1:
+            self.stats["conflicts"] += 1
+            log.debug("%s %r and %r resolve to different entities %s", self.kind, name, name_en, resolved)
+        for variant, source in variants:
+            self._add(entity_id, variant, source)
+        canonical, canonical_en = self.names(entity_id)
+        return entity_id, (canonical or name) if name else name, (canonical_en or name_en) if name_en else name_en
+
+    def names(self, entity_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """Most frequent Nepali and English variants of an entity."""
+        aliases = self.entities[entity_id]
+        best: Dict[str, str] = {}
+        for alias, given in self.sources[entity_id].items():
+            source = "np" if is_devanagari(alias) else "en"
+            if source in given and (source not in best or aliases[alias] > aliases[best[source]]):
+                best[source] = alias
+        return best.get("np"), best.get("en")
+
+
+class NameIndex:
+    """Presenter and ministry tables, persisted together."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path or NAMES_FILE)
+        data = codec.read(self.path) if self.path.exists() else {}
+        self.tables = {kind: NameTable(kind, data.get(kind)) for kind in KINDS}
+
+    def save(self) -> None:
+        codec.write(self.path, {"version": 1, **{kind: table.to_dict() for kind, table in self.tables.items()}}, pretty=True)
+
+    def canonicalize_bill(self, bill: Any) -> None:
+        """Set presenter/ministry (and _en, _id) of a cleaned bill to their canonical values."""
+        for kind, table in self.tables.items():
+            entity_id, name, name_en = table.canonicalize(getattr(bill, kind), getattr(bill, f"{kind}_en"))
+            setattr(bill, f"{kind}_id", entity_id)
+            setattr(bill, kind, name)
+            setattr(bill, f"{kind}_en", name_en)
+
+    def summary(self) -> Dict[str, Any]:
+        return {kind: {"entities": len(table.entities), **table.stats} for kind, table in self.tables.items()}
+
+
+# =====================================================================
+# CLI
+# =====================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List canonical presenters and ministries")
+    parser.add_argument("--kind", choices=list(KINDS), default="presenter")
+    args = parser.parse_args()
+
+    table = NameIndex().tables[args.kind]
+    rows: List[Tuple[str, int, str, str]] = []
+    for entity_id, aliases in table.entities.items():
+        name, name_en = table.names(entity_id)
+        rows.append((entity_id, len(aliases), name or "", name_en or ""))
+    for entity_id, count, name, name_en in rows:
+        print(f"{entity_id}  {count:>3} variants  {name}  |  {name_en}")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    main()
@@ -0,0 +1,171 @@
+"""
+Serialization for pipeline artifacts and state files.
+
+Every reader and writer goes through this module so the on-disk format is
+chosen in one place:
+
+- Files read by the Bun importers (bills_cleaned.json,
+  committees_cleaned.json) are written as pretty JSON (`pretty=True`).
+- Internal hand-offs (raw scrape files, run reports, state files) are
+  compact JSON, optionally compressed. The compression is picked from
+  SCRAPER_ARTIFACT_COMPRESSION (none, gzip or zstd) when a file name is
+  created and recognised from the suffix when it is read, so files written
+  under different settings stay readable.
+
+orjson and zstandard are used when installed; the stdlib json and gzip
+modules are the fallback.
+"""
+
+import gzip
+import io
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional, gzip is used instead
+    zstandard = None
+
+
+log = logging.getLogger(__name__)
+
+
+PathLike = Union[str, Path]
+
+SUFFIXES = {
+    "none": ".json",
+    "gzip": ".json.gz",
+    "zstd": ".json.zst",
+}
+
+COMPRESSION = os.getenv("SCRAPER_ARTIFACT_COMPRESSION", "none").strip().lower()
+GZIP_LEVEL = int(os.getenv("SCRAPER_GZIP_LEVEL", "6"))
+ZSTD_LEVEL = int(os.getenv("SCRAPER_ZSTD_LEVEL", "10"))
+
+
+# =====================================================================
+# FORMAT SELECTION
+# =====================================================================
+
+def resolve_compression(compression: Optional[str] = None) -> str:
+    """Configured compression, falling back to gzip when zstandard is missing."""
+    compression = (compression or COMPRESSION).lower()
+    if compression not in SUFFIXES:
+        log.warning("Unknown artifact compression %r; writing plain JSON.", compression)
+        return "none"
+    if compression == "zstd" and zstandard is None:
+        log.warning("zstandard is not installed; compressing artifacts with gzip.")
+        return "gzip"
+    return compression
+
+
+def artifact_suffix(compression: Optional[str] = None) -> str:
+    """File suffix for a new internal artifact, e.g. ".json" or ".json.gz"."""
+    return SUFFIXES[resolve_compression(compression)]
+
+
+def compression_of(path: PathLike) -> Optional[str]:
+    """Compression implied by a file name, or None for non-artifacts."""
+    name = str(path)
+    for compression, suffix in sorted(SUFFIXES.items(), key=lambda item: -len(item[1])):
+        if name.endswith(suffix):
+            return compression
+    return None
+
+
+def is_artifact(path: PathLike) -> bool:
+    return compression_of(path) is not None
+
+
+def glob_artifacts(directory: Path, pattern: str) -> List[Path]:
+    """Artifacts in `directory` whose name without suffix matches `pattern`."""
+    return [path for suffix in SUFFIXES.values() for path in directory.glob(pattern + suffix)]
+
+
+# =====================================================================
+# ENCODING
+# =====================================================================
+
+def dumps(obj: Any, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode to UTF-8 JSON bytes (non-ASCII kept as is)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those
+
+    if pretty:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, default=default)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+    return text.encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return data
+
+
+def decompress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .json.zst artifacts")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+# =====================================================================
+# FILES
+# =====================================================================
+
+def write(path: PathLike, obj: Any, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> int:
+    """
+    Atomically write `obj` to `path`, compressed as its suffix says.
+    Returns the number of bytes written.
+    """
+    data = compress(dumps(obj, pretty=pretty, default=default), compression_of(path) or "none")
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    partial = f"{path}.partial"
+    with open(partial, "wb") as f:
+        f.write(data)
+    os.replace(partial, path)
+    return len(data)
+
+
+def read(path: PathLike) -> Any:
+    """Read an artifact written by `write` (or any plain JSON file)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return loads(decompress(data, compression_of(path)))
+
+
+def open_stream(path: PathLike) -> BinaryIO:
+    """Binary stream that compresses as the suffix of `path` says."""
+    compression = compression_of(str(path).removesuffix(".partial"))
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=GZIP_LEVEL)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, "wb"))
+    return io.open(path, "wb")
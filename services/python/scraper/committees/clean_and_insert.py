@@ -10,17 +10,17 @@ This module is responsible for:
 Create your implementation here.
 """
 
-import json
 import logging
 import re
-import sys
 from pathlib import Path
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s - %(message)s"
-)
+from scraper import codec
+from scraper.artifacts import ArtifactStore, register_artifact
+from scraper.logs import configure_logging
+from scraper.records import CleanedCommittee, RawCommittee, to_dicts
+from scraper.tracing import span
+
+
 log = logging.getLogger(__name__)
 
 # Paths
@@ -60,25 +60,22 @@ def normalize_intro_text(value: str) -> str:
 
 
 def load_committees_data(file_path: str = None):
-    """Load committees data from JSON file."""
+    """Load committees data from JSON file (default: the latest raw committees artifact)."""
     if file_path is None:
-        # Find the latest committees file
-        output_dir = Path(__file__).parent.parent.parent / "data" / "output"
-        committees_files = list(output_dir.glob("committees_*.json"))
-        if committees_files:
-            file_path = str(max(committees_files, key=lambda p: p.stat().st_mtime))
+        latest = ArtifactStore().latest_path("committees_raw")
+        if latest is not None:
+            file_path = str(latest)
         else:
             # Try default location in scraper directory
-            files = list(DATA_DIR.glob("committees_*.json"))
+            files = codec.glob_artifacts(DATA_DIR, "committees_*")
             if files:
                 file_path = str(max(files, key=lambda p: p.stat().st_mtime))
             else:
                 file_path = str(DATA_DIR / "committees.json")
 
-    log.info(f"Loading committees data from: {file_path}")
+    log.info("Loading committees data from: %s", file_path)
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return codec.read(file_path)
 
 
 def clean_and_normalize(committees: list) -> list:
@@ -95,69 +92,60 @@ def clean_and_normalize(committees: list) -> list:
     seen_slugs = set()  # Track (house, slug) for dedup
 
     for committee in committees:
+        if isinstance(committee, dict):
+            committee = RawCommittee.from_dict(committee)
+
         # Create a cleaned copy
-        cleaned = {
-            "house": committee.get("house"),
-            "houseEnum": committee.get("houseEnum"),  # pratinidhi_sabha or rastriya_sabha
-            "slug": committee.get("slug"),
-            "nameNp": normalize_inline_text(committee.get("nameNp", "")),
-            "nameEn": normalize_inline_text(committee.get("nameEn", "")),
-            "introductionNp": normalize_intro_text(
-                committee.get("introductionNp", "")
-            ),
-            "introductionEn": normalize_intro_text(
-                committee.get("introductionEn", "")
-            ),
-            "chairperson": normalize_inline_text(
-                committee.get("chairperson", "")
-            ),
-            "chairpersonNp": normalize_inline_text(
-                committee.get("chairpersonNp", "")
-            ),
-            "chairpersonEn": normalize_inline_text(
-                committee.get("chairpersonEn", "")
-            ),
-            "secretaryNp": normalize_inline_text(
-                committee.get("secretaryNp", "")
-            ),
-            "secretaryEn": normalize_inline_text(
-                committee.get("secretaryEn", "")
-            ),
-            "menuLinksNp": committee.get("menuLinksNp", {}) or {},
-            "menuLinksEn": committee.get("menuLinksEn", {}) or {},
-            "membersPageUrlNp": committee.get("membersPageUrlNp"),
-            "membersPageUrlEn": committee.get("membersPageUrlEn"),
-            "parliamentUrlNp": committee.get("parliamentUrlNp"),
-            "parliamentUrlEn": committee.get("parliamentUrlEn"),
-        }
+        cleaned = CleanedCommittee(
+            house=committee.house,
+            houseEnum=committee.houseEnum,  # pratinidhi_sabha or rastriya_sabha
+            slug=committee.slug,
+            nameNp=normalize_inline_text(committee.nameNp),
+            nameEn=normalize_inline_text(committee.nameEn),
+            introductionNp=normalize_intro_text(committee.introductionNp),
+            introductionEn=normalize_intro_text(committee.introductionEn),
+            chairperson=normalize_inline_text(committee.chairperson),
+            chairpersonNp=normalize_inline_text(committee.chairpersonNp),
+            chairpersonEn=normalize_inline_text(committee.chairpersonEn),
+            secretaryNp=normalize_inline_text(committee.secretaryNp),
+            secretaryEn=normalize_inline_text(committee.secretaryEn),
+            menuLinksNp=committee.menuLinksNp or {},
+            menuLinksEn=committee.menuLinksEn or {},
+            membersPageUrlNp=committee.membersPageUrlNp,
+            membersPageUrlEn=committee.membersPageUrlEn,
+            parliamentUrlNp=committee.parliamentUrlNp,
+            parliamentUrlEn=committee.parliamentUrlEn,
+        )
 
         # Skip committees without essential identifiers
-        if not cleaned.get("slug") or not cleaned.get("house"):
-            log.warning(f"Skipping committee with missing slug or house")
+        if not cleaned.slug or not cleaned.house:
+            log.warning("Skipping committee with missing slug or house")
             continue
 
         # Deduplicate by (house, slug)
-        dedup_key = f"{cleaned.get('house')}_{cleaned.get('slug')}"
+        dedup_key = f"{cleaned.house}_{cleaned.slug}"
         if dedup_key in seen_slugs:
-            log.debug(f"Skipping duplicate committee: {dedup_key}")
+            log.debug("Skipping duplicate committee: %s", dedup_key)
             continue
         seen_slugs.add(dedup_key)
 
         cleaned_committees.append(cleaned)
 
-    log.info(f"Cleaned {len(cleaned_committees)} committees (from {len(committees)} raw, {len(committees) - len(cleaned_committees)} removed)")
+    log.info(
+        "Cleaned %d committees (from %d raw, %d removed)",
+        len(cleaned_committees), len(committees), len(committees) - len(cleaned_committees),
+    )
     return cleaned_committees
 
 
-def save_cleaned_data(committees: list):
+def save_cleaned_data(committees: list, run_id: str = None):
     """Save cleaned committees data to JSON file."""
-    output_dir = Path(__file__).parent.parent.parent / "data" / "output"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    output_file = output_dir / "committees_cleaned.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(committees, f, ensure_ascii=False, indent=2)
-    log.info(f"Saved cleaned data to: {output_file}")
+    store = ArtifactStore()
+    output_file = store.new_path("committees_cleaned")
+    # Read by the Bun importer: keep pretty JSON
+    codec.write(output_file, to_dicts(committees), pretty=True)
+    register_artifact("committees_cleaned", output_file, run_id, store)
+    log.info("Saved cleaned data to: %s", output_file)
 
     return output_file
 
@@ -173,7 +161,7 @@ def insert_to_database(committees: list):
     return {"success": True, "inserted_count": 0}
 
 
-def main():
+def main(file_path: str = None, run_id: str = None):
     """Main entry point."""
     try:
         log.info("="*60)
@@ -181,17 +169,20 @@ def main():
         log.info("="*60)
 
         # Load data
-        committees = load_committees_data()
-        log.info(f"Loaded {len(committees)} committees")
+        committees = load_committees_data(file_path)
+        log.info("Loaded %d committees", len(committees))
 
         # Clean and normalize
-        cleaned_committees = clean_and_normalize(committees)
+        with span("committees.clean", committees=len(committees)):
+            cleaned_committees = clean_and_normalize(committees)
 
         # Save cleaned data
-        output_file = save_cleaned_data(cleaned_committees)
+        with span("committees.save", committees=len(cleaned_committees)):
+            output_file = save_cleaned_data(cleaned_committees, run_id)
 
         # Insert into database (delegated to Bun script)
         result = insert_to_database(cleaned_committees)
+        result["output"] = str(output_file)
 
         log.info("="*60)
         log.info("Completed!")
@@ -200,9 +191,10 @@ def main():
         return result
 
     except Exception as e:
-        log.error(f"Error: {e}", exc_info=True)
+        log.error("Error: %s", e, exc_info=True)
         return {"success": False, "error": str(e)}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
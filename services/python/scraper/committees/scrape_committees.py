@@ -7,13 +7,18 @@ Scrapes committee detail pages for:
 - NA  (National Assembly)
 
 Each committee is scraped in both Nepali and English.
+
+Usage (from services/python):
+    python -m scraper.committees.scrape_committees
+    python -m scraper.committees.scrape_committees --type NA --sequential
 """
 
 import argparse
 import asyncio
-import json
 import logging
+import os
 import re
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -22,18 +27,21 @@ from urllib.parse import urljoin
 import httpx
 from bs4 import BeautifulSoup
 
+from scraper import codec
+from scraper.artifacts import ArtifactStore, register_artifact
+from scraper.concurrency import HostLimiter
+from scraper.logs import configure_logging, log_context
+from scraper.profiling import cli_profiler, log_summary
+from scraper.telemetry import RequestTelemetry
+from scraper.tracing import end_trace, export_trace, span, start_trace
+from scraper.records import RawCommittee, to_dicts
+
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 log = logging.getLogger(__name__)
 
 
 BASE_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = BASE_DIR.parent.parent / "data" / "output"
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
 PARLIAMENT_URLS = {
@@ -41,6 +49,10 @@ PARLIAMENT_URLS = {
     "NA": "https://na.parliament.gov.np",
 }
 
+# Concurrent mode fetches every house/slug/language at once, bounded by
+# the per-host limit; set to 0 to scrape one page at a time.
+CONCURRENT = os.getenv("SCRAPER_COMMITTEES_CONCURRENT", "1") != "0"
+
 HOUSE_MAPPING = {
     "HoR": "pratinidhi_sabha",
     "NA": "rastriya_sabha",
@@ -176,9 +188,15 @@ def extract_people_roles(soup: BeautifulSoup) -> Dict[str, str]:
 
 
 class CommitteesHTTPClient:
-    """HTTP client for committee scraping."""
+    """HTTP client for committee scraping, limited per host."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        limiter: Optional[HostLimiter] = None,
+        telemetry: Optional[RequestTelemetry] = None,
+    ) -> None:
+        self.limiter = limiter or HostLimiter()
+        self.telemetry = telemetry or RequestTelemetry("committees")
         self.client = httpx.AsyncClient(
             timeout=30.0,
             verify=False,
@@ -199,10 +217,13 @@ class CommitteesHTTPClient:
 
     async def close(self) -> None:
         await self.client.aclose()
+        self.telemetry.close()
 
     async def get_html(self, url: str) -> Optional[str]:
         try:
-            response = await self.client.get(url)
+            queued_at = time.perf_counter()
+            async with self.limiter.slot(url):
+                response = await self.telemetry.fetch(self.client, url, queued_at)
             response.raise_for_status()
             return response.text
         except httpx.HTTPStatusError as exc:
@@ -233,18 +254,19 @@ class CommitteeDetailScraper:
         if not html:
             return {}
 
-        soup = BeautifulSoup(html, "lxml")
+        with span("committees.parse", house=house, slug=slug, lang=lang, bytes=len(html)):
+            soup = BeautifulSoup(html, "lxml")
 
-        title_el = soup.select_one("section.single-post h1") or soup.find("h1")
-        intro_el = soup.select_one("div.committee-description")
+            title_el = soup.select_one("section.single-post h1") or soup.find("h1")
+            intro_el = soup.select_one("div.committee-description")
 
-        intro_text = ""
-        if intro_el:
-            intro_text = clean_text(intro_el.get_text("\n", strip=True))
+            intro_text = ""
+            if intro_el:
+                intro_text = clean_text(intro_el.get_text("\n", strip=True))
 
-        people = extract_people_roles(soup)
-        menu_links = extract_menu_links(soup, base_url)
-        members_page_url = extract_members_page_url(soup, base_url)
+            people = extract_people_roles(soup)
+            menu_links = extract_menu_links(soup, base_url)
+            members_page_url = extract_members_page_url(soup, base_url)
 
         return {
             "house": house,
@@ -265,15 +287,22 @@ class CommitteeDetailScraper:
         self,
         house: str,
         slug: str,
-    ) -> Dict[str, Any]:
+        concurrent: bool = False,
+    ) -> Optional[RawCommittee]:
         base_url = PARLIAMENT_URLS[house]
 
-        np_data = await self.scrape_committee_detail(house, slug, "np")
-        await asyncio.sleep(0.2)
-        en_data = await self.scrape_committee_detail(house, slug, "en")
+        if concurrent:
+            np_data, en_data = await asyncio.gather(
+                self.scrape_committee_detail(house, slug, "np"),
+                self.scrape_committee_detail(house, slug, "en"),
+            )
+        else:
+            np_data = await self.scrape_committee_detail(house, slug, "np")
+            await asyncio.sleep(0.2)
+            en_data = await self.scrape_committee_detail(house, slug, "en")
 
         if not np_data and not en_data:
-            return {}
+            return None
 
         members_page_np = (
             np_data.get("membersPageUrl")
@@ -284,29 +313,29 @@ class CommitteeDetailScraper:
             or f"{base_url}/en/committees/{slug}/members"
         )
 
-        return {
-            "house": house,
-            "houseEnum": HOUSE_MAPPING[house],
-            "slug": slug,
-            "nameNp": np_data.get("name", ""),
-            "nameEn": en_data.get("name", ""),
-            "introductionNp": np_data.get("introduction", ""),
-            "introductionEn": en_data.get("introduction", ""),
-            "chairperson": np_data.get("chairperson")
+        return RawCommittee(
+            house=house,
+            houseEnum=HOUSE_MAPPING[house],
+            slug=slug,
+            nameNp=np_data.get("name", ""),
+            nameEn=en_data.get("name", ""),
+            introductionNp=np_data.get("introduction", ""),
+            introductionEn=en_data.get("introduction", ""),
+            chairperson=np_data.get("chairperson")
             or en_data.get("chairperson")
             or "",
-            "chairpersonNp": np_data.get("chairperson", ""),
-            "chairpersonEn": en_data.get("chairperson", ""),
-            "secretaryNp": np_data.get("secretary", ""),
-            "secretaryEn": en_data.get("secretary", ""),
-            "menuLinksNp": np_data.get("menuLinks", {}),
-            "menuLinksEn": en_data.get("menuLinks", {}),
-            "membersPageUrlNp": members_page_np,
-            "membersPageUrlEn": members_page_en,
-            "parliamentUrlNp": f"{base_url}/np/committees/{slug}",
-            "parliamentUrlEn": f"{base_url}/en/committees/{slug}",
-            "scrapedAt": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-        }
+            chairpersonNp=np_data.get("chairperson", ""),
+            chairpersonEn=en_data.get("chairperson", ""),
+            secretaryNp=np_data.get("secretary", ""),
+            secretaryEn=en_data.get("secretary", ""),
+            menuLinksNp=np_data.get("menuLinks", {}),
+            menuLinksEn=en_data.get("menuLinks", {}),
+            membersPageUrlNp=members_page_np,
+            membersPageUrlEn=members_page_en,
+            parliamentUrlNp=f"{base_url}/np/committees/{slug}",
+            parliamentUrlEn=f"{base_url}/en/committees/{slug}",
+            scrapedAt=datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        )
 
 
 class CommitteesScraper:
@@ -325,58 +354,101 @@ class CommitteesScraper:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         await self.close()
 
-    async def scrape_house_committees(self, house: str) -> List[Dict[str, Any]]:
+    async def scrape_house_committees(
+        self,
+        house: str,
+        concurrent: bool = False,
+    ) -> List[RawCommittee]:
         slugs = COMMITTEES.get(house, [])
-        house_committees: List[Dict[str, Any]] = []
 
         log.info("%s", "=" * 60)
-        log.info("Scraping %s committees (%d)", house, len(slugs))
+        log.info("Scraping %s committees (%d)%s", house, len(slugs), " concurrently" if concurrent else "")
         log.info("%s", "=" * 60)
 
-        for idx, slug in enumerate(slugs, start=1):
-            log.info("[%d/%d] %s %s", idx, len(slugs), house, slug)
-            try:
-                data = await self.detail_scraper.scrape_committee_both_languages(
-                    house,
-                    slug,
+        with span("committees.house", house=house, committees=len(slugs), concurrent=concurrent):
+            if concurrent:
+                # gather() keeps results in slug order
+                results = await asyncio.gather(
+                    *(self._scrape_one(house, slug, idx, len(slugs), True) for idx, slug in enumerate(slugs, start=1))
                 )
+                return [data for data in results if data]
+
+            house_committees: List[RawCommittee] = []
+            for idx, slug in enumerate(slugs, start=1):
+                data = await self._scrape_one(house, slug, idx, len(slugs), False)
                 if data:
                     house_committees.append(data)
-            except Exception as exc:  # broad catch to continue scraping
-                log.error("Failed scraping %s/%s: %s", house, slug, exc)
-
-            await asyncio.sleep(0.35)
+                await asyncio.sleep(0.35)
 
-        return house_committees
+            return house_committees
 
-    async def scrape_all(self) -> List[Dict[str, Any]]:
-        all_committees: List[Dict[str, Any]] = []
-
-        try:
-            all_committees.extend(await self.scrape_house_committees("HoR"))
-        except Exception as exc:
-            log.error("Error scraping HoR: %s", exc)
+    async def _scrape_one(
+        self,
+        house: str,
+        slug: str,
+        idx: int,
+        total: int,
+        concurrent: bool,
+    ) -> Optional[RawCommittee]:
+        with log_context(stage="committees.committee", house=house, slug=slug):
+            log.info("[%d/%d] %s %s", idx, total, house, slug)
+            try:
+                with span("committees.committee", house=house, slug=slug):
+                    return await self.detail_scraper.scrape_committee_both_languages(
+                        house,
+                        slug,
+                        concurrent=concurrent,
+                    )
+            except Exception as exc:  # broad catch to continue scraping
+                log.error("Failed scraping %s/%s: %s", house, slug, exc)
+                return None
 
-        try:
-            all_committees.extend(await self.scrape_house_committees("NA"))
-        except Exception as exc:
-            log.error("Error scraping NA: %s", exc)
+    async def scrape_houses(
+        self,
+        houses: List[str],
+        concurrent: bool = CONCURRENT,
+    ) -> List[RawCommittee]:
+        """Scrape the given houses, in parallel when concurrent, keeping house order."""
+        if concurrent:
+            results = await asyncio.gather(
+                *(self.scrape_house_committees(house, concurrent=True) for house in houses),
+                return_exceptions=True,
+            )
+        else:
+            results = []
+            for house in houses:
+                try:
+                    results.append(await self.scrape_house_committees(house))
+                except Exception as exc:
+                    results.append(exc)
+
+        all_committees: List[RawCommittee] = []
+        for house, result in zip(houses, results):
+            if isinstance(result, BaseException):
+                log.error("Error scraping %s: %s", house, result)
+                continue
+            all_committees.extend(result)
 
         return all_committees
 
+    async def scrape_all(self, concurrent: bool = CONCURRENT) -> List[RawCommittee]:
+        return await self.scrape_houses(["HoR", "NA"], concurrent=concurrent)
+
 
 def get_output_filename() -> str:
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    return str(OUTPUT_DIR / f"committees_{timestamp}.json")
+    return str(ArtifactStore(OUTPUT_DIR).new_path("committees_raw"))
 
 
-def save_to_json(committees: List[Dict[str, Any]], output_file: str) -> None:
-    with open(output_file, "w", encoding="utf-8") as fp:
-        json.dump(committees, fp, ensure_ascii=False, indent=2)
+def save_to_json(committees: List[RawCommittee], output_file: str) -> None:
+    codec.write(output_file, to_dicts(committees))
     log.info("Saved %d committees to %s", len(committees), output_file)
 
 
-async def scrape_all_committees(output_file: Optional[str] = None) -> Dict[str, Any]:
+async def scrape_all_committees(
+    output_file: Optional[str] = None,
+    concurrent: bool = CONCURRENT,
+    run_id: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Async function used by services/python/main.py.
     Returns summary dict + raw data.
@@ -385,13 +457,14 @@ async def scrape_all_committees(output_file: Optional[str] = None) -> Dict[str,
 
     try:
         async with CommitteesScraper() as scraper:
-            all_committees = await scraper.scrape_all()
+            all_committees = await scraper.scrape_all(concurrent=concurrent)
 
         resolved_output = output_file or get_output_filename()
         save_to_json(all_committees, resolved_output)
+        register_artifact("committees_raw", resolved_output, run_id)
 
-        hor_count = sum(1 for c in all_committees if c.get("house") == "HoR")
-        na_count = sum(1 for c in all_committees if c.get("house") == "NA")
+        hor_count = sum(1 for c in all_committees if c.house == "HoR")
+        na_count = sum(1 for c in all_committees if c.house == "NA")
 
         return {
             "success": True,
@@ -399,8 +472,10 @@ async def scrape_all_committees(output_file: Optional[str] = None) -> Dict[str,
             "hor_count": hor_count,
             "na_count": na_count,
             "output": resolved_output,
+            "concurrent": concurrent,
             "duration_seconds": (datetime.utcnow() - started_at).total_seconds(),
-            "data": all_committees,
+            "http": scraper.client.telemetry.summary(),
+            "data": to_dicts(all_committees),
         }
     except Exception as exc:
         log.error("Committee scraping failed: %s", exc, exc_info=True)
@@ -426,22 +501,40 @@ async def main() -> None:
         default="",
         help="Output path for scraped JSON",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Scrape one page at a time instead of concurrently",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write cProfile, folded-stack and tracemalloc output for the run",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record spans of the run and store them as a trace artifact",
+    )
     args = parser.parse_args()
+    profiler = cli_profiler("scrape_committees", enabled=args.profile)
+    trace = start_trace("scrape_committees", enabled=args.trace)
 
     try:
-        async with CommitteesScraper() as scraper:
-            all_committees: List[Dict[str, Any]] = []
-
-            if args.type in ("all", "HoR"):
-                all_committees.extend(await scraper.scrape_house_committees("HoR"))
-            if args.type in ("all", "NA"):
-                all_committees.extend(await scraper.scrape_house_committees("NA"))
+        with profiler.stage("committees_scrape"):
+            async with CommitteesScraper() as scraper:
+                houses = ["HoR", "NA"] if args.type == "all" else [args.type]
+                all_committees = await scraper.scrape_houses(
+                    houses,
+                    concurrent=CONCURRENT and not args.sequential,
+                )
 
         output_file = args.output or get_output_filename()
         save_to_json(all_committees, output_file)
+        register_artifact("committees_raw", output_file)
 
-        hor_count = sum(1 for c in all_committees if c.get("house") == "HoR")
-        na_count = sum(1 for c in all_committees if c.get("house") == "NA")
+        hor_count = sum(1 for c in all_committees if c.house == "HoR")
+        na_count = sum(1 for c in all_committees if c.house == "NA")
 
         log.info("%s", "=" * 60)
         log.info("SUMMARY")
@@ -449,10 +542,16 @@ async def main() -> None:
         log.info("  HoR: %d", hor_count)
         log.info("  NA:  %d", na_count)
         log.info("Output: %s", output_file)
+        log_summary(profiler)
+        if trace is not None:
+            end_trace(trace)
+            entry = ArtifactStore().put("trace", export_trace(trace))
+            log.info("Trace: %s (%d spans)", entry["name"], len(trace.spans))
         log.info("%s", "=" * 60)
     except Exception as exc:
         log.error("Unhandled error: %s", exc, exc_info=True)
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(main())
@@ -0,0 +1,69 @@
+"""
+Shared concurrency primitives for the async scrapers.
+
+HostLimiter caps the number of in-flight requests per upstream host so that
+concurrent stages (bill details, committees, PDFs) stay polite to the
+parliament sites no matter how many workers are running. Live limiters are
+tracked in LIMITERS so the loop monitor's governor can lower their limits.
+"""
+
+import asyncio
+import os
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+PER_HOST_LIMIT = int(os.getenv("SCRAPER_PER_HOST_LIMIT", "4"))
+
+
+class HostLimiter:
+    """Per-host concurrency limit whose value can be changed at runtime."""
+
+    def __init__(self, limit: int = PER_HOST_LIMIT) -> None:
+        self.limit = max(1, limit)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._conditions: Dict[str, asyncio.Condition] = {}
+        LIMITERS.add(self)
+
+    @property
+    def in_flight(self) -> int:
+        """Total in-flight requests across hosts."""
+        return sum(self._in_flight.values())
+
+    @property
+    def hosts(self) -> List[str]:
+        """Hosts that requests have been made to."""
+        return sorted(self._conditions)
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one request slot for the host of `url`."""
+        host = urlsplit(url).hostname or ""
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        condition = self._conditions.setdefault(host, asyncio.Condition())
+
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight[host] < self.limit)
+            self._in_flight[host] += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._in_flight[host] -= 1
+                condition.notify_all()
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the per-host limit; waiters are re-checked immediately."""
+        self.limit = max(1, limit)
+        for condition in self._conditions.values():
+            async with condition:
+                condition.notify_all()
+
+
+# Every live HostLimiter (limiters are bound to the loop they were first used in)
+LIMITERS: "weakref.WeakSet[HostLimiter]" = weakref.WeakSet()
@@ -0,0 +1,305 @@
+"""
+Snapshot history of the cleaned datasets.
+
+Every run's cleaned bills and committees are recorded so that any past run
+can be reconstructed and a single record (a bill, a committee) can be
+followed over time, while storage grows with actual changes only:
+
+- objects/  each distinct record version, stored once under the SHA-256 of
+            its canonical JSON (content addressed, compressed)
+- <kind>/log.jsonl
+            one line per run: the keys whose version changed and the keys
+            that disappeared since the previous run
+- <kind>/checkpoint_<seq>.json.gz
+            the full key -> version map every CHECKPOINT_EVERY runs, so a
+            reconstruction replays at most that many log lines
+- <kind>/head.json.gz
+            the key -> version map of the latest run (the delta base)
+
+Query from the command line:
+    python -m scraper.history bills_cleaned HoR:123      # versions of one bill
+    python -m scraper.history committees_cleaned --runs  # recorded runs
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+from scraper import codec
+
+
+log = logging.getLogger(__name__)
+
+
+HISTORY_DIR = Path(__file__).resolve().parent.parent / "data" / "history"
+CHECKPOINT_EVERY = int(os.getenv("SCRAPER_HISTORY_CHECKPOINT_EVERY", "50"))
+
+# Record key of each dataset kind
+RECORD_KEYS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "bills_cleaned": lambda record: f"{record.get('type')}:{record.get('bill_id')}",
+    "committees_cleaned": lambda record: f"{record.get('house')}:{record.get('slug')}",
+}
+
+
+def content_hash(record: Dict[str, Any]) -> str:
+    """SHA-256 of a record's canonical JSON (sorted keys, no whitespace)."""
+    canonical = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SnapshotHistory:
+    """Delta log plus content-addressed objects for each dataset kind."""
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root or HISTORY_DIR)
+        self.objects_dir = self.root / "objects"
+        self._thread_lock = threading.Lock()
+
+    # -----------------------------------------------------------------
+    # Storage helpers
+    # -----------------------------------------------------------------
+
+    def _kind_dir(self, kind: str) -> Path:
+        if kind not in RECORD_KEYS:
+            raise ValueError(f"Unknown dataset kind: {kind}")
+        return self.root / kind
+
+    @contextmanager
+    def _locked(self, kind: str) -> Iterator[None]:
+        """Serialize writers of one kind (threads and processes)."""
+        kind_dir = self._kind_dir(kind)
+        with self._thread_lock:
+            kind_dir.mkdir(parents=True, exist_ok=True)
+            lock_file = open(kind_dir / ".lock", "a") if fcntl is not None else None
+            try:
+                if lock_file is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                yield
+            finally:
+                if lock_file is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    lock_file.close()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json.gz"
+
+    def _put_object(self, digest: str, record: Dict[str, Any]) -> int:
+        """Store a record version unless present; returns bytes written."""
+        path = self._object_path(digest)
+        if path.exists():
+            return 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return codec.write(path, record)
+
+    def get_object(self, digest: str) -> Dict[str, Any]:
+        return codec.read(self._object_path(digest))
+
+    def _read_log(self, kind: str) -> List[Dict[str, Any]]:
+        path = self._kind_dir(kind) / "log.jsonl"
+        try:
+            with open(path, "rb") as f:
+                return [codec.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _read_head(self, kind: str) -> Tuple[int, Dict[str, str]]:
+        try:
+            head = codec.read(self._kind_dir(kind) / "head.json.gz")
+        except FileNotFoundError:
+            return 0, {}
+        return head["seq"], head["versions"]
+
+    # -----------------------------------------------------------------
+    # Recording
+    # -----------------------------------------------------------------
+
+    def record_run(
+        self,
+        kind: str,
+        records: List[Dict[str, Any]],
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Record one run's dataset. Only new record versions are stored and
+        the log line lists only changed and removed keys.
+        """
+        key_of = RECORD_KEYS[kind]
+        started = time.monotonic()
+
+        with self._locked(kind):
+            kind_dir = self._kind_dir(kind)
+            previous_seq, previous = self._read_head(kind)
+            seq = previous_seq + 1
+
+            versions: Dict[str, str] = {}
+            changed: Dict[str, str] = {}
+            bytes_written = 0
+            new_objects = 0
+            for record in records:
+                key = key_of(record)
+                digest = content_hash(record)
+                versions[key] = digest
+                if previous.get(key) != digest:
+                    changed[key] = digest
+                    written = self._put_object(digest, record)
+                    bytes_written += written
+                    new_objects += 1 if written else 0
+            removed = [key for key in previous if key not in versions]
+
+            entry = {
+                "seq": seq,
+                "run_id": run_id,
+                "at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+                "records": len(versions),
+                "changed": changed,
+                "removed": removed,
+            }
+            line = codec.dumps(entry) + b"\n"
+            with open(kind_dir / "log.jsonl", "ab") as f:
+                f.write(line)
+            bytes_written += len(line)
+
+            head = {"seq": seq, "versions": versions}
+            codec.write(kind_dir / "head.json.gz", head)
+            if seq % CHECKPOINT_EVERY == 0:
+                bytes_written += codec.write(kind_dir / f"checkpoint_{seq:06d}.json.gz", head)
+
+        added = sum(1 for key in changed if key not in previous)
+        return {
+            "success": True,
+            "kind": kind,
+            "seq": seq,
+            "records": len(versions),
+            "added": added,
+            "changed": len(changed) - added,
+            "removed": len(removed),
+            "new_objects": new_objects,
+            "bytes_written": bytes_written,
+            "duration_seconds": round(time.monotonic() - started, 3),
+        }
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+
+    def runs(self, kind: str) -> List[Dict[str, Any]]:
+        """Recorded runs of a kind with their change counts, oldest first."""
+        return [
+            {
+                "seq": entry["seq"],
+                "run_id": entry.get("run_id"),
+                "at": entry.get("at"),
+                "records": entry.get("records"),
+                "changed": len(entry.get("changed", {})),
+                "removed": len(entry.get("removed", [])),
+            }
+            for entry in self._read_log(kind)
+        ]
+
+    def changes(self, kind: str, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Changed (new included) and removed keys of one run, with the id of
+        the run recorded before it; None if the run was not recorded.
+        """
+        previous_run_id = None
+        for entry in self._read_log(kind):
+            if entry.get("run_id") == run_id:
+                return {
+                    "previous_run_id": previous_run_id,
+                    "changed": list(entry.get("changed", {})),
+                    "removed": list(entry.get("removed", [])),
+                }
+            previous_run_id = entry.get("run_id")
+        return None
+
+    def _resolve_seq(self, log_entries: List[Dict[str, Any]], seq: Optional[int], run_id: Optional[str]) -> Optional[int]:
+        if run_id is not None:
+            return next((e["seq"] for e in log_entries if e.get("run_id") == run_id), None)
+        if seq is None:
+            return log_entries[-1]["seq"] if log_entries else None
+        return seq
+
+    def versions_at(self, kind: str, seq: Optional[int] = None, run_id: Optional[str] = None) -> Dict[str, str]:
+        """Key -> version map of a past run (default: the latest)."""
+        log_entries = self._read_log(kind)
+        target = self._resolve_seq(log_entries, seq, run_id)
+        if target is None:
+            return {}
+
+        # Start from the nearest checkpoint at or before the target run
+        base_seq, versions = 0, {}
+        checkpoint_seq = (target // CHECKPOINT_EVERY) * CHECKPOINT_EVERY
+        if checkpoint_seq:
+            path = self._kind_dir(kind) / f"checkpoint_{checkpoint_seq:06d}.json.gz"
+            if path.exists():
+                checkpoint = codec.read(path)
+                base_seq, versions = checkpoint["seq"], dict(checkpoint["versions"])
+
+        for entry in log_entries:
+            if base_seq < entry["seq"] <= target:
+                versions.update(entry.get("changed", {}))
+                for key in entry.get("removed", []):
+                    versions.pop(key, None)
+        return versions
+
+    def snapshot(self, kind: str, seq: Optional[int] = None, run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Reconstruct the dataset of a past run (default: the latest)."""
+        return [self.get_object(digest) for digest in self.versions_at(kind, seq, run_id).values()]
+
+    def key_history(self, kind: str, key: str, with_records: bool = True) -> List[Dict[str, Any]]:
+        """
+        Versions of one record over time: one entry per run in which it
+        appeared, changed or disappeared (`record` is None once removed).
+        """
+        history: List[Dict[str, Any]] = []
+        for entry in self._read_log(kind):
+            if key in entry.get("changed", {}):
+                digest = entry["changed"][key]
+            elif key in entry.get("removed", []):
+                digest = None
+            else:
+                continue
+            item = {"seq": entry["seq"], "run_id": entry.get("run_id"), "at": entry.get("at"), "version": digest}
+            if with_records:
+                item["record"] = self.get_object(digest) if digest else None
+            history.append(item)
+        return history
+
+
+# =====================================================================
+# CLI
+# =====================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query the dataset snapshot history")
+    parser.add_argument("kind", choices=sorted(RECORD_KEYS))
+    parser.add_argument("key", nargs="?", help="Record key, e.g. HoR:123 or NA:Finance-Committee")
+    parser.add_argument("--runs", action="store_true", help="List recorded runs")
+    parser.add_argument("--seq", type=int, help="Print the dataset of this run")
+    args = parser.parse_args()
+
+    history = SnapshotHistory()
+    if args.runs:
+        result: Any = history.runs(args.kind)
+    elif args.key:
+        result = history.key_history(args.kind, args.key)
+    else:
+        result = history.snapshot(args.kind, seq=args.seq)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
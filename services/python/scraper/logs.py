@@ -0,0 +1,246 @@
+"""
+Logging setup for the command-line entry points.
+
+Library modules only create loggers (`logging.getLogger(__name__)`); handlers
+are installed once by whichever CLI is running, so importing the package
+never reconfigures an embedding application's logging.
+
+`configure_logging()` puts a QueueHandler on the root logger and a
+QueueListener thread writes the records, so the event loop never blocks on
+stderr. On the way into the queue each record gets:
+
+- context fields set with `log_context(run_id=..., stage=..., house=...,
+  bill_id=...)`; they live in a ContextVar, so asyncio tasks inherit them
+- a per-stage level: SCRAPER_LOG_LEVELS="bills.fetch=WARNING,probe=DEBUG"
+  overrides the default level (SCRAPER_LOG_LEVEL) inside that stage
+- rate limiting: each INFO/DEBUG callsite may log SCRAPER_LOG_RATE records
+  per second (bursts of SCRAPER_LOG_BURST); the next record that gets
+  through carries the number suppressed in between
+
+Output is one JSON object per line (SCRAPER_LOG_FORMAT=json, the default
+when stderr is not a terminal) or the plain text format with the context
+appended (SCRAPER_LOG_FORMAT=text).
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from scraper import codec
+
+
+LOG_FORMAT = "%(asctime)s %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+LOG_OUTPUT = os.getenv("SCRAPER_LOG_FORMAT", "").strip().lower()
+LOG_LEVEL = os.getenv("SCRAPER_LOG_LEVEL", "INFO").strip().upper()
+LOG_LEVELS = os.getenv("SCRAPER_LOG_LEVELS", "")
+LOG_RATE = float(os.getenv("SCRAPER_LOG_RATE", "5"))
+LOG_BURST = float(os.getenv("SCRAPER_LOG_BURST", "20"))
+
+# Context fields, in output order
+CONTEXT_FIELDS = ("run_id", "stage", "house", "bill_id", "slug")
+# Chatty dependencies (httpx logs every request at INFO)
+QUIET_LOGGERS = ("httpx", "httpcore", "apscheduler.executors", "apscheduler.scheduler")
+
+_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+_listener: Optional[logging.handlers.QueueListener] = None
+_rate_limit: Optional["RateLimitFilter"] = None
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Attach `fields` to every record logged inside the block."""
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def bind_log_context(**fields: Any) -> None:
+    """
+    Set context fields for the rest of the current asyncio task. Use at the
+    top of a task or per item in a worker loop; elsewhere use log_context().
+    """
+    _context.set({**_context.get(), **fields})
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """'bills.fetch=WARNING,probe=DEBUG' -> {stage: level}."""
+    levels: Dict[str, int] = {}
+    for item in spec.split(","):
+        stage, _, level = item.partition("=")
+        if stage.strip() and level.strip():
+            levels[stage.strip()] = logging.getLevelName(level.strip().upper())
+    return {stage: level for stage, level in levels.items() if isinstance(level, int)}
+
+
+# =====================================================================
+# FILTERS (run in the thread that logs, before the queue)
+# =====================================================================
+
+class ContextFilter(logging.Filter):
+    """Copies the log context onto the record and applies per-stage levels."""
+
+    def __init__(self, default_level: int, stage_levels: Dict[str, int]) -> None:
+        super().__init__()
+        self.default_level = default_level
+        self.stage_levels = stage_levels
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _context.get()
+        stage = context.get("stage")
+        if record.levelno < self.stage_levels.get(stage, self.default_level):
+            return False
+        for key, value in context.items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per callsite for records at INFO and below."""
+
+    def __init__(self, rate: float = LOG_RATE, burst: float = LOG_BURST) -> None:
+        super().__init__()
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.suppressed_total = 0
+        self._buckets: Dict[Tuple[str, int], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or self.rate <= 0:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                # [tokens, last refill, suppressed since the last record]
+                bucket = self._buckets[key] = [self.burst, now, 0]
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                self.suppressed_total += 1
+                return False
+            bucket[0] = tokens - 1
+            suppressed, bucket[2] = bucket[2], 0
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records with the message merged but without formatting them."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# =====================================================================
+# FORMATTERS (run on the writer thread)
+# =====================================================================
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key in CONTEXT_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if getattr(record, "suppressed", None):
+            entry["suppressed"] = record.suppressed
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return codec.dumps(entry, default=str).decode("utf-8")
+
+
+class TextFormatter(logging.Formatter):
+    """The service's text format with the context fields appended."""
+
+    def __init__(self) -> None:
+        super().__init__(LOG_FORMAT, LOG_DATE_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        fields = [f"{key}={getattr(record, key)}" for key in CONTEXT_FIELDS if getattr(record, key, None) is not None]
+        if getattr(record, "suppressed", None):
+            fields.append(f"suppressed={record.suppressed}")
+        if not fields:
+            return text
+        head, newline, rest = text.partition("\n")
+        return f"{head}  [{' '.join(fields)}]{newline}{rest}"
+
+
+# =====================================================================
+# SETUP
+# =====================================================================
+
+def configure_logging(level: Optional[int] = None, output: str = LOG_OUTPUT) -> None:
+    """
+    Install the queue handler on the root logger (no-op if logging is
+    already configured). `level` defaults to SCRAPER_LOG_LEVEL; `output` is
+    "json" or "text", and empty picks text on a terminal and JSON otherwise.
+    """
+    global _listener, _rate_limit
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    if level is None:
+        level = logging.getLevelName(LOG_LEVEL)
+        level = level if isinstance(level, int) else logging.INFO
+    stage_levels = parse_levels(LOG_LEVELS)
+    output = output or ("text" if sys.stderr.isatty() else "json")
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(JsonFormatter() if output == "json" else TextFormatter())
+
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = QueueHandler(records)
+    handler.addFilter(ContextFilter(level, stage_levels))
+    _rate_limit = RateLimitFilter()
+    handler.addFilter(_rate_limit)
+    root.addHandler(handler)
+    root.setLevel(min([level, *stage_levels.values()]))
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(max(level, logging.WARNING))
+
+    _listener = logging.handlers.QueueListener(records, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        if _rate_limit is not None and _rate_limit.suppressed_total:
+            logging.getLogger(__name__).warning("%d log records were rate-limited", _rate_limit.suppressed_total)
+        _listener.stop()
+        _listener = None
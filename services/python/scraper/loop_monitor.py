@@ -0,0 +1,321 @@
+"""
+Event-loop stall detection and a concurrency governor for the async scrapers.
+
+BeautifulSoup parsing, JSON encoding, psycopg2 and subprocess calls run
+synchronously inside coroutines; while one runs, no response is read and
+every in-flight request waits. `LoopMonitor` makes that visible:
+
+- loop lag: a ticker task sleeps SCRAPER_LOOP_TICK_MS and records how late
+  it wakes up in a latency histogram
+- stalls: a watchdog thread notices when the ticker is overdue by
+  SCRAPER_LOOP_STALL_MS and captures the loop thread's stack and running
+  task, so each stall is attributed to the callsite that blocked
+- resources: RSS, open sockets (from /proc, or psutil when installed) and
+  in-flight requests, sampled every SCRAPER_LOOP_SAMPLE_S
+
+The governor checks every SCRAPER_GOVERNOR_WINDOW_S: when the worst lag of
+the window exceeded SCRAPER_GOVERNOR_MAX_LAG_MS or RSS exceeded
+SCRAPER_GOVERNOR_MAX_RSS_MB (0 disables either check), the per-host limit of
+every HostLimiter used on the loop is halved; after
+SCRAPER_GOVERNOR_RECOVER_WINDOWS healthy windows it is raised by one, up to
+the limit it started with. `stop()` returns the findings for the run report.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from scraper.concurrency import LIMITERS, HostLimiter
+from scraper.telemetry import LatencyHistogram
+
+
+log = logging.getLogger(__name__)
+
+
+LOOP_MONITOR = os.getenv("SCRAPER_LOOP_MONITOR", "1") == "1"
+LOOP_TICK_MS = float(os.getenv("SCRAPER_LOOP_TICK_MS", "50"))
+LOOP_STALL_MS = float(os.getenv("SCRAPER_LOOP_STALL_MS", "250"))
+LOOP_SAMPLE_SECONDS = float(os.getenv("SCRAPER_LOOP_SAMPLE_S", "1"))
+
+GOVERNOR = os.getenv("SCRAPER_GOVERNOR", "1") == "1"
+GOVERNOR_WINDOW_SECONDS = float(os.getenv("SCRAPER_GOVERNOR_WINDOW_S", "5"))
+GOVERNOR_MAX_LAG_MS = float(os.getenv("SCRAPER_GOVERNOR_MAX_LAG_MS", "1000"))
+GOVERNOR_MAX_RSS_MB = float(os.getenv("SCRAPER_GOVERNOR_MAX_RSS_MB", "1024"))
+GOVERNOR_RECOVER_WINDOWS = int(os.getenv("SCRAPER_GOVERNOR_RECOVER_WINDOWS", "3"))
+
+WORST_STALLS = 10   # stalls kept with their stacks
+STACK_DEPTH = 8     # innermost frames kept per stall
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+# =====================================================================
+# PROCESS RESOURCES
+# =====================================================================
+
+def rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None when unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return None
+
+
+def open_sockets() -> Optional[int]:
+    """Open sockets of this process (HTTP connections, DB, metrics server)."""
+    try:
+        fds = os.listdir("/proc/self/fd")
+    except OSError:
+        fds = None
+    if fds is not None:
+        count = 0
+        for fd in fds:
+            try:
+                count += os.readlink(f"/proc/self/fd/{fd}").startswith("socket:")
+            except OSError:
+                pass
+        return count
+    if psutil is not None:
+        process = psutil.Process()
+        connections = getattr(process, "net_connections", None) or process.connections
+        try:
+            return len(connections())
+        except psutil.Error:
+            return None
+    return None
+
+
+def frame_label(frame: Any) -> str:
+    return f"{Path(frame.f_code.co_filename).name}:{frame.f_lineno}({frame.f_code.co_name})"
+
+
+def blocking_site(frame: Any) -> Dict[str, Any]:
+    """Innermost frames of the blocked thread and the innermost frame in our code."""
+    stack: List[str] = []
+    callsite = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if callsite is None and filename.startswith(PROJECT_ROOT) and "site-packages" not in filename:
+            callsite = frame_label(frame)
+        if len(stack) < STACK_DEPTH:
+            stack.append(frame_label(frame))
+        frame = frame.f_back
+    return {"callsite": callsite or (stack[0] if stack else None), "stack": stack}
+
+
+# =====================================================================
+# MONITOR
+# =====================================================================
+
+class LoopMonitor:
+    """Measures lag of the running event loop and governs its HostLimiters."""
+
+    def __init__(
+        self,
+        tick_ms: float = LOOP_TICK_MS,
+        stall_ms: float = LOOP_STALL_MS,
+        governor: bool = GOVERNOR,
+    ) -> None:
+        self.tick = tick_ms / 1000
+        self.stall_ms = stall_ms
+        self.governor = governor
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.lag = LatencyHistogram()
+        self.stalls = 0
+        self.stalled_ms = 0.0
+        self.worst: List[Dict[str, Any]] = []
+        self.callsites: Dict[str, Dict[str, float]] = defaultdict(lambda: {"stalls": 0, "total_ms": 0.0, "max_ms": 0.0})
+        self.resources: Dict[str, Optional[int]] = {
+            "rss_bytes": None,
+            "rss_peak_bytes": None,
+            "open_sockets": None,
+            "open_sockets_peak": None,
+            "in_flight_peak": 0,
+        }
+        self.actions: List[Dict[str, Any]] = []
+        self._base_limits: "weakref.WeakKeyDictionary[HostLimiter, int]" = weakref.WeakKeyDictionary()
+        self._window_lag = 0.0
+        self._healthy_windows = 0
+        self._started = 0.0
+        self._beat = 0.0
+        self._pending: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._loop_thread = 0
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        """Start monitoring the running loop; call from a coroutine."""
+        self.loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._started = self._beat = time.perf_counter()
+        self.sample()
+        self._task = self.loop.create_task(self._ticker(), name="loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> Dict[str, Any]:
+        """Stop monitoring, restore governed limits and return the summary."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._stop_event.set()
+            self._watchdog.join()
+            self._watchdog = None
+        self.sample()
+        for limiter, limit in list(self._base_limits.items()):
+            if limiter.limit != limit:
+                await limiter.set_limit(limit)
+        return self.summary()
+
+    def limiters(self) -> List[HostLimiter]:
+        return [limiter for limiter in list(LIMITERS) if limiter.loop is self.loop]
+
+    # -----------------------------------------------------------------
+    # Lag and stalls
+    # -----------------------------------------------------------------
+
+    async def _ticker(self) -> None:
+        last_sample = window_started = time.perf_counter()
+        while True:
+            self._beat = slept_at = time.perf_counter()
+            await asyncio.sleep(self.tick)
+            now = time.perf_counter()
+            lag_ms = max(0.0, (now - slept_at - self.tick) * 1000)
+            self.lag.observe(lag_ms)
+            self._window_lag = max(self._window_lag, lag_ms)
+            if lag_ms >= self.stall_ms:
+                self._record_stall(slept_at, lag_ms)
+            if now - last_sample >= LOOP_SAMPLE_SECONDS:
+                self.sample()
+                last_sample = now
+            if self.governor and now - window_started >= GOVERNOR_WINDOW_SECONDS:
+                await self._govern()
+                window_started = now
+
+    def _watch(self) -> None:
+        """Watchdog thread: capture the loop thread's stack while it is blocked."""
+        interval = min(self.tick, self.stall_ms / 1000) / 2
+        captured = 0.0
+        while not self._stop_event.wait(interval):
+            beat = self._beat
+            if beat == captured or time.perf_counter() - beat - self.tick < self.stall_ms / 1000:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            site = blocking_site(frame)
+            task = asyncio.current_task(self.loop)
+            site["task"] = task.get_name() if task is not None else None
+            self._pending = (beat, site)
+            captured = beat
+
+    def _record_stall(self, slept_at: float, lag_ms: float) -> None:
+        pending, self._pending = self._pending, None
+        # Without a capture the thread held the GIL throughout (e.g. in a C extension)
+        site = pending[1] if pending and pending[0] == slept_at else {"callsite": None, "stack": [], "task": None}
+        self.stalls += 1
+        self.stalled_ms += lag_ms
+        callsite = self.callsites[site["callsite"] or "unknown"]
+        callsite["stalls"] += 1
+        callsite["total_ms"] += lag_ms
+        callsite["max_ms"] = max(callsite["max_ms"], lag_ms)
+
+        stall = {"at_seconds": round(slept_at - self._started, 2), "lag_ms": round(lag_ms, 1), **site}
+        self.worst.append(stall)
+        self.worst.sort(key=lambda entry: -entry["lag_ms"])
+        del self.worst[WORST_STALLS:]
+
+        level = logging.WARNING if lag_ms >= GOVERNOR_MAX_LAG_MS else logging.DEBUG
+        log.log(level, "Event loop blocked %.0f ms in %s (task %s)", lag_ms, site["callsite"], site["task"])
+
+    # -----------------------------------------------------------------
+    # Resources and governor
+    # -----------------------------------------------------------------
+
+    def sample(self) -> None:
+        resources = self.resources
+        for key, peak_key, value in (
+            ("rss_bytes", "rss_peak_bytes", rss_bytes()),
+            ("open_sockets", "open_sockets_peak", open_sockets()),
+        ):
+            if value is not None:
+                resources[key] = value
+                resources[peak_key] = max(value, resources[peak_key] or 0)
+        in_flight = sum(limiter.in_flight for limiter in self.limiters())
+        resources["in_flight_peak"] = max(resources["in_flight_peak"] or 0, in_flight)
+
+    async def _govern(self) -> None:
+        lag_ms, self._window_lag = self._window_lag, 0.0
+        rss = self.resources["rss_bytes"]
+        reason = None
+        if GOVERNOR_MAX_LAG_MS and lag_ms > GOVERNOR_MAX_LAG_MS:
+            reason = f"loop lag {lag_ms:.0f} ms"
+        elif GOVERNOR_MAX_RSS_MB and rss and rss > GOVERNOR_MAX_RSS_MB * 1024 * 1024:
+            reason = f"rss {rss / 1024 / 1024:.0f} MB"
+
+        if reason is None:
+            self._healthy_windows += 1
+            if self._healthy_windows < GOVERNOR_RECOVER_WINDOWS:
+                return
+            self._healthy_windows = 0
+        else:
+            self._healthy_windows = 0
+
+        for limiter in self.limiters():
+            base = self._base_limits.setdefault(limiter, limiter.limit)
+            if reason is not None:
+                new_limit = max(1, limiter.limit // 2)
+            else:
+                new_limit = min(base, limiter.limit + 1)
+            if new_limit == limiter.limit:
+                continue
+            self.actions.append({
+                "at_seconds": round(time.perf_counter() - self._started, 2),
+                "hosts": limiter.hosts,
+                "from": limiter.limit,
+                "to": new_limit,
+                "reason": reason or "recovered",
+            })
+            log.info("Governor: per-host limit %d -> %d for %s (%s)", limiter.limit, new_limit, ", ".join(limiter.hosts), reason or "recovered")
+            await limiter.set_limit(new_limit)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "duration_seconds": round(time.perf_counter() - self._started, 2),
+            "lag": self.lag.to_dict(),
+            "stalls": self.stalls,
+            "stalled_seconds": round(self.stalled_ms / 1000, 2),
+            "callsites": sorted(
+                (
+                    {"callsite": name, "stalls": entry["stalls"], "total_ms": round(entry["total_ms"], 1), "max_ms": round(entry["max_ms"], 1)}
+                    for name, entry in self.callsites.items()
+                ),
+                key=lambda entry: -entry["total_ms"],
+            ),
+            "worst_stalls": self.worst,
+            "resources": dict(self.resources),
+            "governor": {"enabled": self.governor, "actions": self.actions},
+        }
@@ -0,0 +1,436 @@
+"""
+Metrics and run status for the scheduler daemon.
+
+- `MetricsRegistry` keeps gauges, counters and histograms and renders them
+  in the Prometheus text exposition format.
+- `RunStatus` tracks the runs in progress (current stage, elapsed time and
+  the previous duration of that stage) and the outcome of the last run per
+  source.
+- `observe_run()` turns a finished run's results into metrics.
+- `start_metrics_server()` serves /metrics (Prometheus text), /status (JSON)
+  and /healthz on a local port, and `write_textfile()` writes the metrics
+  for node_exporter's textfile collector.
+
+Everything is process-local and thread-safe: the scheduler runs each job in
+its own thread with its own event loop.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from scraper.bs_calendar import bs_to_ad
+from scraper.telemetry import LATENCY_BUCKETS_MS
+
+
+log = logging.getLogger(__name__)
+
+
+METRICS_HOST = os.getenv("SCRAPER_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("SCRAPER_METRICS_PORT", "9464"))  # 0 disables the endpoint
+METRICS_TEXTFILE = os.getenv("SCRAPER_METRICS_TEXTFILE", "")
+METRIC_PREFIX = "scraper_"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = labels + ((extra,) if extra else ())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in pairs) + "}"
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+# =====================================================================
+# METRICS
+# =====================================================================
+
+class Metric:
+    """A gauge or counter family; one value per label set."""
+
+    def __init__(self, name: str, kind: str, help_text: str) -> None:
+        self.name = METRIC_PREFIX + name
+        self.kind = kind
+        self.help = help_text
+        self.values: Dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        self.values[tuple(sorted((k, str(v)) for k, v in labels.items()))] = float(value)
+
+    def inc(self, value: float = 1.0, **labels: Any) -> None:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        self.values[key] = self.values.get(key, 0.0) + value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{format_labels(labels)} {format_value(value)}")
+        return lines
+
+
+class Histogram(Metric):
+    """Cumulative histogram family fed with pre-bucketed counts (seconds)."""
+
+    def __init__(self, name: str, help_text: str, bounds: Sequence[float]) -> None:
+        super().__init__(name, "histogram", help_text)
+        self.bounds = tuple(bounds)
+        self.series: Dict[Labels, List[float]] = {}  # bucket counts..., sum, count
+
+    def merge(self, counts: Sequence[int], total: float, count: int, **labels: Any) -> None:
+        """Add per-bucket counts (len(bounds) + 1, the last being +Inf)."""
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        series = self.series.setdefault(key, [0.0] * (len(self.bounds) + 3))
+        for index, value in enumerate(counts):
+            series[index] += value
+        series[-2] += total
+        series[-1] += count
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self.series.items()):
+            cumulative = 0.0
+            for bound, value in zip(self.bounds + (float("inf"),), series):
+                cumulative += value
+                le = "+Inf" if bound == float("inf") else format_value(bound)
+                lines.append(f"{self.name}_bucket{format_labels(labels, ('le', le))} {format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{format_labels(labels)} {format_value(series[-2])}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {format_value(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metric families plus collectors refreshed before each render."""
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[["MetricsRegistry"], None]] = []
+
+    def _family(self, name: str, factory: Callable[[], Metric]) -> Metric:
+        with self.lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+    def gauge(self, name: str, help_text: str) -> Metric:
+        return self._family(name, lambda: Metric(name, "gauge", help_text))
+
+    def counter(self, name: str, help_text: str) -> Metric:
+        return self._family(name, lambda: Metric(name, "counter", help_text))
+
+    def histogram(self, name: str, help_text: str, bounds: Sequence[float]) -> Histogram:
+        return self._family(name, lambda: Histogram(name, help_text, bounds))
+
+    def add_collector(self, collector: Callable[["MetricsRegistry"], None]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self.lock:
+            for collector in self._collectors:
+                try:
+                    collector(self)
+                except Exception as exc:
+                    log.warning("Metrics collector failed: %s", exc)
+            lines: List[str] = []
+            for name in sorted(self._metrics):
+                lines.extend(self._metrics[name].render())
+            return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+
+def collect_caches(registry: MetricsRegistry) -> None:
+    info = bs_to_ad.cache_info()
+    registry.counter("cache_hits_total", "In-process cache hits").set(info.hits, cache="bs_to_ad")
+    registry.counter("cache_misses_total", "In-process cache misses").set(info.misses, cache="bs_to_ad")
+    registry.gauge("cache_entries", "In-process cache entries").set(info.currsize, cache="bs_to_ad")
+
+
+METRICS.add_collector(collect_caches)
+
+
+# =====================================================================
+# RUN STATUS
+# =====================================================================
+
+_current_run: ContextVar[Optional[str]] = ContextVar("current_run", default=None)
+
+
+class RunStatus:
+    """Progress of runs in flight and the outcome of the last run per source."""
+
+    def __init__(self, registry: MetricsRegistry = METRICS) -> None:
+        self.registry = registry
+        self._lock = threading.Lock()
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        self._last_runs: Dict[str, Dict[str, Any]] = {}
+        self._stage_seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def run(self, run_id: str, sources: Sequence[str]) -> Iterator[None]:
+        """Track one pipeline run; stages entered within it are attributed to it."""
+        with self._lock:
+            self._runs[run_id] = {
+                "run_id": run_id,
+                "sources": list(sources),
+                "started_at": time.time(),
+                "stage": None,
+                "stage_started_at": None,
+                "completed_stages": {},
+            }
+        token = _current_run.set(run_id)
+        try:
+            yield
+        finally:
+            _current_run.reset(token)
+            with self._lock:
+                self._runs.pop(run_id, None)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        run_id = _current_run.get()
+        started = time.monotonic()
+        with self._lock:
+            run = self._runs.get(run_id) if run_id else None
+            if run is not None:
+                run["stage"] = name
+                run["stage_started_at"] = time.time()
+        try:
+            yield
+        finally:
+            seconds = time.monotonic() - started
+            with self._lock:
+                if run is not None:
+                    run["completed_stages"][name] = round(seconds, 3)
+                    run["stage"] = run["stage_started_at"] = None
+                self._stage_seconds[name] = seconds
+            with self.registry.lock:
+                self.registry.gauge("stage_duration_seconds", "Duration of the last run of each stage").set(seconds, stage=name)
+                self.registry.counter("stage_seconds_total", "Time spent in each stage").inc(seconds, stage=name)
+                self.registry.counter("stage_runs_total", "Completed runs of each stage").inc(stage=name)
+
+    def finish(self, sources: Sequence[str], run_id: str, status: str, duration: float) -> None:
+        with self._lock:
+            for source in sources:
+                self._last_runs[source] = {
+                    "run_id": run_id,
+                    "status": status,
+                    "finished_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+                    "duration_seconds": round(duration, 3),
+                }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready view of runs in flight and the last run per source."""
+        now = time.time()
+        with self._lock:
+            current = []
+            for run in self._runs.values():
+                stage = run["stage"]
+                current.append({
+                    "run_id": run["run_id"],
+                    "sources": run["sources"],
+                    "started_at": datetime.utcfromtimestamp(run["started_at"]).isoformat(timespec="seconds") + "Z",
+                    "elapsed_seconds": round(now - run["started_at"], 1),
+                    "stage": stage,
+                    "stage_elapsed_seconds": round(now - run["stage_started_at"], 1) if stage else None,
+                    "stage_previous_seconds": round(self._stage_seconds[stage], 1) if stage in self._stage_seconds else None,
+                    "completed_stages": dict(run["completed_stages"]),
+                })
+            return {
+                "now": datetime.utcfromtimestamp(now).isoformat(timespec="seconds") + "Z",
+                "running": current,
+                "last_runs": dict(self._last_runs),
+            }
+
+
+RUN_STATUS = RunStatus()
+
+
+# =====================================================================
+# RUN RESULTS -> METRICS
+# =====================================================================
+
+def observe_run(
+    results: Dict[str, Any],
+    sources: Sequence[str],
+    status: str,
+    registry: MetricsRegistry = METRICS,
+) -> None:
+    """Record the outcome, record counts and HTTP telemetry of a finished run."""
+    now = time.time()
+    with registry.lock:
+        for source in sources:
+            registry.counter("runs_total", "Finished pipeline runs").inc(source=source, status=status)
+            registry.gauge("last_run_timestamp_seconds", "End of the last run").set(now, source=source)
+            registry.gauge("last_run_success", "1 if the last run succeeded").set(status == "success", source=source)
+            if status == "success":
+                registry.gauge("last_success_timestamp_seconds", "End of the last successful run").set(now, source=source)
+            next_run = ((results.get("schedule") or {}).get(source) or {}).get("next_run_at")
+            if next_run:
+                set_next_run(registry, source, datetime.fromisoformat(next_run).timestamp())
+
+        records = registry.gauge("stage_records", "Records produced by each stage in the last run")
+        for step, count_key in (("bills", "total_bills"), ("committees", "total_committees")):
+            result = results.get(step)
+            if isinstance(result, dict) and count_key in result:
+                records.set(result[count_key], stage=f"{step}_scrape")
+        bills = results.get("bills") or {}
+        for stage_name, stage in ((bills.get("pipeline") or {}).get("stages") or {}).items():
+            records.set(stage.get("items_out", 0), stage=f"bills_{stage_name}")
+        for kind, recorded in ((results.get("history") or {}).get("kinds") or {}).items():
+            if recorded.get("success"):
+                records.set(recorded["records"], stage=f"history_{kind}")
+                registry.gauge("history_changed_records", "Records added, changed or removed in the last run").set(
+                    recorded["added"] + recorded["changed"] + recorded["removed"], kind=kind
+                )
+
+        db_import = results.get("db_import") or {}
+        rows = registry.gauge("db_import_rows", "Rows upserted by the last DB import")
+        for table in ("bills", "committees"):
+            if f"{table}_upserted" in db_import and table in sources:
+                rows.set(db_import[f"{table}_upserted"], table=table)
+
+        probe = results.get("probe") or {}
+        if probe:
+            registry.counter("probe_runs_total", "Change probes").inc(skipped=bool(probe.get("skip")))
+
+        for source in sources:
+            http = (results.get(source) or {}).get("http") or {}
+            observe_http(registry, source, http)
+        pdfs = results.get("bills_pdfs") or {}
+        if pdfs.get("success"):
+            observe_http(registry, "pdfs", pdfs.get("http") or {})
+            outcomes = registry.gauge("pdf_downloads", "Bill PDF links of the last run by outcome")
+            for outcome in ("downloaded", "resumed", "deduplicated", "not_modified", "unchanged", "failed"):
+                outcomes.set(pdfs.get(outcome, 0), outcome=outcome)
+        pdf_text = results.get("bills_pdf_text") or {}
+        if pdf_text.get("success"):
+            records.set(pdf_text["pages"], stage="bills_pdf_text")
+            registry.gauge("pdf_text_failures", "PDFs whose text extraction failed in the last run").set(pdf_text["failed"])
+        observe_loop(registry, results.get("loop") or {})
+
+
+def observe_http(registry: MetricsRegistry, source: str, http: Dict[str, Any]) -> None:
+    bounds = [bound / 1000 for bound in LATENCY_BUCKETS_MS]
+    for host, stats in (http.get("hosts") or {}).items():
+        for status, count in stats["statuses"].items():
+            registry.counter("http_requests_total", "HTTP requests by status").inc(count, source=source, host=host, status=status)
+        registry.counter("http_errors_total", "Failed HTTP requests").inc(stats["errors"], source=source, host=host)
+        registry.counter("http_received_bytes_total", "HTTP bytes received").inc(stats["bytes"], source=source, host=host)
+        registry.counter("http_retries_total", "HTTP connection retries").inc(stats["retries"], source=source, host=host)
+        for field, name, help_text in (
+            ("latency", "http_request_duration_seconds", "HTTP request latency"),
+            ("ttfb", "http_ttfb_seconds", "HTTP time to first byte"),
+            ("slot_wait", "http_slot_wait_seconds", "Time waiting for a per-host request slot"),
+        ):
+            histogram = stats[field]
+            registry.histogram(name, help_text, bounds).merge(
+                list(histogram["buckets"].values()),
+                histogram["sum_ms"] / 1000,
+                histogram["count"],
+                source=source,
+                host=host,
+            )
+
+
+def observe_loop(registry: MetricsRegistry, loop: Dict[str, Any]) -> None:
+    """Event-loop lag, stalls, resources and governor actions of a run (scraper.loop_monitor)."""
+    if not loop.get("success"):
+        return
+    lag = loop["lag"]
+    registry.histogram("event_loop_lag_seconds", "Event loop lag", [bound / 1000 for bound in LATENCY_BUCKETS_MS]).merge(
+        list(lag["buckets"].values()), lag["sum_ms"] / 1000, lag["count"]
+    )
+    registry.counter("event_loop_stalls_total", "Event loop stalls").inc(loop["stalls"])
+    registry.counter("event_loop_stalled_seconds_total", "Time the event loop was blocked").inc(loop["stalled_seconds"])
+    resources = loop["resources"]
+    if resources.get("rss_peak_bytes") is not None:
+        registry.gauge("run_rss_peak_bytes", "Peak resident memory during the last run").set(resources["rss_peak_bytes"])
+    if resources.get("open_sockets_peak") is not None:
+        registry.gauge("run_open_sockets_peak", "Peak open sockets during the last run").set(resources["open_sockets_peak"])
+    for action in loop["governor"]["actions"]:
+        direction = "down" if action["to"] < action["from"] else "up"
+        registry.counter("governor_adjustments_total", "Per-host limit changes by the governor").inc(direction=direction)
+
+
+def set_next_run(registry: MetricsRegistry, source: str, timestamp: float) -> None:
+    registry.gauge("next_run_timestamp_seconds", "Next scheduled run").set(timestamp, source=source)
+
+
+# =====================================================================
+# EXPORT
+# =====================================================================
+
+def write_textfile(path: str = METRICS_TEXTFILE, registry: MetricsRegistry = METRICS) -> None:
+    """Atomically write the metrics for node_exporter's textfile collector."""
+    if not path:
+        return
+    target = Path(path)
+    partial = target.with_name(target.name + ".partial")
+    try:
+        partial.write_text(registry.render(), encoding="utf-8")
+        os.replace(partial, target)
+    except OSError as exc:
+        log.warning("Writing metrics textfile %s failed: %s", target, exc)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = METRICS
+    status: RunStatus = RUN_STATUS
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = self.registry.render().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path == "/status":
+            body = json.dumps(self.status.snapshot(), ensure_ascii=False, indent=2).encode("utf-8")
+            content_type = "application/json"
+        elif path == "/healthz":
+            body, content_type = b"ok\n", "text/plain"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.debug("metrics %s - %s", self.address_string(), format % args)
+
+
+def start_metrics_server(host: str = METRICS_HOST, port: int = METRICS_PORT) -> Optional[ThreadingHTTPServer]:
+    """Serve /metrics, /status and /healthz from a daemon thread (port 0: disabled)."""
+    if not port:
+        return None
+    try:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    except OSError as exc:
+        log.warning("Metrics endpoint not started on %s:%d: %s", host, port, exc)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    log.info("Metrics on http://%s:%d/metrics, status on /status", host, port)
+    return server
@@ -0,0 +1,289 @@
+"""
+Text extraction from downloaded bill PDFs (see scraper.pdfs).
+
+PDF parsing is CPU-bound, so documents are extracted in a process pool and
+the event loop only awaits the results. Work is keyed by the content hash
+from the PDF manifest: a document is extracted once per extractor version,
+however many bills link it and however often it is re-downloaded. Failures
+are cached too, so a broken PDF is not re-parsed on every run.
+
+Per-document text goes to data/pdf_text/<ab>/<sha256>.pages:
+
+    b"PDFPAGES"  magic
+    uint32       page count n
+    uint64[n+1]  byte offsets of each page in the body (little-endian)
+    body         UTF-8 text of all pages, concatenated
+
+so `PageText(path)[i]` memory-maps the file and decodes only page i.
+index.json records pages, characters and errors per hash.
+
+    python -m scraper.pdf_text              # extract new PDFs of the manifest
+    python -m scraper.pdf_text --workers 2
+"""
+
+import argparse
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+import pypdf
+
+from scraper import codec
+from scraper.logs import configure_logging
+from scraper.pdfs import PdfStore
+
+
+log = logging.getLogger(__name__)
+
+
+TEXT_DIR = Path(__file__).resolve().parent.parent / "data" / "pdf_text"
+TEXT_WORKERS = int(os.getenv("SCRAPER_PDF_TEXT_WORKERS", "0")) or os.cpu_count() or 1
+TEXT_MAX_PAGES = int(os.getenv("SCRAPER_PDF_TEXT_MAX_PAGES", "1000"))
+
+# Bump to re-extract everything (e.g. after changing how pages are cleaned)
+EXTRACTOR_VERSION = 1
+PAGES_MAGIC = b"PDFPAGES"
+HEADER = struct.Struct("<8sI")
+OFFSET = struct.Struct("<Q")
+MAX_REPORTED_ERRORS = 20
+
+
+def extractor_id() -> str:
+    return f"pypdf-{pypdf.__version__}/{EXTRACTOR_VERSION}"
+
+
+# =====================================================================
+# PAGE FILES
+# =====================================================================
+
+def write_pages(path: Path, pages: List[str]) -> int:
+    """Write `pages` in the .pages format (atomically); returns the file size."""
+    encoded = [page.encode("utf-8", "replace") for page in pages]
+    offsets = [0]
+    for page in encoded:
+        offsets.append(offsets[-1] + len(page))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as handle:
+        handle.write(HEADER.pack(PAGES_MAGIC, len(pages)))
+        handle.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        for page in encoded:
+            handle.write(page)
+    os.replace(tmp, path)
+    return path.stat().st_size
+
+
+class PageText:
+    """Read-only, memory-mapped view of a .pages file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != PAGES_MAGIC:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a page text file")
+        self._body = HEADER.size + OFFSET.size * (self.count + 1)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start, end = struct.unpack_from("<2Q", self._map, HEADER.size + OFFSET.size * index)
+        return self._map[self._body + start:self._body + end].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[index] for index in range(self.count))
+
+    def text(self) -> str:
+        return "\n\n".join(self)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "PageText":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# =====================================================================
+# WORKER (runs in the process pool)
+# =====================================================================
+
+def _init_worker() -> None:
+    # pypdf logs a warning for every malformed object it recovers from
+    logging.getLogger("pypdf").setLevel(logging.ERROR)
+
+
+def extract_pdf(pdf_path: str, out_path: str, max_pages: int = TEXT_MAX_PAGES) -> Dict[str, Any]:
+    """Extract the text of one PDF into `out_path`; returns its stats or error."""
+    started = time.process_time()
+    try:
+        reader = pypdf.PdfReader(pdf_path)
+        pages = []
+        for number, page in enumerate(reader.pages):
+            if number >= max_pages:
+                break
+            try:
+                pages.append(page.extract_text() or "")
+            except Exception:  # one bad page should not lose the document
+                pages.append("")
+        size = write_pages(Path(out_path), pages)
+        return {
+            "success": True,
+            "pages": len(pages),
+            "total_pages": len(reader.pages),
+            "chars": sum(len(page) for page in pages),
+            "bytes": size,
+            "cpu_seconds": round(time.process_time() - started, 3),
+        }
+    except Exception as exc:
+        return {"success": False, "error": f"{type(exc).__name__}: {exc}"}
+
+
+# =====================================================================
+# EXTRACTION STAGE
+# =====================================================================
+
+class TextStore:
+    """Extracted page files and the per-hash index."""
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root or TEXT_DIR)
+        self.index_path = self.root / "index.json"
+        self.extractor = extractor_id()
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        if self.index_path.exists():
+            index = codec.read(self.index_path)
+            if index.get("extractor") == self.extractor:
+                self.documents = index.get("documents", {})
+
+    def save(self) -> None:
+        codec.write(
+            self.index_path,
+            {"version": 1, "extractor": self.extractor, "documents": self.documents},
+            pretty=True,
+        )
+
+    def path(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / f"{sha256}.pages"
+
+    def cached(self, sha256: str) -> bool:
+        entry = self.documents.get(sha256)
+        return bool(entry) and (not entry.get("success") or self.path(sha256).exists())
+
+    def open(self, sha256: str) -> Optional[PageText]:
+        """Pages of a document, or None when it has no extracted text."""
+        path = self.path(sha256)
+        return PageText(path) if path.exists() else None
+
+
+async def extract_texts(
+    pdf_store: Optional[PdfStore] = None,
+    text_store: Optional[TextStore] = None,
+    workers: int = TEXT_WORKERS,
+    deadline: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Extract every PDF of the manifest that is not cached yet. At most
+    2 * `workers` documents are queued at a time, so no new ones are started
+    after `deadline` (time.monotonic()).
+    """
+    pdf_store = pdf_store or PdfStore()
+    text_store = text_store or TextStore()
+    started = time.monotonic()
+
+    hashes: Set[str] = {entry["sha256"] for entry in pdf_store.entries.values() if pdf_store.has_object(entry)}
+    pending = sorted(sha for sha in hashes if not text_store.cached(sha))
+    result: Dict[str, Any] = {
+        "success": True,
+        "documents": len(hashes),
+        "cached": len(hashes) - len(pending),
+        "extracted": 0,
+        "failed": 0,
+        "deferred_count": 0,
+        "pages": 0,
+        "errors": [],
+    }
+    log.info("PDF text: %d documents, %d cached, %d to extract", len(hashes), result["cached"], len(pending))
+
+    loop = asyncio.get_running_loop()
+    in_flight: Dict[asyncio.Future, str] = {}
+    queue = list(reversed(pending))
+    with ProcessPoolExecutor(max_workers=max(1, workers), mp_context=get_context("spawn"), initializer=_init_worker) as pool:
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < 2 * workers:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        result["deferred_count"] = len(queue)
+                        queue.clear()
+                        break
+                    sha256 = queue.pop()
+                    future = loop.run_in_executor(
+                        pool, extract_pdf, str(pdf_store.object_path(sha256)), str(text_store.path(sha256))
+                    )
+                    in_flight[future] = sha256
+                if not in_flight:
+                    break
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    sha256 = in_flight.pop(future)
+                    try:
+                        document = future.result()
+                        text_store.documents[sha256] = document
+                    except Exception as exc:  # worker died (e.g. killed for memory); retried next run
+                        document = {"success": False, "error": f"{type(exc).__name__}: {exc}"}
+                    if document["success"]:
+                        result["extracted"] += 1
+                        result["pages"] += document["pages"]
+                    else:
+                        result["failed"] += 1
+                        log.warning("Extracting %s failed: %s", sha256[:12], document["error"])
+                        if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                            result["errors"].append({"sha256": sha256, "error": document["error"]})
+        finally:
+            text_store.save()
+
+    duration = time.monotonic() - started
+    result["duration_seconds"] = round(duration, 2)
+    result["pages_per_second"] = round(result["pages"] / duration, 1) if result["pages"] else None
+    result["output"] = str(text_store.root)
+    return result
+
+
+# =====================================================================
+# CLI
+# =====================================================================
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Extract text from downloaded bill PDFs")
+    parser.add_argument("--workers", type=int, default=TEXT_WORKERS, help="Extraction processes")
+    args = parser.parse_args()
+
+    result = await extract_texts(workers=args.workers)
+    if not result.get("success"):
+        log.error("PDF text extraction failed: %s", result.get("error"))
+        return
+    log.info(
+        "PDF text: %d extracted, %d cached, %d failed; %d pages at %s pages/s",
+        result["extracted"], result["cached"], result["failed"], result["pages"], result["pages_per_second"],
+    )
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main())
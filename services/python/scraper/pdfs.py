@@ -0,0 +1,406 @@
+"""
+Bill PDF downloads (the `resource_link` of each cleaned bill).
+
+PDFs are stored once per content under data/pdfs:
+
+- objects/ab/<sha256>.pdf   content addressed, so a document linked from
+                            several bills, or re-uploaded under a new URL,
+                            is kept once
+- partial/<url hash>.part   an interrupted download plus its validators
+                            (.json); the next run resumes it with a Range
+                            request, guarded by If-Range
+- manifest.json             bill key ("HoR:123") -> url, sha256, size,
+                            ETag / Last-Modified and timestamps
+
+Each run only requests what may have changed: links that are new or whose
+URL changed are downloaded, and known links are revalidated with a
+conditional GET (If-None-Match / If-Modified-Since) once their last check
+is older than SCRAPER_PDF_REVALIDATE_HOURS. Downloads stream to disk through
+a HostLimiter, so they keep to the per-host limit (and the loop governor)
+like the scrapers.
+
+    python -m scraper.pdfs                 # PDFs of the latest cleaned bills
+    python -m scraper.pdfs --revalidate    # revalidate every known link now
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from scraper import codec
+from scraper.artifacts import ArtifactStore
+from scraper.concurrency import HostLimiter
+from scraper.history import RECORD_KEYS
+from scraper.logs import bind_log_context, configure_logging
+from scraper.telemetry import RequestTelemetry
+from scraper.tracing import span
+
+
+log = logging.getLogger(__name__)
+
+
+PDF_DIR = Path(__file__).resolve().parent.parent / "data" / "pdfs"
+PDF_WORKERS = int(os.getenv("SCRAPER_PDF_WORKERS", "4"))
+PDF_REVALIDATE_HOURS = float(os.getenv("SCRAPER_PDF_REVALIDATE_HOURS", "168"))
+PDF_MAX_BYTES = int(float(os.getenv("SCRAPER_PDF_MAX_MB", "200")) * 1024 * 1024)
+PDF_TIMEOUT_SECONDS = float(os.getenv("SCRAPER_PDF_TIMEOUT_SECONDS", "120"))
+
+CHUNK_SIZE = 256 * 1024
+MANIFEST_SAVE_EVERY = 25
+MAX_REPORTED_ERRORS = 20
+PDF_MAGIC = b"%PDF-"
+
+bill_key = RECORD_KEYS["bills_cleaned"]
+
+
+class DownloadError(Exception):
+    """A PDF could not be fetched (HTTP error, truncated or not a PDF)."""
+
+
+# =====================================================================
+# STORE
+# =====================================================================
+
+class PdfStore:
+    """Content-addressed PDF objects, resumable partials and the bill manifest."""
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root or PDF_DIR)
+        self.objects_dir = self.root / "objects"
+        self.partial_dir = self.root / "partial"
+        self.manifest_path = self.root / "manifest.json"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.manifest_path.exists():
+            self.entries = codec.read(self.manifest_path).get("bills", {})
+
+    def save(self) -> None:
+        codec.write(self.manifest_path, {"version": 1, "bills": self.entries}, pretty=True)
+
+    def object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}.pdf"
+
+    def partial_path(self, url: str) -> Path:
+        return self.partial_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.part"
+
+    def has_object(self, entry: Optional[Dict[str, Any]]) -> bool:
+        return bool(entry and entry.get("sha256") and self.object_path(entry["sha256"]).exists())
+
+    def path_of(self, key: str) -> Optional[Path]:
+        """Local PDF of a bill key, or None when not downloaded."""
+        entry = self.entries.get(key)
+        return self.object_path(entry["sha256"]) if self.has_object(entry) else None
+
+    def commit(self, partial: Path, sha256: str) -> bool:
+        """Move a finished download into objects/; False when the content was already stored."""
+        target = self.object_path(sha256)
+        if target.exists():
+            partial.unlink()
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(partial, target)
+        return True
+
+
+def hash_file(path: Path) -> "hashlib._Hash":
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while chunk := handle.read(CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher
+
+
+# =====================================================================
+# DOWNLOADER
+# =====================================================================
+
+class PdfDownloader:
+    """Downloads the PDFs of cleaned bills that are new, changed or due for revalidation."""
+
+    def __init__(
+        self,
+        store: Optional[PdfStore] = None,
+        limiter: Optional[HostLimiter] = None,
+        workers: int = PDF_WORKERS,
+        revalidate_hours: float = PDF_REVALIDATE_HOURS,
+        telemetry: Optional[RequestTelemetry] = None,
+    ) -> None:
+        self.store = store or PdfStore()
+        self.limiter = limiter or HostLimiter()
+        self.workers = max(1, workers)
+        self.revalidate_seconds = revalidate_hours * 3600
+        self.telemetry = telemetry or RequestTelemetry("pdfs")
+        self.client = httpx.AsyncClient(
+            timeout=PDF_TIMEOUT_SECONDS,
+            verify=False,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+                "Accept": "application/pdf,*/*;q=0.8",
+                # Byte ranges must refer to the stored bytes
+                "Accept-Encoding": "identity",
+            },
+            follow_redirects=True,
+        )
+        self.counts = {
+            "links": 0,
+            "unchanged": 0,
+            "requested": 0,
+            "downloaded": 0,
+            "resumed": 0,
+            "deduplicated": 0,
+            "not_modified": 0,
+            "failed": 0,
+            "deferred_count": 0,
+            "bytes": 0,
+        }
+        self.errors: List[Dict[str, Any]] = []
+        self._completed = 0
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        self.telemetry.close()
+
+    def plan(self, records: List[Dict[str, Any]], revalidate_all: bool = False) -> List[Tuple[str, List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """
+        (url, bills linking it, previous entry) of every link that needs a
+        request; bills sharing a link get one request.
+        """
+        now = time.time()
+        fresh_by_url: Dict[str, Dict[str, Any]] = {}
+        for entry in self.store.entries.values():
+            if self.store.has_object(entry) and now - entry.get("checked_at", 0) < self.revalidate_seconds:
+                fresh_by_url.setdefault(entry["url"], entry)
+
+        jobs: Dict[str, Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]] = {}
+        seen = set()
+        for record in records:
+            url = (record.get("resource_link") or "").strip()
+            key = bill_key(record)
+            if not url or key in seen:
+                continue
+            seen.add(key)
+            self.counts["links"] += 1
+            entry = self.store.entries.get(key)
+            known = entry if entry and entry["url"] == url and self.store.has_object(entry) else None
+            if url in fresh_by_url and not revalidate_all:
+                # Checked recently, for this bill or another one linking the same document
+                if known is None:
+                    self.store.entries[key] = self._entry(record, fresh_by_url[url])
+                self.counts["unchanged"] += 1
+                continue
+            bills, previous = jobs.setdefault(url, ([], known))
+            bills.append(record)
+            if previous is None and known is not None:
+                jobs[url] = (bills, known)
+        return [(url, bills, previous) for url, (bills, previous) in jobs.items()]
+
+    async def run(
+        self,
+        records: List[Dict[str, Any]],
+        revalidate_all: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Fetch what `plan` selects; stops dispatching at `deadline` (time.monotonic())."""
+        started = time.monotonic()
+        jobs = self.plan(records, revalidate_all)
+        log.info(
+            "PDFs: %d links, %d unchanged, %d to request",
+            self.counts["links"], self.counts["unchanged"], len(jobs),
+        )
+        queue: asyncio.Queue = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        async def worker() -> None:
+            while not queue.empty():
+                url, bills, previous = queue.get_nowait()
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.counts["deferred_count"] += 1
+                    continue
+                bind_log_context(stage="bills.pdfs", house=bills[0].get("type"), bill_id=bills[0].get("bill_id"))
+                await self._fetch(url, bills, previous)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.workers)))
+        finally:
+            self.store.save()
+
+        return {
+            "success": True,
+            "duration_seconds": round(time.monotonic() - started, 2),
+            **self.counts,
+            "errors": self.errors,
+            "output": str(self.store.manifest_path),
+            "http": self.telemetry.summary(),
+        }
+
+    @staticmethod
+    def _entry(record: Dict[str, Any], download: Dict[str, Any]) -> Dict[str, Any]:
+        entry = {"bill_id": record.get("bill_id"), "type": record.get("type")}
+        entry.update((key, value) for key, value in download.items() if key not in entry)
+        return entry
+
+    async def _fetch(self, url: str, bills: List[Dict[str, Any]], previous: Optional[Dict[str, Any]]) -> None:
+        self.counts["requested"] += 1
+        try:
+            with span("pdfs.download", bill_id=bills[0].get("bill_id"), url=url, bills=len(bills)) as current:
+                outcome, download = await self._download(url, previous)
+                current.set(outcome=outcome, bytes=download.get("size"))
+        except Exception as exc:
+            self.counts["failed"] += 1
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append({"key": bill_key(bills[0]), "url": url, "error": f"{type(exc).__name__}: {exc}"})
+            log.warning("PDF %s failed: %s", url, exc)
+            return
+
+        self.counts[outcome] += 1
+        for record in bills:
+            self.store.entries[bill_key(record)] = self._entry(record, download)
+        self._completed += 1
+        if self._completed % MANIFEST_SAVE_EVERY == 0:
+            self.store.save()
+
+    async def _download(self, url: str, previous: Optional[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """
+        GET one PDF; returns (outcome, manifest entry) where outcome is
+        "downloaded", "resumed", "deduplicated" or "not_modified".
+        """
+        partial = self.store.partial_path(url)
+        meta_path = partial.with_suffix(".json")
+        headers: Dict[str, str] = {}
+        offset = 0
+        hasher = hashlib.sha256()
+
+        meta = codec.read(meta_path) if meta_path.exists() and partial.exists() else None
+        if meta and partial.stat().st_size and meta.get("url") == url and (meta.get("etag") or meta.get("last_modified")):
+            offset = partial.stat().st_size
+            hasher = hash_file(partial)
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = meta.get("etag") or meta["last_modified"]
+        elif previous:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        now = int(time.time())
+        queued_at = time.perf_counter()
+        status: Optional[int] = None
+        received = 0
+        error: Optional[str] = None
+        async with self.limiter.slot(url):
+            started = time.perf_counter()
+            try:
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    status = response.status_code
+                    if status == 304 and previous:
+                        return "not_modified", {**previous, "checked_at": now}
+                    if status not in (200, 206):
+                        raise DownloadError(f"HTTP {status}")
+                    if status == 206 and not response.headers.get("content-range", "").startswith(f"bytes {offset}-"):
+                        raise DownloadError(f"unexpected Content-Range {response.headers.get('content-range')!r}")
+                    if status == 200:
+                        offset = 0
+                        hasher = hashlib.sha256()
+
+                    validators = {
+                        "url": url,
+                        "etag": response.headers.get("etag"),
+                        "last_modified": response.headers.get("last-modified"),
+                    }
+                    partial.parent.mkdir(parents=True, exist_ok=True)
+                    codec.write(meta_path, validators)
+                    expected = response.headers.get("content-length")
+                    with open(partial, "ab" if offset else "wb") as handle:
+                        async for chunk in response.aiter_raw():
+                            handle.write(chunk)
+                            hasher.update(chunk)
+                            received += len(chunk)
+                            if offset + received > PDF_MAX_BYTES:
+                                raise DownloadError(f"larger than {PDF_MAX_BYTES} bytes")
+            except Exception as exc:
+                error = type(exc).__name__
+                raise
+            finally:
+                self.telemetry.record(url, started, time.perf_counter(), {}, status, received, 0, 0, error, queued_at)
+                self.counts["bytes"] += received
+
+        if expected is not None and received != int(expected):
+            raise DownloadError(f"truncated: {received} of {expected} bytes (will resume)")
+        with open(partial, "rb") as handle:
+            if handle.read(len(PDF_MAGIC)) != PDF_MAGIC:
+                partial.unlink()
+                meta_path.unlink(missing_ok=True)
+                raise DownloadError("response is not a PDF")
+
+        sha256 = hasher.hexdigest()
+        size = partial.stat().st_size
+        stored = self.store.commit(partial, sha256)
+        meta_path.unlink(missing_ok=True)
+        outcome = "resumed" if offset else ("downloaded" if stored else "deduplicated")
+        entry = {
+            "url": url,
+            "sha256": sha256,
+            "size": size,
+            "etag": validators["etag"],
+            "last_modified": validators["last_modified"],
+            "downloaded_at": now,
+            "checked_at": now,
+        }
+        if previous and previous.get("sha256") == sha256:
+            entry["downloaded_at"] = previous.get("downloaded_at", now)
+        return outcome, entry
+
+
+async def download_bill_pdfs(
+    records: Optional[List[Dict[str, Any]]] = None,
+    revalidate_all: bool = False,
+    deadline: Optional[float] = None,
+    store: Optional[PdfStore] = None,
+) -> Dict[str, Any]:
+    """Download the PDFs of `records` (default: the latest bills_cleaned artifact)."""
+    if records is None:
+        latest = ArtifactStore().latest_path("bills_cleaned")
+        if latest is None:
+            return {"success": False, "error": "no cleaned bills artifact"}
+        records = codec.read(latest)
+    downloader = PdfDownloader(store)
+    try:
+        return await downloader.run(records, revalidate_all=revalidate_all, deadline=deadline)
+    finally:
+        await downloader.close()
+
+
+# =====================================================================
+# CLI
+# =====================================================================
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Download bill PDFs")
+    parser.add_argument("--cleaned", type=Path, help="Cleaned bills file (default: latest artifact)")
+    parser.add_argument("--revalidate", action="store_true", help="Revalidate every known link now")
+    args = parser.parse_args()
+
+    records = codec.read(args.cleaned) if args.cleaned else None
+    result = await download_bill_pdfs(records, revalidate_all=args.revalidate)
+    if not result.get("success"):
+        log.error("PDF download failed: %s", result.get("error"))
+        return
+    log.info(
+        "PDFs: %d downloaded (%d resumed, %d deduplicated), %d not modified, %d unchanged, %d failed, %.1f MB",
+        result["downloaded"], result["resumed"], result["deduplicated"], result["not_modified"],
+        result["unchanged"], result["failed"], result["bytes"] / 1e6,
+    )
+    for error in result["errors"]:
+        log.info("  %s %s: %s", error["key"], error["url"], error["error"])
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main())
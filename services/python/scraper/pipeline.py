@@ -0,0 +1,1473 @@
+"""
+Nepal Federal Legislative Scraper - Main Controller
+
+Controls scraping for bills + committees, then cleans and imports to DB.
+The scrapers, psycopg2 and APScheduler are imported when first used, so
+importing this module (or `scraper.run_pipeline`) stays cheap. Callers load
+.env themselves; the CLI does so through `scraper.load_env()`.
+
+Usage (`python main.py` and `python -m scraper` are the same CLI):
+    python main.py                                  # run once now
+    python main.py --schedule                       # run bills/committees on their own schedules
+    python main.py --schedule --run-now             # run now, then schedule
+    python main.py --schedule --timezone Asia/Kathmandu
+    curl localhost:9464/metrics                     # Prometheus metrics while scheduling
+    curl localhost:9464/status                      # progress of the current run
+    python main.py --force-full                     # skip the change probe
+    python main.py --time-budget 1800               # stop dispatching bills after 30 min
+    python main.py --profile                        # write per-stage CPU/memory profiles
+    python main.py --trace                          # write a span trace (Perfetto / OTLP JSON)
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import logging
+import os
+import re
+import subprocess
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+from scraper import codec
+from scraper.artifacts import ArtifactStore
+from scraper.history import SnapshotHistory
+from scraper.metrics import RUN_STATUS, METRICS, observe_run, set_next_run, start_metrics_server, write_textfile
+from scraper.logs import log_context
+from scraper.loop_monitor import LOOP_MONITOR, LoopMonitor
+from scraper.profiling import PROFILE_DIR, StageProfiler, log_summary
+from scraper.tracing import TRACE, TRACE_FORMAT, Trace, end_trace, export_trace, slowest, span, start_trace
+from scraper.run_lock import RunLock, acquire_run_locks, release_run_locks
+
+if TYPE_CHECKING:
+    from apscheduler.triggers.cron import CronTrigger
+
+
+log = logging.getLogger(__name__)
+
+
+# Paths (data directories are created when first written)
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+OUTPUT_DIR = BASE_DIR / "data" / "output"
+REPO_ROOT = BASE_DIR.parent
+
+
+# Sources scraped by the pipeline, in run order
+SOURCES = ("bills", "committees")
+
+# Schedule configuration
+# Bills run on an adaptive interval; committees change rarely and run on cron.
+BILLS_INTERVAL_MINUTES = int(os.getenv("SCRAPER_BILLS_INTERVAL_MINUTES", "180"))
+BILLS_MIN_INTERVAL_MINUTES = int(os.getenv("SCRAPER_BILLS_MIN_INTERVAL_MINUTES", "60"))
+BILLS_MAX_INTERVAL_MINUTES = int(os.getenv("SCRAPER_BILLS_MAX_INTERVAL_MINUTES", "720"))
+BILLS_QUIET_RUNS_TO_RELAX = 3
+COMMITTEES_SCHEDULE_DAYS = os.getenv("SCRAPER_COMMITTEES_DAYS", "mon,thu")
+COMMITTEES_SCHEDULE_HOUR = int(os.getenv("SCRAPER_COMMITTEES_HOUR", "6"))
+SCHEDULE_MINUTE = 0
+SCHEDULER_STATE_FILE = DATA_DIR / "scheduler_state.json"
+DEFAULT_TIMEZONE = os.getenv("SCRAPER_TIMEZONE", "Asia/Kathmandu")
+
+# Change probe configuration
+PROBE_STATE_FILE = DATA_DIR / "probe_state.json"
+CLEANED_BILLS_FILE = OUTPUT_DIR / "bills_cleaned.json"
+FORCE_FULL_RUN_HOURS = float(os.getenv("SCRAPER_FORCE_FULL_RUN_HOURS", "24"))
+
+# Per-run time budget in seconds (0 = unlimited)
+TIME_BUDGET_SECONDS = float(os.getenv("SCRAPER_TIME_BUDGET_SECONDS", "0"))
+
+# Run reports: scraped data is left out unless SCRAPER_REPORT_INCLUDE_DATA=1
+REPORT_SCHEMA_VERSION = 1
+REPORT_INCLUDE_DATA = os.getenv("SCRAPER_REPORT_INCLUDE_DATA", "0") == "1"
+REPORT_DATA_KEYS = ("data", "deferred", "signature")
+REPORT_MAX_TEXT = 2000
+
+# Per-stage profiles (see scraper.profiling), written to PROFILE_DIR/<run_id>
+PROFILE = os.getenv("SCRAPER_PROFILE", "0") == "1"
+
+# Download the PDFs of newly cleaned bills (see scraper.pdfs) and extract their text (scraper.pdf_text)
+DOWNLOAD_PDFS = os.getenv("SCRAPER_PDFS", "1") == "1"
+EXTRACT_PDF_TEXT = os.getenv("SCRAPER_PDF_TEXT", "1") == "1"
+
+# Refresh the precomputed bill_stats row around the bills import (see scraper.bill_stats)
+REFRESH_BILL_STATS = os.getenv("SCRAPER_BILL_STATS", "1") == "1"
+
+
+# =====================================================================
+# SCRAPER IMPORTS
+# =====================================================================
+
+def import_module(name: str, quiet: bool = False) -> Optional[ModuleType]:
+    """Import a scraper module on first use; None when it (or a dependency) is missing."""
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        if not quiet:
+            log.error("Failed to import %s: %s", name, e)
+        return None
+
+
+def import_bills_scraper():
+    """Import bills scraper module."""
+    return import_module("scraper.bills.scrape_bills")
+
+
+def import_bills_cleaner():
+    """Import bills cleaner/normalizer module."""
+    return import_module("scraper.bills.clean_and_insert_bills", quiet=True)
+
+
+def import_committees_scraper():
+    """Import committees scraper module."""
+    return import_module("scraper.committees.scrape_committees")
+
+
+def import_committees_cleaner():
+    """Import committees cleaner module."""
+    return import_module("scraper.committees.clean_and_insert", quiet=True)
+
+
+# =====================================================================
+# HELPERS
+# =====================================================================
+
+def normalize_result(scraper_name: str, result: Any) -> Optional[Dict[str, Any]]:
+    """Normalize raw list results into summary dict."""
+    if result is None:
+        return None
+
+    if isinstance(result, dict):
+        return result
+
+    if isinstance(result, list):
+        if scraper_name == "bills":
+            return {
+                "success": True,
+                "total_bills": len(result),
+                "hor_count": sum(1 for b in result if b.get("type") == "HoR"),
+                "na_count": sum(1 for b in result if b.get("type") == "NA"),
+            }
+        if scraper_name == "committees":
+            return {
+                "success": True,
+                "total_committees": len(result),
+                "hor_count": sum(1 for c in result if c.get("house") == "HoR"),
+                "na_count": sum(1 for c in result if c.get("house") == "NA"),
+            }
+
+    return {"success": False, "error": f"Unexpected result type for {scraper_name}"}
+
+
+def get_database_url() -> Optional[str]:
+    """Read database URL from env. Supports DATABASE_URL and DATABASEURL."""
+    return os.getenv("DATABASE_URL") or os.getenv("DATABASEURL")
+
+
+def parse_upserted_count(output: str) -> int:
+    """
+    Parse 'Upserted N ...' from Bun importer output.
+    Example: '✓ Upserted 123 bills.'
+    """
+    matches = re.findall(r"upserted\s+(\d+)", output or "", flags=re.IGNORECASE)
+    return int(matches[-1]) if matches else 0
+
+
+def run_bun_script(script_name: str) -> Dict[str, Any]:
+    """Run bun script and return structured result."""
+    try:
+        with span("db.import", script=script_name):
+            completed = subprocess.run(
+                ["bun", "run", script_name],
+                cwd=str(REPO_ROOT),
+                capture_output=True,
+                text=True,
+            )
+    except FileNotFoundError:
+        return {
+            "success": False,
+            "error": "bun executable not found",
+            "script": script_name,
+            "upserted": 0,
+        }
+    except Exception as exc:
+        return {
+            "success": False,
+            "error": str(exc),
+            "script": script_name,
+            "upserted": 0,
+        }
+
+    stdout = (completed.stdout or "").strip()
+    stderr = (completed.stderr or "").strip()
+    upserted = parse_upserted_count(stdout)
+
+    if completed.returncode != 0:
+        return {
+            "success": False,
+            "error": stderr or stdout or f"{script_name} failed",
+            "script": script_name,
+            "upserted": 0,
+            "stdout": stdout,
+            "stderr": stderr,
+        }
+
+    return {
+        "success": True,
+        "script": script_name,
+        "upserted": upserted,
+        "stdout": stdout,
+        "stderr": stderr,
+    }
+
+
+def run_db_imports(sources: Sequence[str] = SOURCES) -> Dict[str, Any]:
+    """Import cleaned JSON of the given sources into DB via Bun scripts."""
+    bills_import: Dict[str, Any] = {}
+    committees_import: Dict[str, Any] = {}
+    if "bills" in sources:
+        bills_import = run_bun_script("db:import-bills")
+    if "committees" in sources:
+        committees_import = run_bun_script("db:import-committees")
+
+    errors: List[str] = []
+    if bills_import and not bills_import.get("success"):
+        errors.append(f"db:import-bills: {bills_import.get('error', 'Unknown error')}")
+    if committees_import and not committees_import.get("success"):
+        errors.append(
+            f"db:import-committees: {committees_import.get('error', 'Unknown error')}"
+        )
+
+    return {
+        "success": not errors,
+        "bills_upserted": bills_import.get("upserted", 0),
+        "committees_upserted": committees_import.get("upserted", 0),
+        "bills_import": bills_import,
+        "committees_import": committees_import,
+        "error": "; ".join(errors) if errors else None,
+    }
+
+
+def collect_errors(results: Dict[str, Any]) -> List[str]:
+    """Collect step errors into a string list for scrape_logs.errors."""
+    errors: List[str] = []
+    for step_name, result in results.items():
+        if isinstance(result, dict) and not result.get("success", True):
+            error_msg = result.get("error", "Unknown error")
+            errors.append(f"{step_name}: {error_msg}")
+    return errors
+
+
+def determine_overall_status(results: Dict[str, Any]) -> str:
+    """Return one of success | partial | failed."""
+    statuses: List[bool] = []
+    for result in results.values():
+        if isinstance(result, dict) and "success" in result:
+            statuses.append(bool(result.get("success")))
+
+    if not statuses:
+        return "failed"
+    if all(statuses):
+        return "success"
+    if any(statuses):
+        return "partial"
+    return "failed"
+
+
+# =====================================================================
+# BILL PDFS
+# =====================================================================
+
+def cleaned_bills_of_run(store: ArtifactStore, run_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Cleaned bill records written in this run, None if bills were not cleaned."""
+    entry = store.latest("bills_cleaned")
+    if not entry or entry.get("run_id") != run_id:
+        return None
+    return codec.read(store.root / entry["name"])
+
+
+async def download_pdfs(store: ArtifactStore, run_id: str, deadline: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Fetch new or changed PDFs of the bills cleaned in this run."""
+    pdfs = import_module("scraper.pdfs")
+    if pdfs is None:
+        return None
+    records = cleaned_bills_of_run(store, run_id)
+    if records is None:
+        return None
+    return await pdfs.download_bill_pdfs(records, deadline=deadline)
+
+
+async def extract_pdf_texts(deadline: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Extract the text of downloaded PDFs not extracted before."""
+    pdf_text = import_module("scraper.pdf_text")
+    if pdf_text is None:
+        return None
+    return await pdf_text.extract_texts(deadline=deadline)
+
+
+# =====================================================================
+# BILL STATS
+# =====================================================================
+
+def start_bill_stats(run_id: str, sources: Sequence[str]) -> Optional[Any]:
+    """Read what the bills import will change, before it runs; None when stats are not refreshed."""
+    db_url = get_database_url()
+    if not REFRESH_BILL_STATS or "bills" not in sources or not db_url:
+        return None
+    bill_stats = import_module("scraper.bill_stats")
+    if bill_stats is None:
+        return None
+    return bill_stats.StatsRefresh.start(db_url, run_id)
+
+
+# =====================================================================
+# SEARCH INDEX AND TITLE RELATIONS
+# =====================================================================
+
+def update_bill_indexes(store: ArtifactStore, run_id: str) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Apply this run's cleaned bills to the search index (scraper.search) and
+    the title relations (scraper.similarity); None for bills not cleaned.
+    """
+    try:
+        records = cleaned_bills_of_run(store, run_id)
+    except Exception as exc:
+        log.error("Reading cleaned bills failed: %s", exc, exc_info=True)
+        error = {"success": False, "error": str(exc)}
+        return {"search_index": error, "relations": error}
+    if records is None:
+        return {"search_index": None, "relations": None}
+
+    search = import_module("scraper.search")
+    similarity = import_module("scraper.similarity")
+    return {
+        "search_index": search.update_search_index(records, run_id, store) if search else None,
+        "relations": similarity.update_relations(records, run_id, store) if similarity else None,
+    }
+
+
+# =====================================================================
+# SNAPSHOT HISTORY
+# =====================================================================
+
+def record_history(store: ArtifactStore, run_id: str, sources: Sequence[str] = SOURCES) -> Dict[str, Any]:
+    """Add this run's cleaned datasets to the snapshot history."""
+    history = SnapshotHistory()
+    result: Dict[str, Any] = {"success": True, "kinds": {}}
+    for source in sources:
+        kind = f"{source}_cleaned"
+        entry = store.latest(kind)
+        if not entry or entry.get("run_id") != run_id:
+            continue  # not cleaned in this run
+        try:
+            records = codec.read(store.root / entry["name"])
+            result["kinds"][kind] = history.record_run(kind, records, run_id)
+        except Exception as exc:
+            log.error("Recording %s history failed: %s", kind, exc, exc_info=True)
+            result["kinds"][kind] = {"success": False, "error": str(exc)}
+            result["success"] = False
+            result["error"] = str(exc)
+    return result
+
+
+# =====================================================================
+# RUN STATUS & METRICS
+# =====================================================================
+
+@contextmanager
+def pipeline_stage(profiler: StageProfiler, name: str) -> Iterator[None]:
+    """Run one pipeline step as the current stage of the run status and logs, profiled when enabled."""
+    with RUN_STATUS.stage(name), profiler.stage(name), span(f"pipeline.{name}"), log_context(stage=name):
+        yield
+
+
+def save_trace(store: ArtifactStore, trace: Trace, run_id: str) -> Dict[str, Any]:
+    """Store the run's trace as an artifact; the slowest bills and committees go in the report."""
+    try:
+        entry = store.put("trace", export_trace(trace), run_id)
+    except Exception as exc:
+        log.error("Saving trace failed: %s", exc)
+        return {"success": False, "error": str(exc)}
+    log.info("Saved trace: %s (%d spans)", store.root / entry["name"], len(trace.spans))
+    return {
+        "success": True,
+        "output": str(store.root / entry["name"]),
+        "format": TRACE_FORMAT,
+        "spans": len(trace.spans),
+        "dropped_spans": trace.dropped,
+        "slowest_bills": slowest(trace, "bills.fetch"),
+        "slowest_committees": slowest(trace, "committees.committee"),
+    }
+
+
+def publish_run_metrics(
+    results: Dict[str, Any],
+    sources: Sequence[str],
+    run_id: str,
+    run_started: float,
+) -> None:
+    """Feed a finished run into the status endpoint, the metrics and the textfile."""
+    try:
+        status = determine_overall_status(results)
+        RUN_STATUS.finish(sources, run_id, status, time.monotonic() - run_started)
+        observe_run(results, sources, status)
+        write_textfile()
+    except Exception as exc:
+        log.warning("Publishing run metrics failed: %s", exc, exc_info=True)
+
+
+# =====================================================================
+# CHANGE PROBE
+# =====================================================================
+
+def load_probe_state() -> Dict[str, Any]:
+    """Load the signature stored after the last successful full run."""
+    try:
+        state = codec.read(PROBE_STATE_FILE)
+        return state if isinstance(state, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:
+        log.warning("Ignoring unreadable probe state %s: %s", PROBE_STATE_FILE, exc)
+        return {}
+
+
+def save_probe_state(signature: Dict[str, str]) -> None:
+    """Persist the probe signature of a successful full run."""
+    DATA_DIR.mkdir(exist_ok=True)
+    state = {
+        "signature": signature,
+        "last_full_run_at": datetime.utcnow().isoformat(timespec="seconds"),
+    }
+    codec.write(PROBE_STATE_FILE, state)
+
+
+def load_previous_cleaned_bills() -> List[Dict[str, Any]]:
+    """Load the cleaned bills of the previous run, or [] if unavailable."""
+    try:
+        data = codec.read(CLEANED_BILLS_FILE)
+        return data if isinstance(data, list) else []
+    except Exception:
+        return []
+
+
+async def run_change_probe(scrape_bills: Any, force_full: bool = False) -> Dict[str, Any]:
+    """
+    Decide whether a full run is needed.
+
+    Returns a result dict with `skip` (True when nothing changed upstream),
+    `reason`, the number of probe requests and the fresh `signature`.
+    """
+    state = load_probe_state()
+    previous_signature = state.get("signature") or {}
+
+    last_full_run_at = None
+    if state.get("last_full_run_at"):
+        try:
+            last_full_run_at = datetime.fromisoformat(state["last_full_run_at"])
+        except ValueError:
+            last_full_run_at = None
+
+    sample = scrape_bills.select_probe_sample(load_previous_cleaned_bills())
+    probe = await scrape_bills.probe_signature(sample)
+    if not probe.get("success"):
+        log.warning("Change probe failed (%s); running full pipeline.", probe.get("error"))
+        return {
+            "success": True,
+            "skip": False,
+            "changed": True,
+            "reason": f"probe failed: {probe.get('error')}",
+            "requests": probe.get("requests", 0),
+        }
+
+    signature = probe["signature"]
+    # Sampled bills rotate between runs, so only bills probed both times are
+    # compared; new bills show up through the list page fingerprints.
+    changed_keys = sorted(
+        key
+        for key, value in signature.items()
+        if (key in previous_signature or key.startswith("list:"))
+        and previous_signature.get(key) != value
+    )
+    result = {
+        "success": True,
+        "changed": bool(changed_keys),
+        "changed_keys": changed_keys,
+        "requests": probe.get("requests", 0),
+        "signature": signature,
+    }
+
+    if force_full:
+        result.update(skip=False, reason="forced by --force-full")
+    elif changed_keys:
+        result.update(skip=False, reason=f"{len(changed_keys)} probe key(s) changed")
+    elif last_full_run_at is None:
+        result.update(skip=False, reason="no previous full run recorded")
+    elif datetime.utcnow() - last_full_run_at > timedelta(hours=FORCE_FULL_RUN_HOURS):
+        result.update(
+            skip=False,
+            reason=f"forced: last full run older than {FORCE_FULL_RUN_HOURS:g}h",
+        )
+    else:
+        result.update(skip=True, reason="no upstream change detected")
+
+    return result
+
+
+# =====================================================================
+# ADAPTIVE SCHEDULING
+# =====================================================================
+
+def load_scheduler_state() -> Dict[str, Any]:
+    """Load per-source scheduling state (interval, recent outcomes)."""
+    try:
+        state = codec.read(SCHEDULER_STATE_FILE)
+        return state if isinstance(state, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:
+        log.warning("Ignoring unreadable scheduler state %s: %s", SCHEDULER_STATE_FILE, exc)
+        return {}
+
+
+def save_scheduler_state(state: Dict[str, Any]) -> None:
+    DATA_DIR.mkdir(exist_ok=True)
+    codec.write(SCHEDULER_STATE_FILE, state)
+
+
+def current_bills_interval() -> int:
+    """Interval (minutes) the bills job should currently run at."""
+    interval = load_scheduler_state().get("bills", {}).get("interval_minutes")
+    return int(interval or BILLS_INTERVAL_MINUTES)
+
+
+def build_committees_trigger(timezone: ZoneInfo) -> "CronTrigger":
+    from apscheduler.triggers.cron import CronTrigger
+
+    return CronTrigger(
+        day_of_week=COMMITTEES_SCHEDULE_DAYS,
+        hour=COMMITTEES_SCHEDULE_HOUR,
+        minute=SCHEDULE_MINUTE,
+        timezone=timezone,
+    )
+
+
+def next_bills_interval(interval: int, recent_changes: List[bool]) -> Tuple[int, str]:
+    """
+    Adapt the bills interval to recent activity.
+
+    Halve it when the last run saw upstream changes, grow it by half after
+    BILLS_QUIET_RUNS_TO_RELAX quiet runs in a row, otherwise hold it.
+    Returns (interval_minutes, reason).
+    """
+    if recent_changes and recent_changes[-1]:
+        interval = max(BILLS_MIN_INTERVAL_MINUTES, interval // 2)
+        return interval, "changes detected in last run; tightening"
+
+    quiet = recent_changes[-BILLS_QUIET_RUNS_TO_RELAX:]
+    if len(quiet) == BILLS_QUIET_RUNS_TO_RELAX and not any(quiet):
+        interval = min(BILLS_MAX_INTERVAL_MINUTES, interval + interval // 2)
+        return interval, f"no changes in last {BILLS_QUIET_RUNS_TO_RELAX} runs; relaxing"
+
+    return interval, "holding interval"
+
+
+def plan_next_runs(
+    results: Dict[str, Any],
+    sources: Sequence[str],
+    timezone_name: str = DEFAULT_TIMEZONE,
+) -> Dict[str, Any]:
+    """
+    Record this run's outcome and decide when each source runs next.
+    Returns {source: {next_run_at, reason, ...}} for the run report.
+    """
+    timezone = ZoneInfo(timezone_name)
+    now = datetime.now(timezone)
+    state = load_scheduler_state()
+    plan: Dict[str, Any] = {}
+
+    if "bills" in sources:
+        bills_state = state.get("bills", {})
+        probe = results.get("probe") if isinstance(results.get("probe"), dict) else {}
+        recent = list(bills_state.get("recent_changes", []))
+        if "changed" in probe:
+            recent = (recent + [bool(probe["changed"])])[-BILLS_QUIET_RUNS_TO_RELAX:]
+
+        interval = int(bills_state.get("interval_minutes") or BILLS_INTERVAL_MINUTES)
+        interval, reason = next_bills_interval(interval, recent)
+        bills_state.update(
+            interval_minutes=interval,
+            recent_changes=recent,
+            next_run_at=(now + timedelta(minutes=interval)).isoformat(timespec="seconds"),
+            reason=reason,
+        )
+        state["bills"] = bills_state
+        plan["bills"] = {
+            "interval_minutes": interval,
+            "next_run_at": bills_state["next_run_at"],
+            "reason": reason,
+        }
+
+    if "committees" in sources:
+        next_fire = build_committees_trigger(timezone).get_next_fire_time(None, now)
+        committees_state = {
+            "next_run_at": next_fire.isoformat(timespec="seconds") if next_fire else None,
+            "reason": f"cron {COMMITTEES_SCHEDULE_DAYS} at {COMMITTEES_SCHEDULE_HOUR:02d}:{SCHEDULE_MINUTE:02d}",
+        }
+        state["committees"] = committees_state
+        plan["committees"] = dict(committees_state)
+
+    try:
+        save_scheduler_state(state)
+    except Exception as exc:
+        log.warning("Failed to save scheduler state: %s", exc)
+
+    for source, entry in plan.items():
+        log.info("Next %s run: %s (%s)", source, entry.get("next_run_at"), entry.get("reason"))
+
+    return plan
+
+
+# =====================================================================
+# SCRAPE LOGS (DB)
+# =====================================================================
+
+def create_scrape_log() -> Optional[str]:
+    """
+    Insert run-start row into scrape_logs and return log id.
+    Uses DATABASE_URL / DATABASEURL from .env.
+    """
+    db_url = get_database_url()
+    if not db_url:
+        log.warning("DATABASE_URL not found; scrape_logs will not be written.")
+        return None
+
+    import psycopg2
+
+    log_id = str(uuid.uuid4())
+    try:
+        with psycopg2.connect(db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO scrape_logs (id, started_at, status)
+                    VALUES (%s, NOW(), %s)
+                    """,
+                    (log_id, "partial"),
+                )
+        return log_id
+    except Exception as exc:
+        log.error("Failed to create scrape_log row: %s", exc, exc_info=True)
+        return None
+
+
+def update_scrape_log(log_id: Optional[str], results: Dict[str, Any]) -> None:
+    """Update scrape_logs row on completion."""
+    if not log_id:
+        return
+
+    db_url = get_database_url()
+    if not db_url:
+        return
+
+    bills_result = normalize_result("bills", results.get("bills")) or {}
+    db_import = results.get("db_import") if isinstance(results.get("db_import"), dict) else {}
+
+    bills_found = int(bills_result.get("total_bills", 0) or 0)
+    # We currently know upserted count, not exact new-vs-updated split.
+    bills_updated = int(db_import.get("bills_upserted", 0) or 0)
+    bills_new = 0
+
+    errors = collect_errors(results)
+    probe = results.get("probe") if isinstance(results.get("probe"), dict) else {}
+    if probe.get("skip") and not any(results.get(source) for source in SOURCES):
+        status = "no_change"
+    else:
+        status = determine_overall_status(results)
+    errors_json = json.dumps(errors, ensure_ascii=False) if errors else None
+
+    import psycopg2
+
+    try:
+        with psycopg2.connect(db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    UPDATE scrape_logs
+                    SET finished_at = NOW(),
+                        bills_found = %s,
+                        bills_updated = %s,
+                        bills_new = %s,
+                        errors = %s,
+                        status = %s
+                    WHERE id = %s
+                    """,
+                    (
+                        bills_found,
+                        bills_updated,
+                        bills_new,
+                        errors_json,
+                        status,
+                        log_id,
+                    ),
+                )
+    except Exception as exc:
+        log.error("Failed to update scrape_log row: %s", exc, exc_info=True)
+
+
+# =====================================================================
+# MAIN AUTOMATED WORKFLOW
+# =====================================================================
+
+async def run_all(
+    force_full: bool = False,
+    sources: Sequence[str] = SOURCES,
+    timezone_name: str = DEFAULT_TIMEZONE,
+    time_budget: float = TIME_BUDGET_SECONDS,
+    profile: bool = PROFILE,
+    trace: bool = TRACE,
+) -> Dict[str, Any]:
+    """
+    Take the cross-node run lock of every selected source, then run the
+    pipeline. When another node holds a lock this node stands by and the
+    run is skipped.
+    """
+    sources = [s for s in SOURCES if s in sources]
+    locks = [RunLock(source, get_database_url()) for source in sources]
+
+    lock_info = await asyncio.to_thread(acquire_run_locks, locks)
+    if not lock_info["acquired"]:
+        log.info(
+            "Standing by: %s lock held by %s (waited %.1fs)",
+            "/".join(sources),
+            lock_info.get("holder") or "another node",
+            lock_info["wait_seconds"],
+        )
+        return {"run_lock": lock_info}
+
+    log.info(
+        "Acquired run lock for %s as %s (waited %.1fs)",
+        "/".join(sources),
+        lock_info["node"],
+        lock_info["wait_seconds"],
+    )
+    try:
+        return await run_pipeline(
+            force_full=force_full,
+            sources=sources,
+            timezone_name=timezone_name,
+            time_budget=time_budget,
+            profile=profile,
+            trace=trace,
+            results={"run_lock": lock_info},
+        )
+    finally:
+        release_run_locks(locks)
+
+
+async def run_pipeline(
+    force_full: bool = False,
+    sources: Sequence[str] = SOURCES,
+    timezone_name: str = DEFAULT_TIMEZONE,
+    time_budget: float = TIME_BUDGET_SECONDS,
+    profile: bool = PROFILE,
+    trace: bool = TRACE,
+    results: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Run all tasks automatically for the selected sources.
+    With a time budget, bill detail fetches stop being dispatched once the
+    budget (measured from run start) is spent; see scrape_bills.scrape_all.
+    With `profile`, every step is profiled into PROFILE_DIR/<run_id>; with
+    `trace`, spans of the run are stored as a "trace" artifact.
+
+    Steps:
+    [0] probe upstream for bill changes (skip the run when nothing changed)
+    [1] scrape bills
+    [2] scrape committees
+    [3] clean scraped sources, then download new or changed bill PDFs
+        and extract their text
+    [4] import cleaned data to DB
+    """
+    sources = [s for s in SOURCES if s in sources]
+
+    log.info("=" * 60)
+    log.info("AUTO-RUN MODE (%s): probe -> scrape -> clean -> import -> log", ", ".join(sources))
+    log.info("=" * 60)
+
+    run_started = time.monotonic()
+    started_at = datetime.utcnow()
+    log_id = create_scrape_log()
+    run_id = log_id or str(uuid.uuid4())
+    store = ArtifactStore(OUTPUT_DIR)
+    profiler = StageProfiler(PROFILE_DIR / run_id, enabled=profile)
+    run_trace = start_trace(f"run {run_id}", enabled=trace)
+    monitor = LoopMonitor() if LOOP_MONITOR else None
+    if monitor:
+        monitor.start()
+    results = results if results is not None else {}
+    scrape_bills = import_bills_scraper() if "bills" in sources else None
+
+    with RUN_STATUS.run(run_id, sources), log_context(run_id=run_id):
+        # [0] Change probe
+        if scrape_bills:
+            log.info("\n[0/4] Probing upstream for changes...")
+            try:
+                with pipeline_stage(profiler, "probe"):
+                    results["probe"] = await run_change_probe(scrape_bills, force_full=force_full)
+            except Exception as exc:
+                log.error("Change probe crashed: %s", exc, exc_info=True)
+                results["probe"] = {"success": True, "skip": False, "reason": f"probe crashed: {exc}"}
+
+            probe = results["probe"]
+            log.info("Change probe: %s", probe.get("reason"))
+            if probe.get("skip") and sources == ["bills"]:
+                log.info("No upstream change; skipping scrape, clean and import.")
+                results["schedule"] = plan_next_runs(results, sources, timezone_name)
+                if monitor:
+                    results["loop"] = await monitor.stop()
+                update_scrape_log(log_id, results)
+                publish_run_metrics(results, sources, run_id, run_started)
+                end_trace(run_trace)
+                return results
+
+        try:
+            # [1] Scrape bills
+            if "bills" in sources:
+                log.info("\n[1/4] Scraping bills...")
+                if results.get("probe", {}).get("skip"):
+                    log.info("No upstream bill change; skipping bills scrape.")
+                    results["bills"] = None
+                elif scrape_bills:
+                    try:
+                        remaining = None
+                        if time_budget:
+                            remaining = max(0.0, time_budget - (time.monotonic() - run_started))
+                        with pipeline_stage(profiler, "bills_scrape"):
+                            bills_result = await scrape_bills.scrape_all(time_budget=remaining, run_id=run_id)
+                        results["bills"] = normalize_result("bills", bills_result)
+                    except Exception as exc:
+                        log.error("Bills scraping failed: %s", exc, exc_info=True)
+                        results["bills"] = {"success": False, "error": str(exc)}
+                else:
+                    log.warning("Bills scraper module not available, skipping...")
+                    results["bills"] = None
+
+            # [2] Scrape committees
+            if "committees" in sources:
+                log.info("\n[2/4] Scraping committees...")
+                scrape_committees = import_committees_scraper()
+                if scrape_committees:
+                    try:
+                        with pipeline_stage(profiler, "committees_scrape"):
+                            committees_result = await scrape_committees.scrape_all_committees(run_id=run_id)
+                        results["committees"] = normalize_result(
+                            "committees", committees_result
+                        )
+                    except Exception as exc:
+                        log.error("Committee scraping failed: %s", exc, exc_info=True)
+                        results["committees"] = {"success": False, "error": str(exc)}
+                else:
+                    log.warning("Committees scraper module not available, skipping...")
+                    results["committees"] = None
+
+            # [3] Clean scraped sources
+            log.info("\n[3/4] Cleaning %s...", " and ".join(sources))
+            if (results.get("bills") or {}).get("cleaned_output"):
+                log.info("Bills were cleaned in the scrape pipeline; skipping bills cleaner.")
+                results["bills_clean"] = {
+                    "success": True,
+                    "output": results["bills"]["cleaned_output"],
+                    "cleaned_in_pipeline": True,
+                }
+            elif results.get("bills"):
+                bills_cleaner = import_bills_cleaner()
+                if bills_cleaner:
+                    try:
+                        with pipeline_stage(profiler, "bills_clean"):
+                            bills_clean_result = bills_cleaner.main(run_id=run_id)
+                            if inspect.isawaitable(bills_clean_result):
+                                bills_clean_result = await bills_clean_result
+                        results["bills_clean"] = bills_clean_result
+                    except Exception as exc:
+                        log.error("Bills cleaner failed: %s", exc, exc_info=True)
+                        results["bills_clean"] = {"success": False, "error": str(exc)}
+                else:
+                    log.warning("Bills cleaner module not available, skipping...")
+                    results["bills_clean"] = None
+
+            if results.get("committees"):
+                committees_cleaner = import_committees_cleaner()
+                if committees_cleaner:
+                    try:
+                        with pipeline_stage(profiler, "committees_clean"):
+                            committees_clean_result = committees_cleaner.main(run_id=run_id)
+                            if inspect.isawaitable(committees_clean_result):
+                                committees_clean_result = await committees_clean_result
+                        results["committees_clean"] = committees_clean_result
+                    except Exception as exc:
+                        log.error("Committees cleaner failed: %s", exc, exc_info=True)
+                        results["committees_clean"] = {"success": False, "error": str(exc)}
+                else:
+                    log.warning("Committees cleaner module not available, skipping...")
+                    results["committees_clean"] = None
+
+            if DOWNLOAD_PDFS and (results.get("bills_clean") or {}).get("success"):
+                try:
+                    deadline = run_started + time_budget if time_budget else None
+                    with pipeline_stage(profiler, "bills_pdfs"):
+                        results["bills_pdfs"] = await download_pdfs(store, run_id, deadline)
+                except Exception as exc:
+                    log.error("Bill PDF download failed: %s", exc, exc_info=True)
+                    results["bills_pdfs"] = {"success": False, "error": str(exc)}
+
+            if EXTRACT_PDF_TEXT and (results.get("bills_pdfs") or {}).get("success"):
+                try:
+                    deadline = run_started + time_budget if time_budget else None
+                    with pipeline_stage(profiler, "bills_pdf_text"):
+                        results["bills_pdf_text"] = await extract_pdf_texts(deadline)
+                except Exception as exc:
+                    log.error("PDF text extraction failed: %s", exc, exc_info=True)
+                    results["bills_pdf_text"] = {"success": False, "error": str(exc)}
+
+            with pipeline_stage(profiler, "history"):
+                results["history"] = record_history(store, run_id, sources)
+            if "bills" in sources:
+                with pipeline_stage(profiler, "bill_indexes"):
+                    results.update(update_bill_indexes(store, run_id))
+
+            # [4] Import cleaned JSON to DB
+            log.info("\n[4/4] Importing cleaned data to database...")
+            imported = [s for s in sources if results.get(s)]
+            with pipeline_stage(profiler, "bill_stats_before"):
+                stats_refresh = start_bill_stats(run_id, imported)
+            with pipeline_stage(profiler, "db_import"):
+                results["db_import"] = run_db_imports(imported)
+            if stats_refresh is not None and results["db_import"].get("success"):
+                with pipeline_stage(profiler, "bill_stats"):
+                    results["bill_stats"] = stats_refresh.finish(run_id)
+            elif stats_refresh is not None:
+                # The row keeps the previous run's id, so the next refresh rebuilds it
+                log.warning("Bill stats not refreshed: the database import failed")
+                results["bill_stats"] = {"success": True, "skipped": True, "reason": "database import failed"}
+
+            probe = results.get("probe") or {}
+            if (
+                results.get("bills")
+                and probe.get("signature")
+                and determine_overall_status(results) == "success"
+            ):
+                save_probe_state(probe["signature"])
+
+            return results
+
+        except Exception as exc:
+            log.error("Pipeline crashed: %s", exc, exc_info=True)
+            results["pipeline"] = {"success": False, "error": str(exc)}
+            return results
+        finally:
+            try:
+                results["schedule"] = plan_next_runs(results, sources, timezone_name)
+                if monitor:
+                    results["loop"] = await monitor.stop()
+                with pipeline_stage(profiler, "retention"):
+                    results["artifacts"] = store.apply_retention()
+                if profiler.stages:
+                    results["profile"] = profiler.summary()
+                    log_summary(profiler)
+                if run_trace is not None:
+                    end_trace(run_trace)
+                    results["trace"] = save_trace(store, run_trace, run_id)
+                print_report(results, store, run_id, started_at)
+            finally:
+                update_scrape_log(log_id, results)
+                publish_run_metrics(results, sources, run_id, run_started)
+
+
+# =====================================================================
+# REPORTING
+# =====================================================================
+
+def slim_result(value: Any, include_data: bool = False) -> Any:
+    """
+    Copy of a step result for the run report: scraped data and bulky state
+    (REPORT_DATA_KEYS) become counts and long text is cut to its tail.
+    """
+    if isinstance(value, dict):
+        slim: Dict[str, Any] = {}
+        for key, item in value.items():
+            if key in REPORT_DATA_KEYS and isinstance(item, (list, dict)) and not include_data:
+                slim[f"{key}_count"] = len(item)
+            else:
+                slim[key] = slim_result(item, include_data)
+        return slim
+    if isinstance(value, list):
+        return [slim_result(item, include_data) for item in value]
+    if isinstance(value, str) and len(value) > REPORT_MAX_TEXT:
+        return "..." + value[-REPORT_MAX_TEXT:]
+    return value
+
+
+def build_report(
+    results: Dict[str, Any],
+    store: Optional[ArtifactStore] = None,
+    run_id: Optional[str] = None,
+    started_at: Optional[datetime] = None,
+    include_data: bool = REPORT_INCLUDE_DATA,
+) -> Dict[str, Any]:
+    """
+    Run report: status, timings, per-step summaries and errors, plus the
+    artifacts written by the run. Scraped records are only embedded when
+    `include_data` is set.
+    """
+    finished_at = datetime.utcnow()
+    artifacts = []
+    if store is not None and run_id:
+        artifacts = [
+            {key: entry.get(key) for key in ("id", "kind", "name", "bytes", "sha256")}
+            for entry in store.entries()
+            if entry.get("run_id") == run_id
+        ]
+
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "run_id": run_id,
+        "status": determine_overall_status(results),
+        "started_at": started_at.isoformat(timespec="seconds") + "Z" if started_at else None,
+        "finished_at": finished_at.isoformat(timespec="seconds") + "Z",
+        "duration_seconds": round((finished_at - started_at).total_seconds(), 3) if started_at else None,
+        "errors": collect_errors(results),
+        "steps": {step: slim_result(result, include_data) for step, result in results.items()},
+        "artifacts": artifacts,
+    }
+
+
+def save_report(
+    results: Dict[str, Any],
+    store: Optional[ArtifactStore] = None,
+    run_id: Optional[str] = None,
+    started_at: Optional[datetime] = None,
+) -> None:
+    """Save the run report as a run_report artifact."""
+    store = store or ArtifactStore(OUTPUT_DIR)
+    report = build_report(results, store, run_id, started_at)
+    entry = store.put("run_report", report, run_id, default=str)
+    log.info("Saved report: %s (%d bytes)", store.root / entry["name"], entry["bytes"])
+
+
+def load_reports(store: Optional[ArtifactStore] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Load saved run reports, oldest first (the newest `limit` when given)."""
+    store = store or ArtifactStore(OUTPUT_DIR)
+    entries = store.entries("run_report")
+    if limit is not None:
+        entries = entries[-limit:]
+
+    reports = []
+    for entry in entries:
+        try:
+            reports.append(codec.read(store.root / entry["name"]))
+        except Exception as exc:
+            log.warning("Skipping unreadable report %s: %s", entry["name"], exc)
+    return reports
+
+
+def print_report(
+    results: Dict[str, Any],
+    store: Optional[ArtifactStore] = None,
+    run_id: Optional[str] = None,
+    started_at: Optional[datetime] = None,
+) -> None:
+    """Print a formatted report of run results."""
+    log.info("\n" + "=" * 60)
+    log.info("SCRAPING REPORT")
+    log.info("=" * 60)
+
+    for step_name, raw_result in results.items():
+        result = normalize_result(step_name, raw_result)
+        if result is None:
+            continue
+
+        if step_name == "run_lock":
+            log.info("\nRUN_LOCK:")
+            log.info("  Node: %s", result.get("node"))
+            log.info("  Holder: %s", result.get("holder"))
+            log.info("  Wait: %.2fs", result.get("wait_seconds", 0.0))
+            continue
+
+        if step_name == "schedule":
+            log.info("\nSCHEDULE:")
+            for source, entry in result.items():
+                log.info(
+                    "  %s: next run %s (%s)",
+                    source,
+                    entry.get("next_run_at"),
+                    entry.get("reason"),
+                )
+            continue
+
+        log.info("\n%s:", step_name.upper())
+        if result.get("success"):
+            log.info("  Status: Success")
+            if "duration_seconds" in result:
+                log.info("  Duration: %.2fs", result["duration_seconds"])
+            if "total_bills" in result:
+                log.info("  Total bills: %s", result["total_bills"])
+                if result.get("hor_count", 0) > 0:
+                    log.info("    HoR: %s", result["hor_count"])
+                if result.get("na_count", 0) > 0:
+                    log.info("    NA:  %s", result["na_count"])
+                if result.get("deferred_count"):
+                    log.info("  Deferred to next run: %s", result["deferred_count"])
+            if "pipeline" in result:
+                for stage_name, stage in result["pipeline"].get("stages", {}).items():
+                    log.info(
+                        "  Stage %-6s %5d items, %s items/s, utilization %s",
+                        stage_name,
+                        stage.get("items_out", 0),
+                        stage.get("items_per_second"),
+                        stage.get("utilization"),
+                    )
+                for queue_name, queue in result["pipeline"].get("queues", {}).items():
+                    log.info(
+                        "  Queue %-7s max depth %d/%d",
+                        queue_name,
+                        queue.get("max_depth", 0),
+                        queue.get("maxsize", 0),
+                    )
+            if "not_modified" in result:
+                log.info(
+                    "  PDFs: %d links, %d downloaded (%d resumed, %d deduplicated), "
+                    "%d not modified, %d unchanged, %d failed, %d deferred",
+                    result["links"],
+                    result["downloaded"],
+                    result["resumed"],
+                    result["deduplicated"],
+                    result["not_modified"],
+                    result["unchanged"],
+                    result["failed"],
+                    result["deferred_count"],
+                )
+            if "pages_per_second" in result:
+                log.info(
+                    "  Text: %d documents (%d cached), %d extracted, %d failed, %d deferred; %d pages at %s pages/s",
+                    result["documents"],
+                    result["cached"],
+                    result["extracted"],
+                    result["failed"],
+                    result["deferred_count"],
+                    result["pages"],
+                    result["pages_per_second"],
+                )
+            for host, http in (result.get("http") or {}).get("hosts", {}).items():
+                log.info(
+                    "  HTTP %s: %d requests, %.1f%% errors, p50 %s ms, p90 %s ms, %.1f MB",
+                    host,
+                    http["requests"],
+                    http["error_rate"] * 100,
+                    http["latency"]["p50_ms"],
+                    http["latency"]["p90_ms"],
+                    http["bytes"] / 1e6,
+                )
+            if "total_committees" in result:
+                log.info("  Total committees: %s", result["total_committees"])
+                if result.get("hor_count", 0) > 0:
+                    log.info("    HoR: %s", result["hor_count"])
+                if result.get("na_count", 0) > 0:
+                    log.info("    NA:  %s", result["na_count"])
+            if "bills_upserted" in result or "committees_upserted" in result:
+                log.info("  Bills upserted: %s", result.get("bills_upserted", 0))
+                log.info(
+                    "  Committees upserted: %s",
+                    result.get("committees_upserted", 0),
+                )
+            if "removed_files" in result:
+                log.info("  Removed files: %d", len(result.get("removed_files", [])))
+                if result.get("compressed_files"):
+                    log.info("  Compressed files: %d", len(result["compressed_files"]))
+                if result.get("failed_files"):
+                    log.info(
+                        "  Failed deletes: %d",
+                        len(result.get("failed_files", [])),
+                    )
+            if "lag" in result:
+                log.info(
+                    "  Loop lag: p50 %s ms, p99 %s ms, max %.0f ms; %d stalls, %.1fs blocked",
+                    result["lag"]["p50_ms"],
+                    result["lag"]["p99_ms"],
+                    result["lag"]["max_ms"],
+                    result["stalls"],
+                    result["stalled_seconds"],
+                )
+                for callsite in result["callsites"][:3]:
+                    log.info(
+                        "    %d stalls, %.0f ms total (max %.0f ms) in %s",
+                        callsite["stalls"],
+                        callsite["total_ms"],
+                        callsite["max_ms"],
+                        callsite["callsite"],
+                    )
+                resources = result["resources"]
+                if resources.get("rss_peak_bytes") is not None:
+                    log.info(
+                        "  Peak RSS %.0f MB, open sockets %s, in-flight requests %s",
+                        resources["rss_peak_bytes"] / 1e6,
+                        resources.get("open_sockets_peak"),
+                        resources.get("in_flight_peak"),
+                    )
+                for action in result["governor"]["actions"]:
+                    log.info(
+                        "  Governor at %.0fs: per-host limit %d -> %d (%s)",
+                        action["at_seconds"],
+                        action["from"],
+                        action["to"],
+                        action["reason"],
+                    )
+            for kind, recorded in result.get("kinds", {}).items():
+                log.info(
+                    "  %s run %s: %s added, %s changed, %s removed (%s bytes)",
+                    kind,
+                    recorded.get("seq"),
+                    recorded.get("added"),
+                    recorded.get("changed"),
+                    recorded.get("removed"),
+                    recorded.get("bytes_written"),
+                )
+            if "documents" in result:
+                log.info(
+                    "  Search index: %d documents (%d added, %d updated, %d removed)",
+                    result["documents"],
+                    result["added"],
+                    result["updated"],
+                    result["removed"],
+                )
+            names = result.get("names") or {}
+            if names:
+                log.info(
+                    "  Canonical names: %d presenters, %d ministries (%d new)",
+                    names["presenter"]["entities"],
+                    names["ministry"]["entities"],
+                    names["presenter"].get("created", 0) + names["ministry"].get("created", 0),
+                )
+            if "amends" in result:
+                log.info(
+                    "  Title relations: %d duplicates, %d re-registered, %d amends (%d candidate pairs of %d titles)",
+                    result["duplicate"],
+                    result["re_registered"],
+                    result["amends"],
+                    result["candidates"],
+                    result["titles"],
+                )
+            if "mode" in result:
+                log.info("  Bill stats: %s refresh of %d bills, %d bills in total", result["mode"], result["bills"], result["total"])
+            if result.get("skipped"):
+                log.info("  Skipped: %s", result["reason"])
+            if "output" in result:
+                log.info("  Output: %s", result["output"])
+        else:
+            log.info("  Status: Failed")
+            log.info("  Error: %s", result.get("error", "Unknown error"))
+
+    log.info("\n" + "=" * 60 + "\n")
+    save_report(results, store, run_id, started_at)
+    log.info("=" * 60 + "\n")
+
+
+# =====================================================================
+# SCHEDULER
+# =====================================================================
+
+def run_all_sync(
+    force_full: bool = False,
+    sources: Sequence[str] = SOURCES,
+    timezone_name: str = DEFAULT_TIMEZONE,
+    time_budget: float = TIME_BUDGET_SECONDS,
+    profile: bool = PROFILE,
+    trace: bool = TRACE,
+) -> Dict[str, Any]:
+    """Sync wrapper for scheduler jobs."""
+    return asyncio.run(
+        run_all(
+            force_full=force_full,
+            sources=sources,
+            timezone_name=timezone_name,
+            time_budget=time_budget,
+            profile=profile,
+            trace=trace,
+        )
+    )
+
+
+def start_scheduler(
+    timezone_name: str,
+    run_now: bool = False,
+    force_full: bool = False,
+    time_budget: float = TIME_BUDGET_SECONDS,
+    profile: bool = PROFILE,
+    trace: bool = TRACE,
+) -> None:
+    """
+    Start APScheduler with one job per source:
+    bills on an adaptive interval, committees on a fixed cron.
+    """
+    try:
+        timezone = ZoneInfo(timezone_name)
+    except Exception:
+        log.error("Invalid timezone: %s", timezone_name)
+        raise
+
+    start_metrics_server()
+
+    if run_now:
+        log.info("Running immediate job before scheduler start...")
+        run_all_sync(
+            force_full=force_full,
+            timezone_name=timezone_name,
+            time_budget=time_budget,
+            profile=profile,
+            trace=trace,
+        )
+
+    from apscheduler.schedulers.blocking import BlockingScheduler
+    from apscheduler.triggers.interval import IntervalTrigger
+
+    scheduler = BlockingScheduler(timezone=timezone)
+
+    def run_bills_job() -> None:
+        results = run_all_sync(
+            sources=["bills"],
+            timezone_name=timezone_name,
+            time_budget=time_budget,
+            profile=profile,
+            trace=trace,
+        )
+        interval = (results.get("schedule") or {}).get("bills", {}).get("interval_minutes")
+        if interval:
+            scheduler.reschedule_job(
+                "nepal_legislative_bills",
+                trigger=IntervalTrigger(minutes=interval, timezone=timezone),
+            )
+
+    def run_committees_job() -> None:
+        run_all_sync(sources=["committees"], timezone_name=timezone_name, profile=profile, trace=trace)
+
+    bills_interval = current_bills_interval()
+    scheduler.add_job(
+        run_bills_job,
+        trigger=IntervalTrigger(minutes=bills_interval, timezone=timezone),
+        id="nepal_legislative_bills",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=3600,
+    )
+    scheduler.add_job(
+        run_committees_job,
+        trigger=build_committees_trigger(timezone),
+        id="nepal_legislative_committees",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=3600,
+    )
+
+    def collect_next_runs(registry: Any) -> None:
+        for source, job_id in (("bills", "nepal_legislative_bills"), ("committees", "nepal_legislative_committees")):
+            job = scheduler.get_job(job_id)
+            if job is not None and job.next_run_time is not None:
+                set_next_run(registry, source, job.next_run_time.timestamp())
+
+    METRICS.add_collector(collect_next_runs)
+
+    log.info("=" * 60)
+    log.info("Scheduler started (%s)", timezone_name)
+    log.info("  bills: every %d min (adaptive %d-%d)", bills_interval,
+             BILLS_MIN_INTERVAL_MINUTES, BILLS_MAX_INTERVAL_MINUTES)
+    log.info("  committees: %s at %02d:%02d", COMMITTEES_SCHEDULE_DAYS,
+             COMMITTEES_SCHEDULE_HOUR, SCHEDULE_MINUTE)
+    log.info("=" * 60)
+
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        log.info("Scheduler stopped.")
+
+
+# =====================================================================
+# MAIN ENTRY POINT
+# =====================================================================
+
+def main() -> None:
+    """Command-line entry point; expects logging and .env to be set up (see scraper.__main__)."""
+    parser = argparse.ArgumentParser(
+        description="Nepal Federal Legislative Scraper Controller"
+    )
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="Run continuously: bills on an adaptive interval, committees on cron",
+    )
+    parser.add_argument(
+        "--run-now",
+        action="store_true",
+        help="With --schedule: run one job immediately before waiting for cron",
+    )
+    parser.add_argument(
+        "--timezone",
+        default=DEFAULT_TIMEZONE,
+        help=f"Scheduler timezone (default: {DEFAULT_TIMEZONE})",
+    )
+    parser.add_argument(
+        "--force-full",
+        action="store_true",
+        help="Skip the change probe and always run the full pipeline",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=TIME_BUDGET_SECONDS,
+        help="Per-run time budget in seconds; remaining bills are deferred (default: unlimited)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=PROFILE,
+        help="Profile every step (cProfile, folded stacks, tracemalloc) into data/output/profiles/<run_id>",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        default=TRACE,
+        help="Record spans of the run and store them as a trace artifact (SCRAPER_TRACE_FORMAT=chrome|otlp)",
+    )
+
+    args = parser.parse_args()
+
+    if args.schedule:
+        start_scheduler(
+            timezone_name=args.timezone,
+            run_now=args.run_now,
+            force_full=args.force_full,
+            time_budget=args.time_budget,
+            profile=args.profile,
+            trace=args.trace,
+        )
+        return
+
+    if args.run_now:
+        log.info("--run-now has no effect without --schedule; running once now.")
+    asyncio.run(
+        run_all(
+            force_full=args.force_full,
+            time_budget=args.time_budget,
+            profile=args.profile,
+            trace=args.trace,
+        )
+    )
+
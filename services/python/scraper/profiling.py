@@ -0,0 +1,233 @@
+"""
+Per-stage CPU and memory profiling (`--profile`).
+
+Each pipeline stage run inside `StageProfiler.stage(name)` is measured with:
+
+- cProfile: `<nn>_<stage>.pstats`, loadable with pstats or snakeviz; the
+  summary lists the functions with the most own time
+- a stack sampler: `<nn>_<stage>.folded`, collapsed stacks of every thread
+  for flamegraph.pl, speedscope or inferno
+- tracemalloc: peak traced memory and the allocation sites holding the
+  most memory when the stage ends
+
+and a summary of all stages is written to `profile.json` in the same
+directory. Profiling slows a run down noticeably (tracemalloc most of all),
+so it is off unless asked for. Stages must not nest.
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from scraper import codec
+
+
+log = logging.getLogger(__name__)
+
+
+PROFILE_DIR = Path(__file__).resolve().parent.parent / "data" / "output" / "profiles"
+PROFILE_SAMPLE_MS = float(os.getenv("SCRAPER_PROFILE_SAMPLE_MS", "5"))
+PROFILE_TOP_N = int(os.getenv("SCRAPER_PROFILE_TOP_N", "15"))
+TRACEMALLOC_FRAMES = int(os.getenv("SCRAPER_PROFILE_TRACEMALLOC_FRAMES", "1"))
+
+
+def frame_label(code: Any) -> str:
+    return f"{Path(code.co_filename).name}:{code.co_name}"
+
+
+class StackSampler(threading.Thread):
+    """Samples the stacks of all other threads into folded-stack counts."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="stack-sampler", daemon=True)
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack: List[str] = []
+                while frame is not None:
+                    stack.append(frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.counts[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+
+class StageProfiler:
+    """Profiles pipeline stages into `output_dir`; a no-op when disabled."""
+
+    def __init__(self, output_dir: Path, enabled: bool = True) -> None:
+        self.output_dir = Path(output_dir)
+        self.enabled = enabled
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._active: Optional[str] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        if self._active is not None:
+            raise RuntimeError(f"Profiled stage {name!r} started inside {self._active!r}")
+
+        self._active = name
+        prefix = f"{len(self.stages) + 1:02d}_{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        started_tracemalloc = not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        baseline_memory = tracemalloc.get_traced_memory()[0]
+
+        sampler = StackSampler(PROFILE_SAMPLE_MS / 1000)
+        profile = cProfile.Profile()
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        sampler.start()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            sampler.stop()
+            wall_seconds = time.perf_counter() - wall_started
+            cpu_seconds = time.process_time() - cpu_started
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracemalloc:
+                tracemalloc.stop()
+            self._active = None
+            try:
+                self.stages[name] = self._write_stage(
+                    prefix, profile, sampler, snapshot,
+                    wall_seconds, cpu_seconds, baseline_memory, current_memory, peak_memory,
+                )
+                self.write_summary()
+            except Exception as exc:
+                log.warning("Writing profile of stage %s failed: %s", name, exc)
+
+    def _write_stage(
+        self,
+        prefix: str,
+        profile: cProfile.Profile,
+        sampler: StackSampler,
+        snapshot: tracemalloc.Snapshot,
+        wall_seconds: float,
+        cpu_seconds: float,
+        baseline_memory: int,
+        current_memory: int,
+        peak_memory: int,
+    ) -> Dict[str, Any]:
+        pstats_file = self.output_dir / f"{prefix}.pstats"
+        folded_file = self.output_dir / f"{prefix}.folded"
+        profile.dump_stats(pstats_file)
+        folded_file.write_text(sampler.folded(), encoding="utf-8")
+
+        stats = pstats.Stats(profile, stream=io.StringIO())
+        top_functions = []
+        for (filename, line, function), (_, ncalls, tottime, cumtime, _) in sorted(
+            stats.stats.items(), key=lambda item: -item[1][2]
+        )[:PROFILE_TOP_N]:
+            top_functions.append({
+                "function": f"{Path(filename).name}:{line}({function})",
+                "calls": ncalls,
+                "own_seconds": round(tottime, 4),
+                "cumulative_seconds": round(cumtime, 4),
+            })
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib*"),
+        ))
+        top_allocations = [
+            {
+                "where": f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno}",
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP_N]
+        ]
+
+        return {
+            "wall_seconds": round(wall_seconds, 3),
+            "cpu_seconds": round(cpu_seconds, 3),
+            "peak_memory_bytes": peak_memory - baseline_memory,
+            "retained_memory_bytes": current_memory - baseline_memory,
+            "samples": sampler.samples,
+            "top_functions": top_functions,
+            "top_allocations": top_allocations,
+            "pstats": pstats_file.name,
+            "folded": folded_file.name,
+        }
+
+    def write_summary(self) -> Optional[Path]:
+        if not self.stages:
+            return None
+        path = self.output_dir / "profile.json"
+        codec.write(path, {"stages": self.stages}, pretty=True)
+        return path
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-stage headline numbers for the run report."""
+        return {
+            "success": True,
+            "output": str(self.output_dir),
+            "stages": {
+                name: {
+                    "wall_seconds": stage["wall_seconds"],
+                    "cpu_seconds": stage["cpu_seconds"],
+                    "peak_memory_bytes": stage["peak_memory_bytes"],
+                    "top_function": (stage["top_functions"] or [{}])[0].get("function"),
+                }
+                for name, stage in self.stages.items()
+            },
+        }
+
+
+def log_summary(profiler: StageProfiler) -> None:
+    """Log one line per profiled stage."""
+    for name, stage in profiler.stages.items():
+        log.info(
+            "Profile %-18s wall %7.2fs  cpu %7.2fs  peak %8.1f MB  (%s)",
+            name,
+            stage["wall_seconds"],
+            stage["cpu_seconds"],
+            stage["peak_memory_bytes"] / 1e6,
+            stage["pstats"],
+        )
+    if profiler.stages:
+        log.info("Profiles written to %s", profiler.output_dir)
+
+
+def cli_profiler(name: str, enabled: bool) -> StageProfiler:
+    """Profiler for a standalone CLI run, writing to PROFILE_DIR/<name>_<timestamp>."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return StageProfiler(PROFILE_DIR / f"{name}_{timestamp}", enabled=enabled)
@@ -0,0 +1,338 @@
+"""
+Compact record types for scraped and cleaned data.
+
+Bills and committees move through the scrapers and cleaners as slotted
+records instead of dicts: no per-instance __dict__, and categorical values
+(house, ministry, presenter, category, status labels, ...) that repeat
+across thousands of records are interned so every record shares one string
+object. Field names are the JSON keys, so `to_dict()` / `from_dict()` map
+records to and from the JSON files read by the Bun importers unchanged
+(files themselves are read and written by scraper.codec).
+"""
+
+import sys
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Optional, Type, TypeVar
+
+
+R = TypeVar("R", bound="Record")
+
+
+def intern_value(value: Any) -> Any:
+    """Intern strings; other values are returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_keys(mapping: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Copy of a mapping with interned keys."""
+    return {sys.intern(key): value for key, value in (mapping or {}).items()}
+
+
+class Record:
+    """
+    Base for slotted records.
+
+    Subclasses declare `__slots__` (field order is JSON key order) and may
+    set `DEFAULTS` for missing fields, `INTERNED` for categorical fields,
+    `INTERNED_KEYS` for mapping fields whose keys repeat, `NESTED` for
+    fields holding lists of nested records and `OMIT_NONE` for fields left
+    out of `to_dict()` while unset.
+
+    `__init__`, `from_dict`, `to_dict` and `copy` are generated per class
+    with one statement per field (as dataclasses do), which keeps the
+    codecs close to the cost of building the equivalent dict.
+    """
+
+    __slots__ = ()
+
+    DEFAULTS: Dict[str, Any] = {}
+    INTERNED: FrozenSet[str] = frozenset()
+    INTERNED_KEYS: FrozenSet[str] = frozenset()
+    NESTED: Dict[str, Type["Record"]] = {}
+    OMIT_NONE: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.__slots__:
+            _compile_codecs(cls)
+
+    if TYPE_CHECKING:
+        # Installed per class by _compile_codecs
+        def __init__(self, **fields: Any) -> None: ...
+
+        @classmethod
+        def from_dict(cls: Type[R], data: Dict[str, Any]) -> R:
+            """Build a record from its JSON dict; unknown keys are ignored."""
+
+        def to_dict(self) -> Dict[str, Any]:
+            """JSON dict with keys in field order."""
+
+        def copy(self: R) -> R:
+            """Copy of the record; nested records and lists are copied too."""
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Dict-style field access, for code shared with plain dicts."""
+        value = getattr(self, name, None)
+        return default if value is None else value
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        key = self.__slots__[0]
+        return f"{self.__class__.__name__}({key}={getattr(self, key)!r})"
+
+
+def _compile_codecs(cls: Type[Record]) -> None:
+    """Generate the per-field __init__, from_dict, to_dict and copy of `cls`."""
+    fields = cls.__slots__
+    namespace: Dict[str, Any] = {"_new": object.__new__, "_intern": sys.intern, "_intern_keys": intern_keys}
+
+    def default(name: str) -> str:
+        value = cls.DEFAULTS.get(name)
+        if isinstance(value, (list, dict)):
+            return "[]" if isinstance(value, list) else "{}"  # fresh per record
+        namespace[f"_d_{name}"] = value
+        return f"_d_{name}"
+
+    def convert(name: str, var: str) -> str:
+        """Expression turning a non-None `var` into the stored value."""
+        if name in cls.INTERNED:
+            return f"(_intern({var}) if {var}.__class__ is str else {var})"
+        if name in cls.INTERNED_KEYS:
+            return f"_intern_keys({var})"
+        if name in cls.NESTED:
+            namespace[f"_n_{name}"] = cls.NESTED[name].from_dict
+            return f"[_n_{name}(x) for x in {var}]"
+        return var
+
+    init = [f"def __init__(self, *, {', '.join(f'{name}=None' for name in fields)}):"]
+    from_dict = ["def from_dict(cls, data):", "    get = data.get", "    self = _new(cls)"]
+    for name in fields:
+        if name in cls.NESTED:
+            # __init__ takes already-built nested records
+            init.append(f"    self.{name} = {default(name)} if {name} is None else {name}")
+        else:
+            init.append(f"    self.{name} = {default(name)} if {name} is None else {convert(name, name)}")
+        from_dict.append(f"    v = get({name!r})")
+        from_dict.append(f"    self.{name} = {default(name)} if v is None else {convert(name, 'v')}")
+    from_dict.append("    return self")
+
+    def encode(name: str) -> str:
+        if name in cls.NESTED:
+            return f"[x.to_dict() for x in self.{name}]"
+        return f"self.{name}"
+
+    # A dict literal up to the first optional field, assignments after it
+    to_dict = ["def to_dict(self):", "    data = {"]
+    in_literal = True
+    for name in fields:
+        if name in cls.OMIT_NONE:
+            if in_literal:
+                to_dict.append("    }")
+                in_literal = False
+            to_dict.append(f"    if self.{name} is not None: data[{name!r}] = {encode(name)}")
+        elif in_literal:
+            to_dict.append(f"        {name!r}: {encode(name)},")
+        else:
+            to_dict.append(f"    data[{name!r}] = {encode(name)}")
+    if in_literal:
+        to_dict.append("    }")
+    to_dict.append("    return data")
+
+    copy = ["def copy(self):", "    new = _new(self.__class__)"]
+    for name in fields:
+        if name in cls.NESTED:
+            copy.append(f"    new.{name} = [x.copy() for x in self.{name}]")
+        elif isinstance(cls.DEFAULTS.get(name), (list, dict)):
+            copy.append(f"    new.{name} = self.{name}.copy()")
+        else:
+            copy.append(f"    new.{name} = self.{name}")
+    copy.append("    return new")
+
+    exec("\n".join(init + from_dict + to_dict + copy), namespace)
+    cls.__init__ = namespace["__init__"]
+    cls.from_dict = classmethod(namespace["from_dict"])
+    cls.to_dict = namespace["to_dict"]
+    cls.copy = namespace["copy"]
+
+
+# =====================================================================
+# BILLS
+# =====================================================================
+
+class StatusEntry(Record):
+    """One step of a bill's status timeline."""
+
+    __slots__ = ("label", "date", "date_ad")
+
+    INTERNED = frozenset({"label"})
+    OMIT_NONE = frozenset({"date_ad"})
+
+
+_BILL_CATEGORICAL = frozenset({
+    "type",
+    "year",
+    "sambat",
+    "presenter",
+    "ministry",
+    "session",
+    "government_type",
+    "bill_type",
+    "category",
+    "government_type_en",
+    "bill_type_en",
+    "category_en",
+    "current_status",
+})
+
+
+class RawBill(Record):
+    """A bill merged from its Nepali and English detail pages."""
+
+    __slots__ = (
+        "bill_id",
+        "type",
+        "titleNp",
+        "titleEn",
+        "registration_number",
+        "year",
+        "sambat",
+        "presenter",
+        "ministry",
+        "session",
+        "government_type",
+        "bill_type",
+        "category",
+        "resource_link",
+        "presenterEn",
+        "ministryEn",
+        "government_type_en",
+        "bill_type_en",
+        "category_en",
+        "current_status",
+        "current_status_date",
+        "status_timeline",
+        "scraped_at",
+    )
+
+    DEFAULTS = {"titleNp": "", "titleEn": "", "presenterEn": "", "ministryEn": "", "status_timeline": []}
+    INTERNED = _BILL_CATEGORICAL | {"presenterEn", "ministryEn"}
+    NESTED = {"status_timeline": StatusEntry}
+
+
+class CleanedBill(Record):
+    """A cleaned bill as written to bills_cleaned.json."""
+
+    __slots__ = (
+        "bill_id",
+        "type",
+        "titleNp",
+        "titleEn",
+        "registration_number",
+        "year",
+        "sambat",
+        "presenter",
+        "ministry",
+        "presenter_en",
+        "ministry_en",
+        "presenter_id",
+        "ministry_id",
+        "session",
+        "government_type",
+        "bill_type",
+        "category",
+        "government_type_en",
+        "bill_type_en",
+        "category_en",
+        "current_status",
+        "current_status_date",
+        "status_timeline",
+        "resource_link",
+        "year_ad",
+        "current_status_date_ad",
+    )
+
+    DEFAULTS = {"titleNp": "", "titleEn": "", "status_timeline": []}
+    INTERNED = _BILL_CATEGORICAL | {"presenter_en", "ministry_en", "presenter_id", "ministry_id", "year_ad"}
+    NESTED = {"status_timeline": StatusEntry}
+
+
+# =====================================================================
+# COMMITTEES
+# =====================================================================
+
+class _CommitteeRecord(Record):
+    __slots__ = ()
+
+    DEFAULTS = {
+        "nameNp": "",
+        "nameEn": "",
+        "introductionNp": "",
+        "introductionEn": "",
+        "chairperson": "",
+        "chairpersonNp": "",
+        "chairpersonEn": "",
+        "secretaryNp": "",
+        "secretaryEn": "",
+        "menuLinksNp": {},
+        "menuLinksEn": {},
+    }
+    INTERNED = frozenset({
+        "house",
+        "houseEnum",
+        "chairperson",
+        "chairpersonNp",
+        "chairpersonEn",
+        "secretaryNp",
+        "secretaryEn",
+    })
+    # Menu link labels are the same across committees
+    INTERNED_KEYS = frozenset({"menuLinksNp", "menuLinksEn"})
+
+
+_COMMITTEE_FIELDS = (
+    "house",
+    "houseEnum",
+    "slug",
+    "nameNp",
+    "nameEn",
+    "introductionNp",
+    "introductionEn",
+    "chairperson",
+    "chairpersonNp",
+    "chairpersonEn",
+    "secretaryNp",
+    "secretaryEn",
+    "menuLinksNp",
+    "menuLinksEn",
+    "membersPageUrlNp",
+    "membersPageUrlEn",
+    "parliamentUrlNp",
+    "parliamentUrlEn",
+)
+
+
+class RawCommittee(_CommitteeRecord):
+    """A committee merged from its Nepali and English detail pages."""
+
+    __slots__ = _COMMITTEE_FIELDS + ("scrapedAt",)
+
+
+class CleanedCommittee(_CommitteeRecord):
+    """A cleaned committee as written to committees_cleaned.json."""
+
+    __slots__ = _COMMITTEE_FIELDS
+
+
+# =====================================================================
+# CONVERSION
+# =====================================================================
+
+def to_dicts(records: Iterable[Record]) -> List[Dict[str, Any]]:
+    return [record.to_dict() for record in records]
+
+
+def from_dicts(cls: Type[R], items: Iterable[Dict[str, Any]]) -> List[R]:
+    return [cls.from_dict(item) for item in items if isinstance(item, dict)]
@@ -0,0 +1,253 @@
+"""
+Cross-node run locks for scheduled scraper jobs.
+
+When the scraper runs on several hosts, each job takes a lock before it
+starts so that only one node scrapes and imports at a time while the
+others stand by. Locks are Postgres session-level advisory locks; when the
+database is unreachable a local file lock (flock) is used instead, which
+still prevents overlap between processes on the same host.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+
+log = logging.getLogger(__name__)
+
+
+LOCK_NAMESPACE = "nflm-scraper"
+LOCK_DIR = Path(__file__).resolve().parent.parent / "data" / "locks"
+LOCK_WAIT_SECONDS = float(os.getenv("SCRAPER_LOCK_WAIT_SECONDS", "0"))
+LOCK_POLL_SECONDS = float(os.getenv("SCRAPER_LOCK_POLL_SECONDS", "5"))
+
+
+def node_identity() -> str:
+    """Identity reported to other nodes as the lock holder."""
+    return os.getenv("SCRAPER_NODE_ID") or f"{socket.gethostname()}:{os.getpid()}"
+
+
+def advisory_lock_key(job: str) -> int:
+    """Stable signed 64-bit advisory lock key for a job name."""
+    digest = hashlib.sha256(f"{LOCK_NAMESPACE}:{job}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class RunLock:
+    """Mutual exclusion for one job across nodes."""
+
+    def __init__(
+        self,
+        job: str,
+        database_url: Optional[str],
+        wait_seconds: float = LOCK_WAIT_SECONDS,
+        poll_seconds: float = LOCK_POLL_SECONDS,
+    ) -> None:
+        self.job = job
+        self.database_url = database_url
+        self.wait_seconds = wait_seconds
+        self.poll_seconds = poll_seconds
+        self.node = node_identity()
+        self.key = advisory_lock_key(job)
+        self._conn = None
+        self._file = None
+
+    # -----------------------------------------------------------------
+    # Postgres advisory lock
+    # -----------------------------------------------------------------
+
+    def _pg_connect(self):
+        import psycopg2
+
+        conn = psycopg2.connect(
+            self.database_url,
+            application_name=f"{LOCK_NAMESPACE}:{self.node}"[:63],
+        )
+        conn.autocommit = True
+        return conn
+
+    def _pg_try_lock(self) -> bool:
+        with self._conn.cursor() as cur:
+            cur.execute("SELECT pg_try_advisory_lock(%s)", (self.key,))
+            return bool(cur.fetchone()[0])
+
+    def _pg_holder(self) -> Optional[str]:
+        """Application name (node identity) of the session holding the lock."""
+        unsigned = self.key & 0xFFFFFFFFFFFFFFFF
+        try:
+            with self._conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT a.application_name, a.client_addr::text
+                    FROM pg_locks l
+                    JOIN pg_stat_activity a ON a.pid = l.pid
+                    WHERE l.locktype = 'advisory'
+                      AND l.granted
+                      AND l.classid::bigint = %s
+                      AND l.objid::bigint = %s
+                      AND l.objsubid = 1
+                    LIMIT 1
+                    """,
+                    (unsigned >> 32, unsigned & 0xFFFFFFFF),
+                )
+                row = cur.fetchone()
+        except Exception as exc:
+            log.debug("Could not look up advisory lock holder: %s", exc)
+            return None
+
+        if not row:
+            return None
+        name, addr = row
+        if name and name.startswith(f"{LOCK_NAMESPACE}:"):
+            name = name[len(LOCK_NAMESPACE) + 1:]
+        return f"{name} ({addr})" if addr else name
+
+    # -----------------------------------------------------------------
+    # File lock fallback
+    # -----------------------------------------------------------------
+
+    def _file_try_lock(self) -> bool:
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+
+        self._file.seek(0)
+        self._file.truncate()
+        json.dump(
+            {
+                "node": self.node,
+                "job": self.job,
+                "acquired_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            },
+            self._file,
+        )
+        self._file.flush()
+        return True
+
+    def _file_holder(self) -> Optional[str]:
+        try:
+            self._file.seek(0)
+            return json.loads(self._file.read() or "{}").get("node")
+        except Exception:
+            return None
+
+    # -----------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------
+
+    def acquire(self) -> Dict[str, Any]:
+        """
+        Try to take the lock, polling for up to `wait_seconds`.
+
+        Returns {"success", "job", "backend", "acquired", "wait_seconds",
+        "node", "holder"}; `holder` names the node holding the lock when it
+        was not acquired.
+        """
+        backend = "none"
+        try_lock = None
+        holder = None
+
+        if self.database_url:
+            try:
+                self._conn = self._pg_connect()
+                backend, try_lock, holder = "postgres", self._pg_try_lock, self._pg_holder
+            except Exception as exc:
+                log.warning("Advisory lock unavailable (%s); using file lock.", exc)
+
+        if try_lock is None and fcntl is not None:
+            LOCK_DIR.mkdir(parents=True, exist_ok=True)
+            self._file = open(LOCK_DIR / f"{self.job}.lock", "a+", encoding="utf-8")
+            backend, try_lock, holder = "file", self._file_try_lock, self._file_holder
+
+        started = time.monotonic()
+        if try_lock is None:
+            log.warning("No lock backend available for %s; running unlocked.", self.job)
+            acquired = True
+        else:
+            acquired = try_lock()
+            while not acquired and time.monotonic() - started < self.wait_seconds:
+                time.sleep(min(self.poll_seconds, self.wait_seconds))
+                acquired = try_lock()
+
+        info = {
+            "success": True,
+            "job": self.job,
+            "backend": backend,
+            "acquired": acquired,
+            "wait_seconds": round(time.monotonic() - started, 3),
+            "node": self.node,
+            "holder": self.node if acquired else (holder() if holder else None),
+        }
+        if not acquired:
+            self.release()
+        return info
+
+    def release(self) -> None:
+        """Release the lock (closing the session releases advisory locks too)."""
+        if self._conn is not None:
+            try:
+                with self._conn.cursor() as cur:
+                    cur.execute("SELECT pg_advisory_unlock(%s)", (self.key,))
+            except Exception:
+                pass
+            finally:
+                self._conn.close()
+                self._conn = None
+
+        if self._file is not None:
+            try:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            finally:
+                self._file.close()
+                self._file = None
+
+
+def acquire_run_locks(locks: List[RunLock]) -> Dict[str, Any]:
+    """
+    Acquire every lock in job-name order; on any failure release the ones
+    already taken. Returns a summary for the run report.
+    """
+    taken: List[RunLock] = []
+    jobs: Dict[str, Any] = {}
+
+    for lock in sorted(locks, key=lambda lk: lk.job):
+        info = lock.acquire()
+        jobs[lock.job] = info
+        if not info["acquired"]:
+            for held in taken:
+                held.release()
+            return {
+                "success": True,
+                "acquired": False,
+                "node": lock.node,
+                "holder": info.get("holder"),
+                "wait_seconds": sum(j["wait_seconds"] for j in jobs.values()),
+                "jobs": jobs,
+            }
+        taken.append(lock)
+
+    return {
+        "success": True,
+        "acquired": True,
+        "node": node_identity(),
+        "holder": node_identity(),
+        "wait_seconds": sum(j["wait_seconds"] for j in jobs.values()),
+        "jobs": jobs,
+    }
+
+
+def release_run_locks(locks: List[RunLock]) -> None:
+    for lock in locks:
+        lock.release()
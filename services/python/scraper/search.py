@@ -0,0 +1,453 @@
+"""
+Search index over the cleaned bills.
+
+Updated by the pipeline from each run's cleaned bills, so bills can be
+found by title, presenter or ministry (Nepali and English) without
+scanning rows at query time.
+
+Text is normalized before tokenizing: NFC, zero-width characters (ZWSP,
+ZWNJ, ZWJ, BOM, soft hyphen) removed, Devanagari digits mapped to ASCII,
+chandrabindu folded into anusvara, nukta dropped and Latin case-folded, so
+"विधेयक, २०८२" and "विधेयक<ZWSP> 2082" produce the same tokens. Tokens keep
+Devanagari vowel signs and viramas, which `\\w` alone would split on.
+
+Terms are keyed "<group code>:<token>" per field group (title, presenter,
+ministry), each with the sorted ids of the documents containing it. Two
+tables over the term dictionary resolve partial words to terms:
+
+- prefixes   token prefixes of PREFIX_MIN..PREFIX_MAX characters -> terms
+- trigrams   character trigrams of " token " -> terms, for substrings
+
+A query ANDs its tokens and returns whole-word matches first, then prefix,
+then substring matches. Posting lists are sorted, so results come out of a
+lazy merge/intersection and a query stops after `limit` documents instead
+of materializing every match.
+
+Updates are incremental: each document stores a hash of its indexed fields
+and its tokens, so only new or changed bills are tokenized and only their
+postings are touched. The index is stored as a "bills_search" artifact.
+
+    python -m scraper.search "भन्सार महसुल"     # query the latest index
+    python -m scraper.search --field ministry finance
+"""
+
+import argparse
+import bisect
+import hashlib
+import heapq
+import logging
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from scraper import codec
+from scraper.artifacts import ArtifactStore
+from scraper.history import RECORD_KEYS
+from scraper.logs import configure_logging
+
+
+log = logging.getLogger(__name__)
+
+
+# Bump when normalization or tokenization changes; older indexes are rebuilt
+NORMALIZER_VERSION = 1
+
+# Field groups: code and the record fields indexed under it
+FIELD_GROUPS = {
+    "title": ("t", ("titleNp", "titleEn")),
+    "presenter": ("p", ("presenter", "presenter_en")),
+    "ministry": ("m", ("ministry", "ministry_en")),
+}
+# Query tiers, best matches first
+TIERS = ("terms", "prefixes", "trigrams")
+PREFIX_MIN = 2
+PREFIX_MAX = 10
+# Terms of a prefix/substring match probed one by one; more are merged into a set
+UNION_PROBE_MAX = 8
+# Rebuild ids once this share of them belongs to removed documents
+COMPACT_RATIO = 0.25
+
+bill_key = RECORD_KEYS["bills_cleaned"]
+
+
+# =====================================================================
+# NORMALIZATION
+# =====================================================================
+
+_TRANSLATION = str.maketrans({
+    **dict.fromkeys("\u200b\u200c\u200d\u2060\ufeff\u00ad"),  # zero-width, soft hyphen
+    **{chr(0x0966 + digit): str(digit) for digit in range(10)},  # ० - ९ -> 0 - 9
+    "\u0901": "\u0902",  # chandrabindu -> anusvara
+    "\u093c": None,  # nukta (NFC keeps क़ as क + nukta)
+    "\u0964": " ",  # danda
+    "\u0965": " ",  # double danda
+})
+
+# Letters and digits plus the Devanagari signs (matras, virama, anusvara)
+_TOKEN = re.compile(r"(?:[^\W_]|[\u0900-\u0963\u0971-\u097f])+")
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFC", text).translate(_TRANSLATION).casefold()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN.findall(normalize(text)) if text else []
+
+
+def trigrams(token: str, pad: bool = True) -> Set[str]:
+    """Trigrams of " token " (indexing) or of the bare token (queries: substrings)."""
+    padded = f" {token} " if pad else token
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def prefixes(token: str) -> List[str]:
+    return [token[:length] for length in range(PREFIX_MIN, min(len(token), PREFIX_MAX) + 1)]
+
+
+def fields_hash(record: Dict[str, Any]) -> str:
+    values = [record.get(field) or "" for _, fields in FIELD_GROUPS.values() for field in fields]
+    return hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+# =====================================================================
+# QUERY EVALUATION (lazy, over sorted posting lists)
+# =====================================================================
+
+class _Postings:
+    def __init__(self, docs: List[int]) -> None:
+        self.docs = docs
+        self.size = len(docs)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.docs)
+
+    def __contains__(self, doc: int) -> bool:
+        index = bisect.bisect_left(self.docs, doc)
+        return index < self.size and self.docs[index] == doc
+
+
+class _Union:
+    """Documents of several terms (a prefix or substring expands to many)."""
+
+    def __init__(self, parts: List[_Postings]) -> None:
+        self.parts = parts
+        self.size = sum(part.size for part in parts)
+        self._members: Optional[Set[int]] = None
+
+    def __iter__(self) -> Iterator[int]:
+        if len(self.parts) == 1:
+            yield from self.parts[0]
+            return
+        last = None
+        for doc in heapq.merge(*self.parts):
+            if doc != last:
+                yield doc
+                last = doc
+
+    def __contains__(self, doc: int) -> bool:
+        if self._members is not None:
+            return doc in self._members
+        if len(self.parts) <= UNION_PROBE_MAX:
+            return any(doc in part for part in self.parts)
+        return doc in self.members()
+
+    def members(self) -> Set[int]:
+        if self._members is None:
+            self._members = set().union(*(part.docs for part in self.parts))
+        return self._members
+
+
+def _union(parts: List[_Postings]) -> Any:
+    return parts[0] if len(parts) == 1 else _Union(parts)
+
+
+def _intersect(parts: List[Any]) -> Iterator[int]:
+    """
+    Documents in every part, ascending: walks the smallest part and probes
+    the others; plain posting lists are bisected from the previous hit on.
+    """
+    parts = sorted(parts, key=lambda part: part.size)
+    smallest = parts[0]
+    lists = [part.docs for part in parts[1:] if isinstance(part, _Postings)]
+    unions = [part for part in parts[1:] if not isinstance(part, _Postings)]
+    starts = [0] * len(lists)
+    for doc in smallest:
+        for number, docs in enumerate(lists):
+            index = starts[number] = bisect.bisect_left(docs, doc, starts[number])
+            if index == len(docs) or docs[index] != doc:
+                break
+        else:
+            for union in unions:
+                if doc not in union:
+                    break
+            else:
+                yield doc
+
+
+# =====================================================================
+# INDEX
+# =====================================================================
+
+class SearchIndex:
+    """
+    Per-term postings, the prefix and trigram tables over the terms, and per
+    document id its key, fields hash and tokens.
+    """
+
+    def __init__(self) -> None:
+        self.keys: List[Optional[str]] = []
+        self.hashes: List[Optional[str]] = []
+        self.tokens: List[Optional[Dict[str, List[str]]]] = []
+        self.ids: Dict[str, int] = {}
+        self.postings: Dict[str, List[int]] = {}
+        self.prefixes: Dict[str, List[str]] = {}
+        self.trigrams: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # -----------------------------------------------------------------
+    # Updates
+    # -----------------------------------------------------------------
+
+    def _term_grams(self, term: str) -> Iterator[Tuple[Dict[str, List[str]], str]]:
+        code, _, token = term.partition(":")
+        for prefix in prefixes(token):
+            yield self.prefixes, f"{code}:{prefix}"
+        for gram in trigrams(token):
+            yield self.trigrams, f"{code}:{gram}"
+
+    def _add_term(self, term: str) -> None:
+        for table, key in self._term_grams(term):
+            bisect.insort(table.setdefault(key, []), term)
+
+    def _remove_term(self, term: str) -> None:
+        for table, key in self._term_grams(term):
+            terms = table[key]
+            del terms[bisect.bisect_left(terms, term)]
+            if not terms:
+                del table[key]
+
+    def _add(self, doc: int, doc_tokens: Dict[str, List[str]]) -> None:
+        for code, tokens in doc_tokens.items():
+            for token in tokens:
+                term = f"{code}:{token}"
+                docs = self.postings.get(term)
+                if docs is None:
+                    self.postings[term] = [doc]
+                    self._add_term(term)
+                elif docs[-1] < doc:
+                    docs.append(doc)
+                else:
+                    bisect.insort(docs, doc)
+
+    def _remove(self, doc: int) -> None:
+        for code, tokens in (self.tokens[doc] or {}).items():
+            for token in tokens:
+                term = f"{code}:{token}"
+                docs = self.postings[term]
+                del docs[bisect.bisect_left(docs, doc)]
+                if not docs:
+                    del self.postings[term]
+                    self._remove_term(term)
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Make the index match `records`; only new or changed documents are tokenized."""
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        seen: Set[str] = set()
+        for record in records:
+            key = bill_key(record)
+            seen.add(key)
+            digest = fields_hash(record)
+            doc = self.ids.get(key)
+            if doc is not None and self.hashes[doc] == digest:
+                stats["unchanged"] += 1
+                continue
+            doc_tokens = {
+                code: sorted({token for field in fields for token in tokenize(record.get(field))})
+                for code, fields in FIELD_GROUPS.values()
+            }
+            if doc is None:
+                doc = len(self.keys)
+                self.keys.append(key)
+                self.hashes.append(None)
+                self.tokens.append(None)
+                self.ids[key] = doc
+                stats["added"] += 1
+            else:
+                self._remove(doc)
+                stats["updated"] += 1
+            self.hashes[doc] = digest
+            self.tokens[doc] = doc_tokens
+            self._add(doc, doc_tokens)
+
+        for key in [key for key in self.ids if key not in seen]:
+            doc = self.ids.pop(key)
+            self._remove(doc)
+            self.keys[doc] = self.hashes[doc] = self.tokens[doc] = None
+            stats["removed"] += 1
+
+        if self.keys and (len(self.keys) - len(self.ids)) / len(self.keys) > COMPACT_RATIO:
+            self.compact()
+        return stats
+
+    def compact(self) -> None:
+        """Renumber documents without the ids of removed ones (from the stored tokens)."""
+        live = [doc for doc in range(len(self.keys)) if self.keys[doc] is not None]
+        keys, hashes, tokens = self.keys, self.hashes, self.tokens
+        self.__init__()
+        for doc in live:
+            new = len(self.keys)
+            self.keys.append(keys[doc])
+            self.hashes.append(hashes[doc])
+            self.tokens.append(tokens[doc])
+            self.ids[keys[doc]] = new
+            self._add(new, tokens[doc])
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+
+    def _terms(self, tier: str, token: str, code: str) -> List[str]:
+        """Index terms matching a query token in one field group."""
+        if tier == "terms":
+            term = f"{code}:{token}"
+            return [term] if term in self.postings else []
+        if tier == "prefixes":
+            if len(token) < PREFIX_MIN:
+                return []
+            terms = self.prefixes.get(f"{code}:{token[:PREFIX_MAX]}", [])
+            if len(token) > PREFIX_MAX:
+                terms = [term for term in terms if term.startswith(token, len(code) + 1)]
+            return terms
+        if len(token) < 3:
+            return []
+        candidates: Optional[Set[str]] = None
+        for gram in sorted(trigrams(token, pad=False), key=lambda gram: len(self.trigrams.get(f"{code}:{gram}", ()))):
+            terms = self.trigrams.get(f"{code}:{gram}")
+            if not terms:
+                return []
+            candidates = set(terms) if candidates is None else candidates.intersection(terms)
+        return [term for term in candidates or () if token in term]
+
+    def search(self, query: str, fields: Optional[Sequence[str]] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Keys of the documents matching every token of `query` in `fields`
+        (default: all groups), with the tier that matched.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or limit <= 0:
+            return []
+        codes = [FIELD_GROUPS[field][0] for field in (fields or FIELD_GROUPS)]
+
+        results: List[Dict[str, Any]] = []
+        found: Set[int] = set()
+        for tier in TIERS:
+            matches = []
+            for token in tokens:
+                terms = [term for code in codes for term in self._terms(tier, token, code)]
+                if not terms:
+                    break
+                matches.append(_union([_Postings(self.postings[term]) for term in terms]))
+            else:
+                for doc in _intersect(matches):
+                    if doc in found:
+                        continue
+                    found.add(doc)
+                    results.append({"key": self.keys[doc], "match": tier})
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    # -----------------------------------------------------------------
+    # Serialization
+    # -----------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": 1,
+            "normalizer": NORMALIZER_VERSION,
+            "docs": [
+                [key, digest, tokens] if key is not None else None
+                for key, digest, tokens in zip(self.keys, self.hashes, self.tokens)
+            ],
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SearchIndex":
+        """
+        Index from `to_dict()` (the prefix and trigram tables are rebuilt from
+        the terms); empty when it was built by another normalizer.
+        """
+        index = cls()
+        if data.get("normalizer") != NORMALIZER_VERSION:
+            return index
+        for doc, entry in enumerate(data["docs"]):
+            key, digest, tokens = entry if entry else (None, None, None)
+            index.keys.append(key)
+            index.hashes.append(digest)
+            index.tokens.append(tokens)
+            if key is not None:
+                index.ids[key] = doc
+        index.postings = data["postings"]
+        for term in sorted(index.postings):
+            for table, key in index._term_grams(term):
+                table.setdefault(key, []).append(term)
+        return index
+
+
+# =====================================================================
+# ARTIFACT
+# =====================================================================
+
+def load_index(store: Optional[ArtifactStore] = None) -> SearchIndex:
+    """The latest stored index (empty if there is none)."""
+    path = (store or ArtifactStore()).latest_path("bills_search")
+    return SearchIndex.from_dict(codec.read(path)) if path else SearchIndex()
+
+
+def update_search_index(
+    records: Iterable[Dict[str, Any]],
+    run_id: Optional[str] = None,
+    store: Optional[ArtifactStore] = None,
+) -> Dict[str, Any]:
+    """Apply cleaned bill records to the latest index; a new artifact is written only on changes."""
+    store = store or ArtifactStore()
+    try:
+        index = load_index(store)
+        stats = index.update(records)
+        result: Dict[str, Any] = {"success": True, "documents": len(index), **stats}
+        if stats["added"] or stats["updated"] or stats["removed"]:
+            entry = store.put("bills_search", index.to_dict(), run_id)
+            result["output"] = str(store.root / entry["name"])
+        log.info(
+            "Search index: %d documents (%d added, %d updated, %d removed)",
+            len(index), stats["added"], stats["updated"], stats["removed"],
+        )
+        return result
+    except Exception as exc:
+        log.error("Updating the search index failed: %s", exc, exc_info=True)
+        return {"success": False, "error": str(exc)}
+
+
+# =====================================================================
+# CLI
+# =====================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query the bills search index")
+    parser.add_argument("query")
+    parser.add_argument("--field", action="append", choices=list(FIELD_GROUPS), help="Field group(s) to search")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    index = load_index()
+    for hit in index.search(args.query, args.field, args.limit):
+        print(f"{hit['key']:<12} {hit['match']}")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    main()
@@ -0,0 +1,317 @@
+"""
+Near-duplicate and amendment detection over bill titles.
+
+clean_and_normalize only drops exact (registration number, year)
+duplicates. This links bills whose titles say they are the same bill
+(listed by both houses, or re-registered) or that one amends the other:
+"भन्सार महसुल (पहिलो संशोधन) विधेयक, २०८२" amends "भन्सार महसुल विधेयक, २०७९".
+
+Each title (Nepali and English separately) is normalized like
+scraper.search, with status remarks such as "(मिति २०८०/०२/१५ मा फिर्ता)"
+removed, and reduced to its base: the tokens without years, amendment
+markers ("(पहिलो संशोधन)", "(First Amendment)", "samsodhan") and filler
+words ("विधेयक", "bill", "of", ...). Titles are compared on the token
+trigrams of their base.
+
+Candidate pairs come from locality-sensitive hashing: a MinHash signature
+of SIGNATURE_SIZE values per title, computed with one hash per shingle
+(one-permutation hashing with optimal densification), cut into LSH_BANDS bands.
+Titles sharing any band land in the same bucket, so the work is linear in
+the number of titles plus the pairs in each bucket, rather than one
+comparison per pair of bills. Candidates are then scored with the exact
+Jaccard similarity of their shingle sets: the best of the titles both
+bills have, scaled by the share of titles both have, so a bill without an
+English title scores at most 0.5 against one with both. Then:
+
+- duplicate      similarity >= DUPLICATE_THRESHOLD, the same amendment and
+                 a year in common, e.g. one bill listed by both houses; an
+                 unnumbered amendment ("... ऐनलाई संशोधन गर्न बनेको विधेयक")
+                 counts as the same as any numbered one
+- re_registered  similarity >= DUPLICATE_THRESHOLD and the same amendment,
+                 but of different years, and the earlier title is marked
+                 withdrawn or lapsed ("(मिति २०७९/०५/३१ मा फिर्ता)"); "from"
+                 is the later bill. Without that remark bills of different
+                 years are recurring ones ("विनियोजन विधेयक, २०८१" and
+                 "..., २०८२") and are not related
+- amends         similarity >= AMENDS_THRESHOLD and one title is an
+                 amendment (or a later one) of the other; "from" amends "to"
+
+Relations are stored as a "bills_relations" artifact when they change.
+
+    python -m scraper.similarity                 # relations of bills_cleaned.json
+    python -m scraper.similarity --relation amends
+"""
+
+import argparse
+import logging
+import os
+import random
+import re
+import struct
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from scraper import codec
+from scraper.artifacts import ArtifactStore
+from scraper.history import RECORD_KEYS
+from scraper.logs import configure_logging
+from scraper.search import normalize, tokenize, trigrams
+
+
+log = logging.getLogger(__name__)
+
+
+DUPLICATE_THRESHOLD = float(os.getenv("SCRAPER_DUPLICATE_THRESHOLD", "0.85"))
+AMENDS_THRESHOLD = float(os.getenv("SCRAPER_AMENDS_THRESHOLD", "0.8"))
+
+# 10 bands of 6 rows: titles with similarity 0.85 share a band with
+# probability 0.99 (0.95 at 0.8), at 0.5 with 0.15 and at 0.2 with 0.0006
+SIGNATURE_SIZE = 64
+LSH_BANDS = 10
+LSH_ROWS = 6
+# Buckets larger than this (very generic titles) are not expanded into pairs
+MAX_BUCKET = int(os.getenv("SCRAPER_LSH_MAX_BUCKET", "200"))
+
+TITLE_FIELDS = ("titleNp", "titleEn")
+
+# English titles are sometimes romanized Nepali ("pahilo samsodhan bidheyak")
+ORDINALS = {
+    "पहिलो": 1, "दोस्रो": 2, "तेस्रो": 3, "चौथो": 4, "पांचौं": 5, "छैटौं": 6, "सातौं": 7,
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5, "sixth": 6, "seventh": 7,
+    "pahilo": 1, "dosro": 2, "tesro": 3, "chautho": 4,
+}
+AMENDMENT_WORDS = {"संशोधन", "amendment", "amend", "amending", "samsodhan", "sansodhan", "sanshodhan"}
+FILLER_WORDS = {
+    "विधेयक", "ऐन", "ऐनलाई", "लाई", "तथा", "र", "गर्न", "बनेको", "सम्बन्धी", "सम्बन्धमा", "व्यवस्था", "गर्ने",
+    "bill", "act", "acts", "the", "of", "to", "and", "for", "on", "in", "a", "an", "relating", "related",
+    "bidheyak", "bidheyek", "bideyek", "bidhayak",
+}
+# Parenthesized remarks with a date or a status ("फिर्ता" withdrawn, "निष्क्रिय" lapsed)
+STATUS_REMARK = re.compile(r"\([^()]*(?:मिति|फिर्ता|निष्क्रिय|\d{4}[/ ]\d{1,2}[/ ]\d{1,2})[^()]*\)?")
+# Remarks of a bill that was withdrawn or lapsed
+ENDED_REMARK = re.compile(r"फिर्ता|निष्क्रिय")
+RELATIONS = ("duplicate", "re_registered", "amends")
+
+_BIN_BITS = SIGNATURE_SIZE.bit_length() - 1
+_VALUE_BITS = 32 - _BIN_BITS
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_SIGNATURE = struct.Struct(f"<{SIGNATURE_SIZE}I")
+_BAND_BYTES = LSH_ROWS * 4
+_YEAR = re.compile(r"^\d+$")
+# Fixed (seeded) probe order of bins for each empty bin of a signature
+_PROBES = [random.Random(index).sample(range(SIGNATURE_SIZE), SIGNATURE_SIZE) for index in range(SIGNATURE_SIZE)]
+
+bill_key = RECORD_KEYS["bills_cleaned"]
+
+
+# =====================================================================
+# TITLE FEATURES
+# =====================================================================
+
+class TitleFeatures:
+    """Base shingles, amendment rank, years and withdrawn/lapsed remark of one title."""
+
+    __slots__ = ("shingles", "rank", "years", "ended")
+
+    def __init__(self, title: str) -> None:
+        title = normalize(title)
+        self.ended = any(ENDED_REMARK.search(remark) for remark in STATUS_REMARK.findall(title))
+        tokens = tokenize(STATUS_REMARK.sub(" ", title))
+        self.shingles = shingles(tuple(
+            token for token in tokens
+            if token not in AMENDMENT_WORDS and token not in ORDINALS
+            and token not in FILLER_WORDS and not _YEAR.match(token)
+        ))
+        # 0: not an amendment, 1: unnumbered amendment, n + 1: n-th amendment
+        rank = 0
+        if any(token in AMENDMENT_WORDS for token in tokens):
+            rank = 1 + next((ORDINALS[token] for token in tokens if token in ORDINALS), 0)
+        self.rank = rank
+        self.years = frozenset(token for token in tokens if len(token) == 4 and _YEAR.match(token))
+
+
+@lru_cache(maxsize=65536)
+def shingles(tokens: Tuple[str, ...]) -> FrozenSet[int]:
+    """Hashed token trigrams; titles repeat across bills, so results are memoized."""
+    # crc32 is linear; mix it before the top bits pick the signature bin
+    mixed = [
+        (value ^ (value >> 16)) * 0x45D9F3B & 0xFFFFFFFF
+        for value in (zlib.crc32(gram.encode("utf-8")) for token in tokens for gram in trigrams(token))
+    ]
+    return frozenset(value ^ (value >> 16) for value in mixed)
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a or not b:
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def signature(hashes: FrozenSet[int]) -> List[int]:
+    """
+    One-permutation MinHash: the top bits of a shingle hash pick a bin, the
+    rest is its value, each bin keeps its minimum (`hashes` is not empty).
+    Titles have fewer shingles than bins, so each empty bin takes the value
+    of the first non-empty bin in its own fixed random probe order; two sets
+    then agree on a bin with probability close to their Jaccard similarity.
+    """
+    bins = [-1] * SIGNATURE_SIZE
+    for value in hashes:
+        index = value >> _VALUE_BITS
+        low = value & _VALUE_MASK
+        if bins[index] < 0 or low < bins[index]:
+            bins[index] = low
+    dense = bins[:]
+    for index, value in enumerate(bins):
+        if value < 0:
+            for source in _PROBES[index]:
+                if bins[source] >= 0:
+                    dense[index] = bins[source]
+                    break
+    return dense
+
+
+# =====================================================================
+# RELATIONS
+# =====================================================================
+
+def _years(titles: Dict[str, TitleFeatures]) -> FrozenSet[str]:
+    return frozenset().union(*(title.years for title in titles.values()))
+
+
+def _classify(a: Dict[str, TitleFeatures], b: Dict[str, TitleFeatures]) -> Optional[Tuple[str, float, int]]:
+    """(relation, score, direction) of a candidate pair; direction 1 means a -> b."""
+    common = [field for field in TITLE_FIELDS if field in a and field in b]
+    best = max((jaccard(a[field].shingles, b[field].shingles) for field in common), default=0.0)
+    score = best * len(common) / len(a.keys() | b.keys())
+    rank_a = max(title.rank for title in a.values())
+    rank_b = max(title.rank for title in b.values())
+    if rank_a == rank_b or min(rank_a, rank_b) == 1:
+        # An unnumbered amendment may be any numbered one; the same year tells which
+        if score < DUPLICATE_THRESHOLD:
+            return None
+        years_a, years_b = _years(a), _years(b)
+        if years_a & years_b:
+            return "duplicate", score, 1
+        if rank_a != rank_b or not years_a or not years_b:
+            return None
+        direction = 1 if max(years_a) > max(years_b) else -1
+        earlier = b if direction > 0 else a
+        if any(title.ended for title in earlier.values()):
+            return "re_registered", score, direction
+        return None
+    if score >= AMENDS_THRESHOLD:
+        return "amends", score, 1 if rank_a > rank_b else -1
+    return None
+
+
+def find_relations(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Candidate duplicate and amends relations between cleaned bills."""
+    keys: List[str] = []
+    features: List[Dict[str, TitleFeatures]] = []
+    # Band value bytes -> first title, per title field and band; titles that
+    # land in an occupied bucket go to `shared`, most buckets hold one title
+    tables: Dict[str, List[Dict[bytes, int]]] = {field: [{} for _ in range(LSH_BANDS)] for field in TITLE_FIELDS}
+    shared: Dict[Tuple[str, int, bytes], List[int]] = defaultdict(list)
+    for record in records:
+        titles = {field: TitleFeatures(record.get(field)) for field in TITLE_FIELDS if record.get(field)}
+        titles = {field: title for field, title in titles.items() if title.shingles}
+        if not titles:
+            continue
+        doc = len(keys)
+        keys.append(bill_key(record))
+        features.append(titles)
+        for field, title in titles.items():
+            packed = _SIGNATURE.pack(*signature(title.shingles))
+            for band, table in enumerate(tables[field]):
+                key = packed[band * _BAND_BYTES:(band + 1) * _BAND_BYTES]
+                if table.setdefault(key, doc) != doc:
+                    shared[(field, band, key)].append(doc)
+
+    candidates: Set[Tuple[int, int]] = set()
+    skipped_buckets = 0
+    for (field, band, key), others in shared.items():
+        docs = [tables[field][band][key]] + others
+        if len(docs) > MAX_BUCKET:
+            skipped_buckets += 1
+            continue
+        for position, first in enumerate(docs):
+            for second in docs[position + 1:]:
+                candidates.add((first, second))
+
+    relations: List[Dict[str, Any]] = []
+    for first, second in sorted(candidates):
+        found = _classify(features[first], features[second])
+        if found is None:
+            continue
+        relation, score, direction = found
+        source, target = (first, second) if direction > 0 else (second, first)
+        relations.append({"relation": relation, "from": keys[source], "to": keys[target], "score": round(score, 3)})
+
+    counts = dict.fromkeys(RELATIONS, 0)
+    for relation in relations:
+        counts[relation["relation"]] += 1
+    if skipped_buckets:
+        log.warning("Similarity: %d LSH buckets over %d titles were skipped", skipped_buckets, MAX_BUCKET)
+    log.info(
+        "Similarity: %d titles, %d candidate pairs, %d duplicates, %d re-registered, %d amends",
+        len(keys), len(candidates), counts["duplicate"], counts["re_registered"], counts["amends"],
+    )
+    return {
+        "titles": len(keys),
+        "candidates": len(candidates),
+        "skipped_buckets": skipped_buckets,
+        **counts,
+        "relations": relations,
+    }
+
+
+# =====================================================================
+# ARTIFACT
+# =====================================================================
+
+def update_relations(
+    records: Iterable[Dict[str, Any]],
+    run_id: Optional[str] = None,
+    store: Optional[ArtifactStore] = None,
+) -> Dict[str, Any]:
+    """Find relations between cleaned bills; a new artifact is written only when they changed."""
+    store = store or ArtifactStore()
+    try:
+        found = find_relations(records)
+        relations = found.pop("relations")
+        result: Dict[str, Any] = {"success": True, **found}
+        latest = store.latest_path("bills_relations")
+        if latest is None or codec.read(latest).get("relations") != relations:
+            entry = store.put("bills_relations", {"version": 1, "relations": relations}, run_id, pretty=True)
+            result["output"] = str(store.root / entry["name"])
+        return result
+    except Exception as exc:
+        log.error("Finding bill relations failed: %s", exc, exc_info=True)
+        return {"success": False, "error": str(exc)}
+
+
+# =====================================================================
+# CLI
+# =====================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Find duplicate and amending bills by title")
+    parser.add_argument("--relation", choices=list(RELATIONS), help="Only print this relation")
+    args = parser.parse_args()
+
+    path = ArtifactStore().latest_path("bills_cleaned")
+    if path is None:
+        log.error("No cleaned bills found")
+        return
+    for relation in find_relations(codec.read(path))["relations"]:
+        if args.relation in (None, relation["relation"]):
+            print(f"{relation['from']:<12} {relation['relation']:<13} {relation['to']:<12} {relation['score']:.3f}")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    main()
@@ -0,0 +1,284 @@
+"""
+Per-request HTTP telemetry for the scraper clients.
+
+`RequestTelemetry.fetch` wraps one GET and records, from httpcore's trace
+hooks: time waiting for a HostLimiter slot, connect (including name
+resolution, which httpcore does inside connect_tcp), TLS handshake, time to
+first byte and total latency, plus status, bytes received, redirects and
+connection retries. Requests are labelled with their URL template
+(ids and query values replaced) and language.
+
+Records are aggregated per host into fixed-bucket latency histograms and
+error rates (`summary()`, included in the scrape results and so in the run
+report). With SCRAPER_HTTP_TRACE=1 every request is also appended to an
+NDJSON trace file under data/output/traces.
+"""
+
+import logging
+import os
+import re
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from scraper import codec
+from scraper.tracing import span
+
+if TYPE_CHECKING:
+    import httpx
+
+
+log = logging.getLogger(__name__)
+
+
+HTTP_TRACE = os.getenv("SCRAPER_HTTP_TRACE", "0") == "1"
+TRACE_DIR = Path(__file__).resolve().parent.parent / "data" / "output" / "traces"
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +Inf)
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+LANGUAGES = frozenset({"np", "en"})
+# Path segments whose next segment is a record id
+COLLECTION_SEGMENTS = frozenset({"bills", "committees", "members", "acts"})
+ID_SEGMENT = re.compile(r"^(\d+|[A-Za-z0-9]{16,}|[0-9a-f-]{32,})$")
+
+
+def url_template(url: str) -> Tuple[str, str, Optional[str]]:
+    """(host, template, language) of a URL, e.g. /{lang}/bills/{id}?page={}."""
+    parts = urlsplit(url)
+    segments = [s for s in parts.path.split("/") if s]
+    language = None
+    template: List[str] = []
+    for index, segment in enumerate(segments):
+        if index == 0 and segment in LANGUAGES:
+            language = segment
+            template.append("{lang}")
+        elif (index and segments[index - 1] in COLLECTION_SEGMENTS) or ID_SEGMENT.match(segment):
+            template.append("{id}")
+        else:
+            template.append(segment)
+    path = "/" + "/".join(template)
+    query = sorted({key for key, _ in parse_qsl(parts.query)})
+    if query:
+        path += "?" + "&".join(f"{key}={{}}" for key in query)
+    return parts.hostname or "", path, language
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding quantile `q`."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return float(LATENCY_BUCKETS_MS[index]) if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total_ms, 1),
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p90_ms": self.quantile(0.9),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class HostStats:
+    """Aggregated telemetry of one upstream host."""
+
+    __slots__ = ("requests", "errors", "statuses", "bytes", "retries", "latency", "ttfb", "wait")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.statuses: Dict[str, int] = defaultdict(int)
+        self.bytes = 0
+        self.retries = 0
+        self.latency = LatencyHistogram()
+        self.ttfb = LatencyHistogram()
+        self.wait = LatencyHistogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+            "statuses": dict(self.statuses),
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "latency": self.latency.to_dict(),
+            "ttfb": self.ttfb.to_dict(),
+            "slot_wait": self.wait.to_dict(),
+        }
+
+
+class RequestTelemetry:
+    """Records the requests of one scraper client."""
+
+    def __init__(self, source: str, trace: bool = HTTP_TRACE) -> None:
+        self.source = source
+        self.hosts: Dict[str, HostStats] = defaultdict(HostStats)
+        self.templates: Dict[str, Dict[str, Any]] = {}
+        self.trace_path: Optional[Path] = None
+        self._trace_file: Optional[BinaryIO] = None
+        if trace:
+            TRACE_DIR.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            self.trace_path = TRACE_DIR / f"http_{source}_{timestamp}.ndjson"
+            self._trace_file = open(self.trace_path, "ab")
+
+    async def fetch(
+        self,
+        client: "httpx.AsyncClient",
+        url: str,
+        queued_at: Optional[float] = None,
+    ) -> "httpx.Response":
+        """GET `url` with `client`, recording the request; errors are re-raised."""
+        phases: Dict[str, float] = {}
+        retries = 0
+
+        async def on_trace(event: str, info: Dict[str, Any]) -> None:
+            nonlocal retries
+            name, _, stage = event.rpartition(".")
+            name = name.rpartition(".")[2]  # drop the "connection." / "http11." prefix
+            if name == "retry" and stage == "started":
+                retries += 1
+            phases[f"{name}.{stage}"] = time.perf_counter()
+
+        started = time.perf_counter()
+        status: Optional[int] = None
+        received = 0
+        redirects = 0
+        error: Optional[str] = None
+        with span("http.get", url=url) as current:
+            try:
+                response = await client.get(url, extensions={"trace": on_trace})
+                status = response.status_code
+                received = response.num_bytes_downloaded
+                redirects = len(response.history)
+                current.set(status=status, bytes=received)
+                return response
+            except Exception as exc:
+                error = type(exc).__name__
+                raise
+            finally:
+                self.record(url, started, time.perf_counter(), phases, status, received, redirects, retries, error, queued_at)
+
+    def record(
+        self,
+        url: str,
+        started: float,
+        finished: float,
+        phases: Dict[str, float],
+        status: Optional[int],
+        received: int,
+        redirects: int,
+        retries: int,
+        error: Optional[str],
+        queued_at: Optional[float] = None,
+    ) -> None:
+        host, template, language = url_template(url)
+
+        def span(name: str) -> Optional[float]:
+            begin, end = phases.get(f"{name}.started"), phases.get(f"{name}.complete")
+            return round((end - begin) * 1000, 2) if begin and end else None
+
+        total_ms = (finished - started) * 1000
+        headers_sent = phases.get("send_request_headers.started")
+        headers_received = phases.get("receive_response_headers.complete")
+        ttfb_ms = (headers_received - headers_sent) * 1000 if headers_sent and headers_received else None
+        wait_ms = (started - queued_at) * 1000 if queued_at else None
+        failed = error is not None or status is None or status >= 400
+
+        stats = self.hosts[host]
+        stats.requests += 1
+        stats.errors += failed
+        stats.statuses[str(status) if status else error or "error"] += 1
+        stats.bytes += received
+        stats.retries += retries
+        stats.latency.observe(total_ms)
+        if ttfb_ms is not None:
+            stats.ttfb.observe(ttfb_ms)
+        if wait_ms is not None:
+            stats.wait.observe(wait_ms)
+
+        per_template = self.templates.setdefault(template, {"requests": 0, "errors": 0, "total_ms": 0.0})
+        per_template["requests"] += 1
+        per_template["errors"] += failed
+        per_template["total_ms"] += total_ms
+
+        if self._trace_file is not None:
+            entry = {
+                "ts": time.time(),
+                "source": self.source,
+                "url": url,
+                "template": template,
+                "host": host,
+                "lang": language,
+                "status": status,
+                "error": error,
+                "wait_ms": round(wait_ms, 2) if wait_ms is not None else None,
+                "connect_ms": span("connect_tcp"),
+                "tls_ms": span("start_tls"),
+                "ttfb_ms": round(ttfb_ms, 2) if ttfb_ms is not None else None,
+                "total_ms": round(total_ms, 2),
+                "bytes": received,
+                "redirects": redirects,
+                "retries": retries,
+            }
+            try:
+                self._trace_file.write(codec.dumps(entry) + b"\n")
+            except OSError as exc:
+                log.warning("Writing HTTP trace failed, disabling it: %s", exc)
+                self.close()
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-host histograms and error rates plus per-template counts."""
+        return {
+            "requests": sum(stats.requests for stats in self.hosts.values()),
+            "errors": sum(stats.errors for stats in self.hosts.values()),
+            "bytes": sum(stats.bytes for stats in self.hosts.values()),
+            "hosts": {host: stats.to_dict() for host, stats in self.hosts.items()},
+            "templates": {
+                template: {
+                    "requests": entry["requests"],
+                    "errors": entry["errors"],
+                    "mean_ms": round(entry["total_ms"] / entry["requests"], 1),
+                }
+                for template, entry in self.templates.items()
+            },
+            "trace": str(self.trace_path) if self.trace_path else None,
+        }
+
+    def close(self) -> None:
+        if self._trace_file is not None:
+            self._trace_file.close()
+            self._trace_file = None
@@ -0,0 +1,255 @@
+"""
+Lightweight in-process tracing.
+
+A trace is opened with `start_trace()` (main.py does this per run when
+tracing is on) and spans are opened anywhere below it with
+`with span("bills.fetch", house=..., bill_id=...)`. The current span lives
+in a ContextVar, so spans in asyncio tasks, gather() children and
+to_thread() calls get the right parent without passing anything around.
+Outside a trace `span()` returns a shared no-op span, so instrumented code
+costs one ContextVar lookup when tracing is off.
+
+Finished traces are exported as:
+- chrome: Chrome trace event JSON, opened as a waterfall in Perfetto
+  (ui.perfetto.dev) or chrome://tracing; each asyncio task gets a lane
+- otlp:   OTLP/JSON (ExportTraceServiceRequest), for an OpenTelemetry
+  collector or any OTLP-compatible viewer
+
+chosen with SCRAPER_TRACE_FORMAT. Enable with --trace or SCRAPER_TRACE=1.
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+
+log = logging.getLogger(__name__)
+
+
+TRACE = os.getenv("SCRAPER_TRACE", "0") == "1"
+TRACE_FORMAT = os.getenv("SCRAPER_TRACE_FORMAT", "chrome").strip().lower()
+TRACE_MAX_SPANS = int(os.getenv("SCRAPER_TRACE_MAX_SPANS", "200000"))
+
+
+class Trace:
+    """Spans of one trace (one pipeline run)."""
+
+    def __init__(self, name: str, max_spans: int = TRACE_MAX_SPANS) -> None:
+        self.name = name
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List["Span"] = []
+        self.max_spans = max_spans
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def add(self, span: "Span") -> None:
+        with self._lock:
+            if len(self.spans) < self.max_spans:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def _lane() -> Tuple[str, int]:
+    """Identity of the asyncio task (or thread) a span runs in."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name(), id(task)
+    thread = threading.current_thread()
+    return thread.name, thread.ident or 0
+
+
+class Span:
+    """A timed operation; use as a context manager."""
+
+    __slots__ = ("trace", "name", "span_id", "parent_id", "attributes", "start_ns", "end_ns", "error", "lane", "_token")
+
+    def __init__(self, trace: Trace, name: str, attributes: Dict[str, Any]) -> None:
+        self.trace = trace
+        self.name = name
+        self.attributes = attributes
+        self.span_id = secrets.token_hex(8)
+        self.parent_id: Optional[str] = None
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+        self.lane: Tuple[str, int] = ("", 0)
+        self._token = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.lane = _lane()
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.end_ns = time.time_ns()
+        if exc_type is not None and not issubclass(exc_type, GeneratorExit):
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self.trace.add(self)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """Span under the current one, or a no-op outside a trace."""
+    trace = _current_trace.get()
+    if trace is None:
+        return NOOP_SPAN
+    return Span(trace, name, attributes)
+
+
+def start_trace(name: str, enabled: bool = TRACE) -> Optional[Trace]:
+    """Open a trace in the current context; returns None when disabled."""
+    if not enabled:
+        return None
+    trace = Trace(name)
+    _current_trace.set(trace)
+    _current_span.set(None)
+    return trace
+
+
+def end_trace(trace: Optional[Trace]) -> None:
+    if trace is not None and _current_trace.get() is trace:
+        _current_trace.set(None)
+
+
+# =====================================================================
+# EXPORT
+# =====================================================================
+
+def to_chrome(trace: Trace) -> Dict[str, Any]:
+    """
+    Chrome trace event format. Spans of one asyncio task nest properly, so
+    each task is a lane; lanes of finished tasks are reused so the number
+    of rows stays close to the peak concurrency.
+    """
+    if not trace.spans:
+        return {"traceEvents": []}
+    origin = min(s.start_ns for s in trace.spans)
+
+    # Interval of each task, then greedy lane assignment by start time
+    tasks: Dict[int, List[Any]] = {}
+    for s in trace.spans:
+        interval = tasks.setdefault(s.lane[1], [s.start_ns, s.end_ns, s.lane[0]])
+        interval[0] = min(interval[0], s.start_ns)
+        interval[1] = max(interval[1], s.end_ns)
+    lane_ends: List[int] = []
+    lane_of: Dict[int, int] = {}
+    lane_names: Dict[int, str] = {}
+    for task_id, (start, end, task_name) in sorted(tasks.items(), key=lambda item: item[1][0]):
+        lane = next((i for i, lane_end in enumerate(lane_ends) if lane_end <= start), len(lane_ends))
+        if lane == len(lane_ends):
+            lane_ends.append(end)
+            lane_names[lane] = task_name
+        else:
+            lane_ends[lane] = end
+        lane_of[task_id] = lane
+
+    events: List[Dict[str, Any]] = [
+        {"name": "thread_name", "ph": "M", "pid": 1, "tid": lane, "args": {"name": f"{lane:03d} {name}"}}
+        for lane, name in lane_names.items()
+    ]
+    for s in sorted(trace.spans, key=lambda s: s.start_ns):
+        args = dict(s.attributes)
+        args["span_id"] = s.span_id
+        if s.parent_id:
+            args["parent_id"] = s.parent_id
+        if s.error:
+            args["error"] = s.error
+        events.append({
+            "name": s.name,
+            "cat": s.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (s.start_ns - origin) / 1000,
+            "dur": (s.end_ns - s.start_ns) / 1000,
+            "pid": 1,
+            "tid": lane_of[s.lane[1]],
+            "args": args,
+        })
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {"trace": trace.name, "trace_id": trace.trace_id, "dropped_spans": trace.dropped},
+    }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(trace: Trace) -> Dict[str, Any]:
+    """OTLP/JSON ExportTraceServiceRequest."""
+    spans = []
+    for s in trace.spans:
+        entry: Dict[str, Any] = {
+            "traceId": trace.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in s.attributes.items()],
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+        }
+        if s.parent_id:
+            entry["parentSpanId"] = s.parent_id
+        spans.append(entry)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "nepal-legislative-scraper"}}]},
+            "scopeSpans": [{"scope": {"name": "scraper.tracing"}, "spans": spans}],
+        }]
+    }
+
+
+def export_trace(trace: Trace, fmt: str = TRACE_FORMAT) -> Dict[str, Any]:
+    """Trace in the configured export format."""
+    return to_otlp(trace) if fmt == "otlp" else to_chrome(trace)
+
+
+def slowest(trace: Trace, name: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """The longest spans named `name`, for the run report."""
+    matching = sorted((s for s in trace.spans if s.name == name), key=lambda s: s.start_ns - s.end_ns)
+    return [
+        {"seconds": round((s.end_ns - s.start_ns) / 1e9, 3), **s.attributes}
+        for s in matching[:limit]
+    ]
@@ -0,0 +1,103 @@
+"""
+Shared fixtures: every test runs against a temporary data directory, and
+the bills pipeline against a fake parliament site instead of the network.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+from scraper import artifacts, canonical, history
+from scraper.bills import scrape_bills
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Point every file the scraper reads or writes at a temporary directory."""
+    output = tmp_path / "output"
+    output.mkdir()
+    monkeypatch.setattr(artifacts, "OUTPUT_DIR", output)
+    monkeypatch.setattr(history, "HISTORY_DIR", tmp_path / "history")
+    monkeypatch.setattr(canonical, "NAMES_FILE", tmp_path / "canonical_names.json")
+    monkeypatch.setattr(scrape_bills, "DATA_DIR", tmp_path / "bills")
+    monkeypatch.setattr(scrape_bills, "PREVIOUS_BILLS_FILE", output / "bills_cleaned.json")
+    monkeypatch.setattr(scrape_bills, "DEFERRED_BILLS_FILE", tmp_path / "deferred_bills.json")
+    (tmp_path / "bills").mkdir()
+    return tmp_path
+
+
+# =====================================================================
+# FAKE PARLIAMENT SITE
+# =====================================================================
+
+LIST_PAGE = """<table class="table-bordered"><tbody>{rows}</tbody></table>"""
+LIST_ROW = """<tr><td><a href="/np/bills/{bill_id}">{bill_id}</a></td></tr>"""
+DETAIL_PAGE = """
+<h1>{title}</h1>
+<table class="table-info">
+  <tr><td>दर्ता नं.</td><td>{registration_number}</td></tr>
+  <tr><td>वर्ष</td><td>2081</td></tr>
+</table>
+"""
+
+
+class FakeSite:
+    """
+    List pages and detail pages of one house (HoR); a page of None and the
+    detail pages of `missing` bills fail. `fetched` records the bill ids
+    whose Nepali detail page was requested, in order.
+    """
+
+    def __init__(self, pages: List[Optional[List[str]]], missing: Optional[List[str]] = None) -> None:
+        self.pages = pages
+        self.missing = set(missing or [])
+        self.fetched: List[str] = []
+
+    async def get(self, url: str) -> Optional[str]:
+        await asyncio.sleep(0)
+        if "/bills?" in url:
+            page = int(url.rsplit("page=", 1)[1])
+            ids = self.pages[page - 1] if page <= len(self.pages) else []
+            if ids is None:
+                return None
+            return LIST_PAGE.format(rows="".join(LIST_ROW.format(bill_id=bill_id) for bill_id in ids))
+        bill_id = url.rsplit("/", 1)[1]
+        if "/np/" in url:
+            self.fetched.append(bill_id)
+        if bill_id in self.missing:
+            return None
+        return DETAIL_PAGE.format(title=f"Bill {bill_id}", registration_number=bill_id)
+
+
+class FakeScraper:
+    """Stands in for BillsScraper: the real list and detail parsers over a FakeSite."""
+
+    def __init__(self, site: FakeSite) -> None:
+        self.client = site
+        self.list_scraper = scrape_bills.BillListScraper(site)
+        self.detail_scraper = scrape_bills.BillDetailScraper(site)
+
+
+@pytest.fixture
+def fast_sleep(monkeypatch):
+    """Skip the politeness delays between requests."""
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, result=None):
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr(scrape_bills.asyncio, "sleep", sleep)
+
+
+def previous_bill(bill_id: str, status: Optional[str] = None, status_date: Optional[str] = None) -> Dict:
+    """A bills_cleaned.json record of a previous run."""
+    return {
+        "bill_id": bill_id,
+        "type": "HoR",
+        "titleNp": f"Bill {bill_id}",
+        "registration_number": bill_id,
+        "year": "2081",
+        "current_status": status,
+        "current_status_date": status_date,
+    }
@@ -0,0 +1,105 @@
+import time
+
+import pytest
+
+from scraper import codec
+from scraper.artifacts import MANIFEST_NAME, ArtifactStore, sha256_file
+
+
+DAY = 86400
+
+
+@pytest.fixture
+def store():
+    return ArtifactStore()
+
+
+def retention(monkeypatch, kind, spec):
+    monkeypatch.setenv(f"SCRAPER_RETENTION_{kind.upper()}", spec)
+
+
+def put_all(store, kind, count):
+    return [store.put(kind, {"run": index, "padding": "x" * 60}, f"run-{index}") for index in range(count)]
+
+
+def names(store, kind):
+    return [entry["name"] for entry in store.entries(kind)]
+
+
+def test_keep_count_removes_the_oldest(store, monkeypatch):
+    retention(monkeypatch, "bills_raw", "keep=2,compress_after=10")
+    written = put_all(store, "bills_raw", 5)
+
+    result = store.apply_retention()
+
+    assert result["success"] and len(result["removed_files"]) == 3
+    assert names(store, "bills_raw") == [entry["name"] for entry in written[-2:]]
+    assert sorted(path.name for path in store.root.glob("bills_*")) == sorted(names(store, "bills_raw"))
+
+
+def test_expired_artifacts_are_removed_but_the_latest_is_kept(store, monkeypatch):
+    retention(monkeypatch, "bills_raw", "keep=10,days=1,compress_after=10")
+    written = put_all(store, "bills_raw", 3)
+
+    store.apply_retention(now=time.time() + 2 * DAY)
+
+    assert names(store, "bills_raw") == [written[-1]["name"]]
+
+
+def test_byte_limit_keeps_the_newest_that_fit(store, monkeypatch):
+    written = put_all(store, "bills_raw", 4)
+    size = written[0]["bytes"]
+    retention(monkeypatch, "bills_raw", f"keep=10,mb={(2.5 * size) / (1024 * 1024)},compress_after=10")
+
+    store.apply_retention()
+
+    assert names(store, "bills_raw") == [entry["name"] for entry in written[-2:]]
+
+
+def test_pinned_and_latest_artifacts_are_never_removed(store, monkeypatch):
+    retention(monkeypatch, "bills_cleaned", "keep=0,days=0,mb=0,compress_after=0")
+    retention(monkeypatch, "run_report", "keep=0,days=0,mb=0,compress_after=10")
+    for index in range(3):
+        store.put("bills_cleaned", [{"bill_id": str(index)}], f"run-{index}")
+    reports = put_all(store, "run_report", 2)
+
+    store.apply_retention(now=time.time() + 30 * DAY)
+
+    # Each bills_cleaned.json superseded the previous entry; the file is kept as is
+    assert names(store, "bills_cleaned") == ["bills_cleaned.json"]
+    assert codec.read(store.latest_path("bills_cleaned")) == [{"bill_id": "2"}]
+    assert names(store, "run_report") == [reports[-1]["name"]]
+
+
+def test_compressed_artifacts_stay_readable(store, monkeypatch):
+    retention(monkeypatch, "bills_raw", "keep=10,compress_after=0")
+    put_all(store, "bills_raw", 3)
+
+    result = store.apply_retention()
+
+    assert len(result["compressed_files"]) == 3
+    for index, entry in enumerate(store.entries("bills_raw")):
+        path = store.root / entry["name"]
+        assert entry["compression"] != "none" and path.exists()
+        assert entry["sha256"] == sha256_file(path) and entry["bytes"] == path.stat().st_size
+        assert codec.read(path)["run"] == index
+    assert codec.read(store.latest_path("bills_raw"))["run"] == 2
+    assert not list(store.root.glob("bills_*.json"))
+
+
+def test_manifest_is_consistent_after_compaction(store, monkeypatch):
+    retention(monkeypatch, "bills_raw", "keep=2,compress_after=1")
+    for _ in range(4):
+        put_all(store, "bills_raw", 3)
+        store.apply_retention()
+
+    manifest_lines = (store.root / MANIFEST_NAME).read_bytes().splitlines()
+    entries = store.entries()
+    # Compaction left one line per live entry, or the few appended since
+    assert len(manifest_lines) <= 4 * len(entries)
+    assert ArtifactStore(store.root).entries() == entries
+    assert sorted(entry["name"] for entry in entries) == sorted(
+        path.name for path in store.root.iterdir() if path.name.startswith("bills_")
+    )
+    for entry in entries:
+        assert entry["sha256"] == sha256_file(store.root / entry["name"])
@@ -0,0 +1,159 @@
+from collections import Counter
+
+import pytest
+
+from scraper import bill_stats
+from scraper.bill_stats import StatsRefresh
+from scraper.history import SnapshotHistory
+
+
+DATABASE_URL = "postgresql://localhost/test"
+
+
+class FakeDatabase:
+    """The bills, bill_status_history and bill_stats tables, for the queries of scraper.bill_stats."""
+
+    def __init__(self):
+        self.bills = {}
+        self.history = []
+        self.row = None
+
+    def import_bills(self, cleaned, month):
+        """What db:import-bills does: upsert every cleaned bill, record status changes, drop the rest."""
+        for bill_id in set(self.bills) - set(cleaned):
+            del self.bills[bill_id]
+            self.history = [entry for entry in self.history if entry[0] != bill_id]
+        for bill_id, (status, ministry) in cleaned.items():
+            previous = self.bills.get(bill_id)
+            self.bills[bill_id] = {
+                "parliament_id": bill_id,
+                "house": "pratinidhi_sabha",
+                "current_status": status,
+                "current_phase": None if status is None else 2,
+                "ministry": ministry,
+                "category": "governmental",
+                "session": "6",
+                "year": "2081",
+            }
+            if status and (previous is None or previous["current_status"] != status):
+                self.history.append((bill_id, month, status))
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=()):
+        if "INSERT INTO bill_stats" in sql:
+            _, *values, run_id = params
+            values = [getattr(value, "adapted", value) for value in values]
+            self.db.row = {**dict(zip(bill_stats.COLUMNS, values)), "run_id": run_id}
+            return
+        if "FROM bill_stats" in sql:
+            row = self.db.row
+            self.rows = [tuple(row[column] for column in (*bill_stats.COLUMNS, "run_id"))] if row else []
+            return
+        ids = set(self.db.bills if not params else params[0])
+        if "bill_status_history" in sql:
+            counts = Counter((month, status) for bill_id, month, status in self.db.history if bill_id in ids)
+            self.rows = [(month, status, count) for (month, status), count in counts.items()]
+        else:
+            bills = [bill for bill_id, bill in self.db.bills.items() if bill_id in ids]
+            counts = Counter(tuple(bill[column] for column in bill_stats.DIMENSIONS.values()) for bill in bills)
+            self.rows = [(*values, count) for values, count in counts.items()]
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeDatabase()
+    monkeypatch.setattr(bill_stats, "_connect", lambda database_url: db)
+    return db
+
+
+def pipeline_run(db, run_id, cleaned, month="2025-06"):
+    """One run over cleaned bills {bill_id: (status, ministry)}: history, stats, import, stats."""
+    records = [
+        {"type": "HoR", "bill_id": bill_id, "current_status": status, "ministry": ministry}
+        for bill_id, (status, ministry) in cleaned.items()
+    ]
+    SnapshotHistory().record_run("bills_cleaned", records, run_id=run_id)
+    refresh = StatsRefresh.start(DATABASE_URL, run_id)
+    db.import_bills(cleaned, month)
+    return refresh.finish(run_id)
+
+
+def rebuilt(db):
+    return bill_stats.to_row(bill_stats.aggregate(db.cursor()))
+
+
+def stored(db):
+    return {column: db.row[column] for column in bill_stats.COLUMNS}
+
+
+FIRST = {
+    "1": ("registered", None),
+    "2": ("first_reading", "Ministry of Finance"),
+    "3": ("committee_review", "Ministry of Finance"),
+    "4": (None, None),
+}
+
+
+def test_incremental_refresh_matches_a_full_rebuild(db):
+    first = pipeline_run(db, "run-1", FIRST)
+    assert (first["mode"], first["total"]) == ("full", 4)
+
+    # Bill 2 moves on, bill 3 is gone, bill 5 is new; bills 1 and 4 are not read
+    second = pipeline_run(db, "run-2", {
+        "1": ("registered", None),
+        "2": ("committee_review", "Ministry of Finance"),
+        "4": (None, None),
+        "5": ("registered", "Ministry of Health"),
+    }, month="2025-07")
+
+    assert (second["mode"], second["bills"], second["total"]) == ("incremental", 3, 4)
+    assert stored(db) == rebuilt(db)
+    assert db.row["by_status"] == {"committee_review": 1, "registered": 2, "unknown": 1}
+    assert db.row["throughput"]["2025-07"] == {"committee_review": 1, "registered": 1}
+    assert db.row["run_id"] == "run-2"
+
+
+def test_stats_not_written_by_the_previous_run_are_rebuilt(db):
+    pipeline_run(db, "run-1", FIRST)
+    # A run whose refresh did not happen (the import failed, say)
+    SnapshotHistory().record_run("bills_cleaned", [], run_id="run-2")
+
+    result = pipeline_run(db, "run-3", {"1": ("first_reading", None)})
+
+    assert result["mode"] == "full"
+    assert stored(db) == rebuilt(db)
+
+
+def test_unrecorded_run_is_a_full_rebuild(db):
+    db.import_bills(FIRST, "2025-06")
+
+    result = StatsRefresh.start(DATABASE_URL, "unknown-run").finish("unknown-run")
+
+    assert (result["mode"], result["total"]) == ("full", 4)
+    assert stored(db) == rebuilt(db)
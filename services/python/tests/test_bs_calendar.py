@@ -0,0 +1,41 @@
+import random
+
+import nepali_datetime
+import pytest
+
+from scraper.bs_calendar import BS_MONTH_DAYS, bs_to_ad, bs_to_ad_many, parse_bs_date
+
+
+@pytest.mark.parametrize("bs, ad", [
+    ("2000-01-01", "1943-04-14"),
+    ("2081-01-01", "2024-04-13"),
+    ("2082-01-01", "2025-04-14"),
+    ("2081-12-31", "2025-04-13"),
+    ("२०८२/०३/१५", "2025-06-29"),
+    (" 2082.3.15 ", "2025-06-29"),
+])
+def test_known_dates(bs, ad):
+    assert bs_to_ad(bs) == ad
+
+
+@pytest.mark.parametrize("value", [None, "", "2082", "2082-13-01", "2082-01-32", "1999-12-30", "2101-01-01", "n/a"])
+def test_invalid_or_out_of_range_dates(value):
+    assert bs_to_ad(value) is None
+
+
+def test_matches_nepali_datetime():
+    rng = random.Random(3)
+    for _ in range(500):
+        year = rng.choice([year for year in BS_MONTH_DAYS if year < 2100])
+        month = rng.randint(1, 12)
+        day = rng.randint(1, BS_MONTH_DAYS[year][month - 1])
+        expected = nepali_datetime.date(year, month, day).to_datetime_date().isoformat()
+        assert bs_to_ad(f"{year}-{month:02d}-{day:02d}") == expected
+
+
+def test_batch_keeps_order_and_duplicates():
+    assert bs_to_ad_many(["2082-01-01", None, "2082-01-01", "bad"]) == ["2025-04-14", None, "2025-04-14", None]
+
+
+def test_parse_devanagari_digits():
+    assert parse_bs_date("२०८१-०१-०१") == (2081, 1, 1)
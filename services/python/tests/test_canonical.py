@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from scraper import canonical
+from scraper.canonical import NameIndex, NameTable
+
+
+def test_variants_resolve_by_alias_phonetic_key_and_fuzzy_match():
+    table = NameTable("presenter")
+    entity_id, _, _ = table.canonicalize("मा. रामनाथ अधिकारी", "Hon. Ramnath Adhikari")
+
+    assert table.resolve("मा. रामनाथ  अधिकारी") == entity_id
+    assert table.resolve("रामनाथ अधिकारी") == entity_id
+    assert table.resolve("Hon. Ramnath AdhikarI") == entity_id
+    assert table.resolve("Rt. Hon. Ramnath Adhikary") == entity_id
+    assert table.resolve("Hon. Ramnath Adhkari") == entity_id
+    assert table.resolve("Hon. Sita Gurung") is None
+    assert table.stats["alias"] >= 1 and table.stats["phonetic"] >= 1 and table.stats["fuzzy"] == 1
+
+
+def test_one_resolved_value_pairs_the_other_with_its_entity():
+    table = NameTable("presenter")
+    entity_id, _, _ = table.canonicalize("मा. रामनाथ अधिकारी", None)
+
+    assert table.canonicalize("मा. रामनाथ अधिकारी", "Hon. Ramnath Adhikari") == (
+        entity_id, "मा. रामनाथ अधिकारी", "Hon. Ramnath Adhikari",
+    )
+    assert table.canonicalize(None, "Ramnath Adhikari") == (entity_id, None, "Hon. Ramnath Adhikari")
+
+
+def test_curly_apostrophe_does_not_make_an_english_name_nepali():
+    table = NameTable("presenter")
+
+    entity_id, name, name_en = table.canonicalize(None, "Hon’ble Minister Bidya Bhattarai")
+
+    assert (name, name_en) == (None, "Hon’ble Minister Bidya Bhattarai")
+    assert table.names(entity_id) == (None, "Hon’ble Minister Bidya Bhattarai")
+
+
+def test_nepali_text_in_the_english_field_is_kept_in_place():
+    table = NameTable("ministry")
+
+    _, name, name_en = table.canonicalize(None, "शिक्षा, विज्ञान तथा प्रविधि मन्त्रालय")
+    assert (name, name_en) == (None, "शिक्षा, विज्ञान तथा प्रविधि मन्त्रालय")
+
+    # Once the entity has an English name, the English field gets it
+    table.canonicalize("शिक्षा, विज्ञान तथा प्रविधि मन्त्रालय", "Ministry of Education, Science and Technology")
+    _, name, name_en = table.canonicalize(None, "शिक्षा, विज्ञान तथा प्रविधि मन्त्रालय")
+    assert (name, name_en) == (None, "Ministry of Education, Science and Technology")
+
+
+def test_english_text_in_the_nepali_field_is_not_an_english_name():
+    table = NameTable("presenter")
+    entity_id, name, _ = table.canonicalize("Hon. Bidya Bhattarai", None)
+
+    assert name == "Hon. Bidya Bhattarai"
+    assert table.names(entity_id) == (None, None)
+
+
+def test_ids_and_sources_persist_across_runs():
+    names = NameIndex()
+    bill = SimpleNamespace(presenter="मा. रामनाथ अधिकारी", presenter_en="Hon’ble Ramnath Adhikari", ministry=None, ministry_en=None)
+    names.canonicalize_bill(bill)
+    names.save()
+
+    again = SimpleNamespace(presenter=None, presenter_en="Ramnath Adhikari", ministry=None, ministry_en=None)
+    NameIndex(canonical.NAMES_FILE).canonicalize_bill(again)
+
+    assert again.presenter_id == bill.presenter_id == "P00001"
+    assert again.presenter_en == "Hon’ble Ramnath Adhikari"
+    assert again.ministry_id is None
@@ -0,0 +1,78 @@
+import gzip
+
+import pytest
+
+from scraper import codec
+from scraper.bills.scrape_bills import JsonArrayWriter
+from scraper.records import StatusEntry
+
+
+DATA = {"titleNp": "भन्सार महसुल विधेयक", "count": 3, "nested": [1, None, {"a": True}]}
+
+
+@pytest.mark.parametrize("name, compression", [
+    ("bills.json", "none"),
+    ("bills.json.gz", "gzip"),
+    ("bills.json.zst", "zstd"),
+    ("bills_20250101.JSON", None),
+    ("bills.gz", None),
+    ("report.txt", None),
+])
+def test_compression_from_suffix(name, compression):
+    assert codec.compression_of(name) == compression
+    assert codec.is_artifact(name) == (compression is not None)
+
+
+def test_unknown_compression_setting_writes_plain_json():
+    assert codec.artifact_suffix("brotli") == ".json"
+    assert codec.artifact_suffix("gzip") == ".json.gz"
+
+
+@pytest.mark.parametrize("suffix", [".json", ".json.gz"])
+def test_write_read_round_trip(tmp_path, suffix):
+    path = tmp_path / f"data{suffix}"
+    written = codec.write(path, DATA)
+    assert written == path.stat().st_size
+    assert codec.read(path) == DATA
+    assert not (tmp_path / f"data{suffix}.partial").exists()
+
+
+def test_gzip_suffix_is_really_gzip(tmp_path):
+    path = tmp_path / "data.json.gz"
+    codec.write(path, DATA)
+    assert codec.loads(gzip.decompress(path.read_bytes())) == DATA
+
+
+def test_zstd_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    path = tmp_path / "data.json.zst"
+    codec.write(path, DATA)
+    assert codec.read(path) == DATA
+
+
+def test_pretty_output_keeps_non_ascii():
+    text = codec.dumps(DATA, pretty=True).decode("utf-8")
+    assert "भन्सार" in text and "\n  " in text
+
+
+def test_glob_artifacts_matches_every_suffix(tmp_path):
+    for name in ("bills_1.json", "bills_2.json.gz", "bills_3.json.zst", "bills_4.txt", "other.json"):
+        (tmp_path / name).write_bytes(b"")
+    found = sorted(path.name for path in codec.glob_artifacts(tmp_path, "bills_*"))
+    assert found == ["bills_1.json", "bills_2.json.gz", "bills_3.json.zst"]
+
+
+@pytest.mark.parametrize("suffix, pretty", [(".json", True), (".json", False), (".json.gz", False)])
+def test_streamed_array_compresses_by_final_suffix(tmp_path, suffix, pretty):
+    path = tmp_path / f"stream{suffix}"
+    writer = JsonArrayWriter(str(path), pretty=pretty)
+    for index in range(3):
+        writer.write(StatusEntry(label=f"step {index}", date="2082-01-01"))
+    writer.close()
+    assert codec.read(path) == [{"label": f"step {index}", "date": "2082-01-01"} for index in range(3)]
+
+
+def test_empty_streamed_array(tmp_path):
+    writer = JsonArrayWriter(str(tmp_path / "empty.json"))
+    writer.close()
+    assert codec.read(tmp_path / "empty.json") == []
@@ -0,0 +1,77 @@
+import pytest
+
+from scraper import history
+from scraper.history import SnapshotHistory, content_hash
+
+
+def bill(bill_id, status="Registered"):
+    return {"type": "HoR", "bill_id": bill_id, "current_status": status}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "CHECKPOINT_EVERY", 2)
+    return SnapshotHistory(tmp_path / "history")
+
+
+RUNS = [
+    [bill("1"), bill("2")],
+    [bill("1", "First Reading"), bill("2"), bill("3")],
+    [bill("1", "First Reading"), bill("3")],
+    [bill("1", "Passed"), bill("3"), bill("4")],
+]
+
+
+def record_all(store):
+    return [store.record_run("bills_cleaned", records, run_id=f"run-{index}") for index, records in enumerate(RUNS)]
+
+
+def test_log_holds_only_changes(store):
+    results = record_all(store)
+    assert [(r["added"], r["changed"], r["removed"]) for r in results] == [(2, 0, 0), (1, 1, 0), (0, 0, 1), (1, 1, 0)]
+    # An unchanged run writes no objects
+    again = store.record_run("bills_cleaned", RUNS[-1], run_id="run-4")
+    assert (again["added"], again["changed"], again["removed"], again["new_objects"]) == (0, 0, 0, 0)
+
+
+def test_every_run_can_be_reconstructed(store):
+    record_all(store)
+    key = lambda record: record["bill_id"]
+    for index, records in enumerate(RUNS):
+        assert sorted(store.snapshot("bills_cleaned", seq=index + 1), key=key) == records
+        assert sorted(store.snapshot("bills_cleaned", run_id=f"run-{index}"), key=key) == records
+    assert sorted(store.snapshot("bills_cleaned"), key=key) == RUNS[-1]
+
+
+def test_reconstruction_starts_from_checkpoints(store):
+    record_all(store)
+    assert (store.root / "bills_cleaned" / "checkpoint_000002.json.gz").exists()
+    assert (store.root / "bills_cleaned" / "checkpoint_000004.json.gz").exists()
+    # The log before a checkpoint is not needed to reconstruct later runs
+    log_path = store.root / "bills_cleaned" / "log.jsonl"
+    lines = log_path.read_bytes().splitlines(keepends=True)
+    log_path.write_bytes(b"".join(lines[2:]))
+    assert store.versions_at("bills_cleaned", seq=3) == {
+        "HoR:1": content_hash(RUNS[2][0]),
+        "HoR:3": content_hash(RUNS[2][1]),
+    }
+
+
+def test_key_history_follows_one_record(store):
+    record_all(store)
+    versions = store.key_history("bills_cleaned", "HoR:2")
+    assert [(v["seq"], v["record"]) for v in versions] == [(1, bill("2")), (3, None)]
+    statuses = [v["record"]["current_status"] for v in store.key_history("bills_cleaned", "HoR:1")]
+    assert statuses == ["Registered", "First Reading", "Passed"]
+
+
+def test_runs_summary(store):
+    record_all(store)
+    assert [(r["run_id"], r["records"], r["changed"], r["removed"]) for r in store.runs("bills_cleaned")] == [
+        ("run-0", 2, 2, 0), ("run-1", 3, 2, 0), ("run-2", 2, 0, 1), ("run-3", 3, 2, 0),
+    ]
+
+
+def test_unknown_kind_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.runs("votes")
@@ -0,0 +1,34 @@
+from scraper import codec
+from scraper.artifacts import ArtifactStore
+from scraper.pipeline import slim_result, update_bill_indexes
+
+from conftest import previous_bill
+
+
+def test_bill_indexes_follow_the_bills_cleaned_in_this_run():
+    store = ArtifactStore()
+    bills = [previous_bill("1"), previous_bill("2")]
+    bills[1]["titleNp"] = "भन्सार महसुल (पहिलो संशोधन) विधेयक, २०८२"
+    bills[0]["titleNp"] = "भन्सार महसुल विधेयक, २०७९"
+    store.put("bills_cleaned", bills, "run-1", pretty=True)
+
+    results = update_bill_indexes(store, "run-1")
+
+    assert results["search_index"]["success"] and results["search_index"]["documents"] == 2
+    assert results["relations"]["success"] and results["relations"]["amends"] == 1
+    assert store.latest("bills_search")["run_id"] == "run-1"
+    assert codec.read(store.latest_path("bills_relations"))["relations"][0]["from"] == "HoR:2"
+
+
+def test_bill_indexes_skip_runs_that_cleaned_no_bills():
+    store = ArtifactStore()
+    store.put("bills_cleaned", [previous_bill("1")], "run-1", pretty=True)
+
+    assert update_bill_indexes(store, "run-2") == {"search_index": None, "relations": None}
+
+
+def test_report_keeps_counts_of_deferred_bills_not_their_ids():
+    result = {"success": True, "deferred_count": 3, "deferred": [["HoR", "a"], ["HoR", "b"], ["NA", "c"]]}
+
+    assert slim_result(result) == {"success": True, "deferred_count": 3}
+    assert slim_result(result, include_data=True) == result
@@ -0,0 +1,91 @@
+import pytest
+
+from scraper.records import CleanedBill, CleanedCommittee, RawBill, Record, StatusEntry, from_dicts, to_dicts
+
+
+def cleaned_bill_dict():
+    return {
+        "bill_id": "123",
+        "type": "HoR",
+        "titleNp": "भन्सार महसुल विधेयक, २०८२",
+        "titleEn": "Customs Duty Bill, 2082",
+        "registration_number": "12",
+        "year": "2082",
+        "sambat": "2082",
+        "presenter": "मा. रामनाथ अधिकारी",
+        "ministry": "अर्थ मन्त्रालय",
+        "presenter_en": "Hon. Ramnath Adhikari",
+        "ministry_en": "Ministry of Finance",
+        "presenter_id": "P00001",
+        "ministry_id": "M00001",
+        "session": "6",
+        "government_type": "सरकारी",
+        "bill_type": "मूल",
+        "category": None,
+        "government_type_en": "Governmental",
+        "bill_type_en": "Original",
+        "category_en": None,
+        "current_status": "First Reading",
+        "current_status_date": "2082-03-15",
+        "status_timeline": [
+            {"label": "Registered", "date": "2082-03-01", "date_ad": "2025-06-15"},
+            {"label": "First Reading", "date": "2082-03-15"},
+        ],
+        "resource_link": "https://hr.parliament.gov.np/uploads/123.pdf",
+        "year_ad": None,
+        "current_status_date_ad": "2025-06-29",
+    }
+
+
+def test_round_trip_keeps_keys_and_order():
+    data = cleaned_bill_dict()
+    bill = CleanedBill.from_dict(data)
+    assert bill.to_dict() == data
+    assert list(bill.to_dict()) == list(CleanedBill.__slots__)
+    assert isinstance(bill.status_timeline[0], StatusEntry)
+
+
+def test_omit_none_fields_are_left_out():
+    entry = StatusEntry.from_dict({"label": "Registered", "date": "2082-03-01"})
+    assert entry.to_dict() == {"label": "Registered", "date": "2082-03-01"}
+    entry.date_ad = "2025-06-15"
+    assert entry.to_dict()["date_ad"] == "2025-06-15"
+
+
+def test_defaults_and_unknown_keys():
+    bill = RawBill.from_dict({"bill_id": "1", "unknown": "ignored"})
+    assert bill.titleNp == "" and bill.status_timeline == []
+    assert "unknown" not in bill.to_dict()
+    # Mutable defaults are not shared between records
+    RawBill.from_dict({}).status_timeline.append(StatusEntry(label="x"))
+    assert RawBill.from_dict({}).status_timeline == []
+
+
+def test_categorical_values_are_interned():
+    first = CleanedBill.from_dict({"ministry": "".join(["अर्थ ", "मन्त्रालय"])})
+    second = CleanedBill(ministry="".join(["अर्थ", " मन्त्रालय"]))
+    assert first.ministry is second.ministry
+
+
+def test_copy_is_deep_for_nested_records_and_containers():
+    bill = CleanedBill.from_dict(cleaned_bill_dict())
+    copied = bill.copy()
+    assert copied == bill and copied is not bill
+    copied.status_timeline[0].label = "Changed"
+    assert bill.status_timeline[0].label == "Registered"
+
+    committee = CleanedCommittee.from_dict({"slug": "finance", "menuLinksNp": {"सदस्य": "/members"}})
+    committee.copy().menuLinksNp["x"] = "/x"
+    assert committee.menuLinksNp == {"सदस्य": "/members"}
+
+
+def test_list_helpers_skip_non_dicts():
+    bills = from_dicts(CleanedBill, [cleaned_bill_dict(), None, "x"])
+    assert to_dicts(bills) == [cleaned_bill_dict()]
+
+
+def test_codecs_are_generated_per_class():
+    assert "from_dict" not in Record.__dict__
+    assert CleanedBill.to_dict is not RawBill.to_dict
+    with pytest.raises(AttributeError):
+        CleanedBill().extra = 1
@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+from scraper import codec
+from scraper.bills import scrape_bills
+
+from conftest import FakeScraper, FakeSite, previous_bill
+
+
+def run_pipeline(site, tmp_path, deadline=None, workers=1):
+    pipeline = scrape_bills.BillsPipeline(
+        FakeScraper(site),
+        ["HoR"],
+        str(tmp_path / "bills_raw.json"),
+        cleaned_output_file=str(scrape_bills.PREVIOUS_BILLS_FILE),
+        deadline=deadline,
+        workers=workers,
+    )
+    asyncio.run(pipeline.run())
+    return pipeline
+
+
+def test_known_bills_are_fetched_in_priority_order_across_list_pages(tmp_path, fast_sleep):
+    codec.write(scrape_bills.PREVIOUS_BILLS_FILE, [
+        previous_bill("1", "Authenticated", "2081-01-01"),  # terminal
+        previous_bill("2", "Authenticated", "2081-01-01"),  # terminal
+        previous_bill("3", "First Reading", "2081-05-01"),  # recent change
+        previous_bill("4", "First Reading", "2081-05-01"),  # deferred
+    ])
+    codec.write(scrape_bills.DEFERRED_BILLS_FILE, [["HoR", "4"]])
+    site = FakeSite([["1", "2"], ["3", "4"]])
+
+    run_pipeline(site, tmp_path)
+
+    # Bills 3 and 4 are on the second list page but go before the terminal bills
+    assert site.fetched[:2] == ["4", "3"]
+    assert sorted(site.fetched[2:]) == ["1", "2"]
+
+
+def test_listed_bills_are_fetched_once(tmp_path, fast_sleep):
+    codec.write(scrape_bills.PREVIOUS_BILLS_FILE, [previous_bill("1"), previous_bill("2")])
+    site = FakeSite([["1", "2", "5"]])
+
+    pipeline = run_pipeline(site, tmp_path, workers=2)
+
+    assert sorted(site.fetched) == ["1", "2", "5"]
+    assert sorted(bill.bill_id for bill in pipeline.bills) == ["1", "2", "5"]
+
+
+def cleaned_ids():
+    return sorted(record["bill_id"] for record in codec.read(scrape_bills.PREVIOUS_BILLS_FILE))
+
+
+def test_budget_spent_before_listing_keeps_every_previous_bill(tmp_path, fast_sleep):
+    codec.write(scrape_bills.PREVIOUS_BILLS_FILE, [previous_bill(bill_id) for bill_id in "1234"])
+    site = FakeSite([["1", "2"], ["3", "4"]])
+
+    pipeline = run_pipeline(site, tmp_path, deadline=time.monotonic() - 1)
+
+    assert site.fetched == []
+    assert cleaned_ids() == ["1", "2", "3", "4"]
+    assert sorted(pipeline.deferred) == [("HoR", bill_id) for bill_id in "1234"]
+
+
+def test_unlisted_pages_and_failed_fetches_are_carried_forward(tmp_path, fast_sleep):
+    codec.write(scrape_bills.PREVIOUS_BILLS_FILE, [previous_bill(bill_id) for bill_id in "1234"])
+    # Page 2 cannot be fetched, and neither can the details of bills 2 and 4
+    site = FakeSite([["1", "2"], None], missing=["2", "4"])
+
+    pipeline = run_pipeline(site, tmp_path)
+
+    assert cleaned_ids() == ["1", "2", "3", "4"]
+    assert sorted(pipeline.deferred) == [("HoR", "2"), ("HoR", "4")]
+
+
+def test_bills_removed_upstream_are_dropped(tmp_path, fast_sleep):
+    codec.write(scrape_bills.PREVIOUS_BILLS_FILE, [previous_bill(bill_id) for bill_id in "123"])
+    # The list was read to the end without bill 3, whose page is gone
+    site = FakeSite([["1", "2"]], missing=["3"])
+
+    pipeline = run_pipeline(site, tmp_path)
+
+    assert cleaned_ids() == ["1", "2"]
+    assert pipeline.deferred == []
@@ -0,0 +1,103 @@
+from scraper import codec
+from scraper.artifacts import ArtifactStore
+from scraper.search import SearchIndex, load_index, normalize, tokenize, update_search_index
+
+
+def bill(bill_id, title_np, title_en=None, ministry=None):
+    return {"type": "HoR", "bill_id": bill_id, "titleNp": title_np, "titleEn": title_en, "ministry": ministry}
+
+
+BILLS = [
+    bill("1", "भन्सार महसुल विधेयक, २०८२", "Customs Duty Bill, 2082", "अर्थ मन्त्रालय"),
+    bill("2", "भन्सारसम्बन्धी व्यवस्था विधेयक", "Customs Administration Bill"),
+    bill("3", "राजस्व भन्सारका विषय विधेयक", "Revenue and Customshouse Bill"),
+    bill("4", "शिक्षा विधेयक, २०८०", "Education Bill, 2080"),
+]
+
+
+def search(index, query, **kwargs):
+    return [(hit["key"], hit["match"]) for hit in index.search(query, **kwargs)]
+
+
+def test_digits_and_zero_width_characters_are_normalized():
+    # ZWSP after a word, ZWJ inside one
+    assert normalize("विधेयक, २०८२") == "विधेयक, 2082"
+    assert tokenize("विधेयक\u200b, २०८२") == tokenize("विधेयक, 2082") == ["विधेयक", "2082"]
+    assert tokenize("नेपाल\u200dको Customs") == ["नेपालको", "customs"]
+
+
+def test_whole_words_come_before_prefixes_and_substrings():
+    index = SearchIndex()
+    index.update(BILLS)
+
+    assert search(index, "भन्सार") == [("HoR:1", "terms"), ("HoR:2", "prefixes"), ("HoR:3", "prefixes")]
+    assert search(index, "customs") == [("HoR:1", "terms"), ("HoR:2", "terms"), ("HoR:3", "prefixes")]
+    assert search(index, "stomsho") == [("HoR:3", "trigrams")]
+    assert search(index, "customs 2082") == [("HoR:1", "terms")]
+    assert search(index, "२०८२") == [("HoR:1", "terms")]
+
+
+def test_queries_can_be_limited_to_field_groups():
+    index = SearchIndex()
+    index.update(BILLS)
+
+    assert search(index, "अर्थ", fields=["ministry"]) == [("HoR:1", "terms")]
+    assert search(index, "अर्थ", fields=["title"]) == []
+
+
+def test_updates_touch_only_changed_and_removed_bills():
+    index = SearchIndex()
+    assert index.update(BILLS) == {"added": 4, "updated": 0, "removed": 0, "unchanged": 0}
+
+    changed = [dict(BILLS[0], titleEn="Customs Tariff Bill, 2082"), BILLS[1], BILLS[2]]
+    assert index.update(changed) == {"added": 0, "updated": 1, "removed": 1, "unchanged": 2}
+
+    assert search(index, "education") == []
+    assert search(index, "duty") == []
+    assert search(index, "tariff") == [("HoR:1", "terms")]
+    assert len(index) == 3
+
+
+def test_removed_documents_are_compacted_away():
+    index = SearchIndex()
+    index.update(BILLS)
+
+    index.update(BILLS[2:])
+
+    assert index.keys == ["HoR:3", "HoR:4"]
+    assert search(index, "भन्सार") == [("HoR:3", "prefixes")]
+    assert search(index, "शिक्षा") == [("HoR:4", "terms")]
+
+
+def test_round_trip_keeps_results_and_update_state():
+    index = SearchIndex()
+    index.update(BILLS)
+    index.update(BILLS[:3])
+
+    loaded = SearchIndex.from_dict(codec.loads(codec.dumps(index.to_dict())))
+
+    assert loaded.to_dict() == index.to_dict()
+    assert loaded.prefixes == index.prefixes and loaded.trigrams == index.trigrams
+    for query in ("भन्सार", "customs", "stomsho"):
+        assert search(loaded, query) == search(index, query)
+    assert loaded.update(BILLS[:3])["unchanged"] == 3
+
+
+def test_index_from_another_normalizer_is_rebuilt():
+    data = SearchIndex().to_dict()
+    data["normalizer"] = -1
+    data["docs"] = [["HoR:1", "stale", {"t": ["x"]}]]
+
+    assert len(SearchIndex.from_dict(data)) == 0
+
+
+def test_stored_index_is_written_only_when_it_changes():
+    store = ArtifactStore()
+
+    first = update_search_index(BILLS, "run-1", store)
+    second = update_search_index(BILLS, "run-2", store)
+
+    assert first["success"] and first["added"] == 4 and "output" in first
+    assert second["success"] and second["unchanged"] == 4 and "output" not in second
+    assert [entry["run_id"] for entry in store.entries("bills_search")] == ["run-1"]
+    assert search(load_index(store), "customs 2082") == [("HoR:1", "terms")]
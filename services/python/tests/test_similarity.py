@@ -0,0 +1,70 @@
+from scraper import similarity
+
+
+def bill(bill_id, title_np, title_en=None, house="HoR"):
+    return {"bill_id": bill_id, "type": house, "titleNp": title_np, "titleEn": title_en}
+
+
+def relations(*records):
+    return {
+        (relation["relation"], relation["from"], relation["to"])
+        for relation in similarity.find_relations(records)["relations"]
+    }
+
+
+def test_same_bill_in_both_houses_is_a_duplicate():
+    found = relations(
+        bill("1", "सहकारी ऐन, २०७४ लाई संशोधन गर्न बनेको विधेयक", "Bill to amend the Cooperatives Act, 2074"),
+        bill("2", "सहकारी ऐन, २०७४ लाई संशोधन गर्न बनेको विधेयक", "Bill to amend the Cooperatives Act, 2074", "NA"),
+    )
+
+    assert found == {("duplicate", "HoR:1", "NA:2")}
+
+
+def test_later_amendment_amends_the_earlier_one():
+    found = relations(
+        bill("1", "आर्थिक कार्यविधि तथा वित्तीय उत्तरदायित्व (पहिलो संशोधन) विधेयक, २०८०"),
+        bill("2", "आर्थिक कार्यविधि तथा वित्तीय उत्तरदायित्व (दोस्रो संशोधन) विधेयक, २०८१"),
+    )
+
+    assert found == {("amends", "HoR:2", "HoR:1")}
+
+
+def test_missing_english_title_is_not_a_duplicate():
+    title_np = "आर्थिक कार्यविधि तथा वित्तीय उत्तरदायित्व (पहिलो संशोधन) विधेयक, २०८१"
+    found = relations(
+        bill("1", title_np, "The Economic Procedure and Fiscal Responsibility (First Amendment) Bill, 2081"),
+        bill("2", title_np, ""),
+    )
+
+    assert found == set()
+
+
+def test_unnumbered_amendment_needs_a_shared_year():
+    unnumbered = "संवैधानिक परिषद् (काम, कर्तव्य, अधिकार र कार्यविधि) ऐन, २०६६ लाई संशोधन गर्न बनेको विधेयक"
+    numbered = "संवैधानिक परिषद् (काम, कर्तव्य, अधिकार र कार्यविधि) (पहिलो संशोधन) विधेयक, {year}"
+
+    assert relations(bill("1", unnumbered), bill("2", numbered.format(year="२०७९"))) == set()
+    assert relations(bill("1", unnumbered), bill("2", numbered.format(year="२०६६"))) == {
+        ("duplicate", "HoR:1", "HoR:2"),
+    }
+
+
+def test_annual_bills_of_different_years_are_not_related():
+    found = relations(
+        bill("1", "विनियोजन विधेयक, २०८१", "Appropriation Bill, 2081"),
+        bill("2", "विनियोजन विधेयक, २०८२", "Appropriation Bill, 2082"),
+        bill("3", "आर्थिक विधेयक, २०८१", "Finance Bill, 2081"),
+        bill("4", "आर्थिक विधेयक, २०८२", "Finance Bill, 2082"),
+    )
+
+    assert found == set()
+
+
+def test_withdrawn_bill_registered_again_is_re_registered():
+    found = relations(
+        bill("1", "विद्युत विधेयक, २०७७ (मिति २०७९/०५/३१ मा फिर्ता)", "Electricity bill, 2077", "NA"),
+        bill("2", "विद्युत विधेयक, २०८०", "Electricity Bill, 2080"),
+    )
+
+    assert found == {("re_registered", "HoR:2", "NA:1")}
@@ -0,0 +1,14 @@
+CREATE TABLE "bill_stats" (
+	"id" text PRIMARY KEY NOT NULL,
+	"total" integer DEFAULT 0 NOT NULL,
+	"by_house" jsonb DEFAULT '{}'::jsonb NOT NULL,
+	"by_status" jsonb DEFAULT '{}'::jsonb NOT NULL,
+	"by_phase" jsonb DEFAULT '{}'::jsonb NOT NULL,
+	"by_ministry" jsonb DEFAULT '{}'::jsonb NOT NULL,
+	"by_category" jsonb DEFAULT '{}'::jsonb NOT NULL,
+	"by_session" jsonb DEFAULT '{}'::jsonb NOT NULL,
+	"by_year" jsonb DEFAULT '{}'::jsonb NOT NULL,
+	"throughput" jsonb DEFAULT '{}'::jsonb NOT NULL,
+	"run_id" text,
+	"refreshed_at" timestamp DEFAULT now()
+);
\ No newline at end of file
@@ -250,6 +250,27 @@ export const scrapeLogs = pgTable("scrape_logs", {
   status: text("status"), // 'success' | 'partial' | 'failed'
 });
 
+// ============================================================
+// BILL STATS — one precomputed row, refreshed by the scraper after each import
+// ============================================================
+
+export const billStats = pgTable("bill_stats", {
+  id: text("id").primaryKey(), // "bills"
+  total: integer("total").default(0).notNull(),
+  // value -> count; NULL values are counted under "unknown"
+  byHouse: jsonb("by_house").$type<Record<string, number>>().default({}).notNull(),
+  byStatus: jsonb("by_status").$type<Record<string, number>>().default({}).notNull(),
+  byPhase: jsonb("by_phase").$type<Record<string, number>>().default({}).notNull(),
+  byMinistry: jsonb("by_ministry").$type<Record<string, number>>().default({}).notNull(),
+  byCategory: jsonb("by_category").$type<Record<string, number>>().default({}).notNull(),
+  bySession: jsonb("by_session").$type<Record<string, number>>().default({}).notNull(),
+  byYear: jsonb("by_year").$type<Record<string, number>>().default({}).notNull(),
+  // "YYYY-MM" -> status -> status changes that month
+  throughput: jsonb("throughput").$type<Record<string, Record<string, number>>>().default({}).notNull(),
+  runId: text("run_id"), // scraper run that last refreshed the row
+  refreshedAt: timestamp("refreshed_at").defaultNow(),
+});
+
 // ============================================================
 // RELATIONS
 // ============================================================
@@ -32,7 +32,10 @@ type CleanedBill = {
   resource_link?: string;
   current_status?: string;
   current_status_date?: string;
-  status_timeline?: { label: string; date: string }[];
+  status_timeline?: { label: string; date: string; date_ad?: string | null }[];
+  // AD dates converted from BS by the Python cleaner
+  year_ad?: string | null;
+  current_status_date_ad?: string | null;
 };
 
 type BillHouse = (typeof billHouseEnum.enumValues)[number];
@@ -188,6 +191,7 @@ async function main() {
         billType: mapBillType(b.bill_type ?? null),
         category: mapCategory(b.government_type ?? null),
         registeredDateBs: b.year ?? null,
+        registeredDateAd: b.year_ad ?? null,
         registeredBillUrl: b.resource_link ?? null,
         currentStatus,
         currentPhase,
@@ -212,6 +216,7 @@ async function main() {
             billType: sql`EXCLUDED.bill_type`,
             category: sql`EXCLUDED.category`,
             registeredDateBs: sql`EXCLUDED.registered_date_bs`,
+            registeredDateAd: sql`EXCLUDED.registered_date_ad`,
             registeredBillUrl: sql`EXCLUDED.registered_bill_url`,
             currentStatus: sql`EXCLUDED.current_status`,
             currentPhase: sql`EXCLUDED.current_phase`,
@@ -244,6 +249,7 @@ async function main() {
             rawStatus: entry.label,
             source: "parliament_scrape",
             statusDateBs: entry.date || null,
+            statusDateAd: entry.date_ad ?? null,
             notes: null,
             sourceUrl: null,
           });
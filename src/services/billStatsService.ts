@@ -1,8 +1,89 @@
 import { db } from "@/db/drizzle";
-import { bills } from "@/db/schema";
-import { sql } from "drizzle-orm";
+import { billStats, bills } from "@/db/schema";
+import { eq, sql } from "drizzle-orm";
+
+// Row of bill_stats kept up to date by the scraper pipeline (scraper.bill_stats)
+const STATS_ID = "bills";
+// NULL column values are counted under this key
+const UNKNOWN = "unknown";
+
+type Counts = Record<string, number>;
+
+const count = (counts: Counts, ...keys: string[]) =>
+  keys.reduce((sum, key) => sum + (counts[key] ?? 0), 0);
+
+const entries = (counts: Counts) =>
+  Object.entries(counts).map(([key, value]) => ({
+    key: key === UNKNOWN ? null : key,
+    count: value,
+  }));
+
+// Unknown (null) keys last, numeric keys by value, then other keys alphabetically
+const byKey =
+  (descending = false) =>
+  (a: { key: string | null }, b: { key: string | null }) => {
+    if (a.key === null || b.key === null) {
+      return Number(a.key === null) - Number(b.key === null);
+    }
+    const sign = descending ? -1 : 1;
+    const x = Number(a.key);
+    const y = Number(b.key);
+    if (Number.isNaN(x) || Number.isNaN(y)) {
+      return (
+        Number(Number.isNaN(x)) - Number(Number.isNaN(y)) ||
+        sign * a.key.localeCompare(b.key)
+      );
+    }
+    return sign * (x - y);
+  };
 
 export async function fetchBillStats() {
+  const [row] = await db
+    .select()
+    .from(billStats)
+    .where(eq(billStats.id, STATS_ID))
+    .limit(1);
+
+  if (!row) return fetchLiveBillStats();
+
+  return {
+    total: row.total,
+    gazettePublished: count(row.byStatus, "gazette_published"),
+    awaitingAuth: count(row.byStatus, "speaker_certification", "assented"),
+    inCommittee: count(row.byStatus, "committee_review", "clause_voting"),
+    byHouse: {
+      pratinidhiSabha: count(row.byHouse, "pratinidhi_sabha"),
+      rastriyaSabha: count(row.byHouse, "rastriya_sabha"),
+    },
+    byCategory: {
+      governmental: count(row.byCategory, "governmental"),
+      nonGovernmental: count(row.byCategory, "non_governmental"),
+    },
+    byStatus: entries(row.byStatus)
+      .sort((a, b) => b.count - a.count)
+      .map((r) => ({ status: r.key, count: r.count })),
+    byYear: entries(row.byYear)
+      .sort((a, b) => (b.key ?? "").localeCompare(a.key ?? ""))
+      .map((r) => ({ year: r.key, count: r.count })),
+    byPhase: entries(row.byPhase)
+      .sort(byKey())
+      .map((r) => ({ phase: r.key === null ? null : Number(r.key), count: r.count })),
+    byMinistry: entries(row.byMinistry)
+      .sort((a, b) => b.count - a.count)
+      .map((r) => ({ ministry: r.key, count: r.count })),
+    bySession: entries(row.bySession)
+      .sort(byKey(true))
+      .map((r) => ({ session: r.key, count: r.count })),
+    // status changes per month, oldest first
+    throughput: Object.entries(row.throughput)
+      .sort(([a], [b]) => a.localeCompare(b))
+      .map(([month, statuses]) => ({ month, statuses })),
+    refreshedAt: row.refreshedAt,
+  };
+}
+
+// Aggregates the bills table directly; used until the pipeline has written bill_stats
+async function fetchLiveBillStats() {
   const result = await db
     .select({
       total: sql<number>`count(*)::int`,
@@ -48,12 +129,17 @@ export async function fetchBillStats() {
       nonGovernmental: result[0]?.nonGovernmental ?? 0,
     },
     byStatus: byStatus.map((r) => ({
-      status: r.status,
+      status: r.status as string | null,
       count: r.count,
     })),
     byYear: byYear.map((r) => ({
-      year: r.year,
+      year: r.year as string | null,
       count: r.count,
     })),
+    byPhase: [] as { phase: number | null; count: number }[],
+    byMinistry: [] as { ministry: string | null; count: number }[],
+    bySession: [] as { session: string | null; count: number }[],
+    throughput: [] as { month: string; statuses: Counts }[],
+    refreshedAt: null,
   };
 }